@@ -0,0 +1,196 @@
+"""
+End-to-end throughput of the client's bulk operations against FakeExotel
+
+Measures wall time and requests/s of create_list, delete_contacts,
+send_bulk_sms (serial, chunked and queued) and paginated reads, then saves the results under
+benchmarks/results/ named after the current commit so runs can be
+compared across commits. Run from the repository root::
+
+    python -m benchmarks.bench_e2e --sizes 10000 100000 1000000 --latency 0.005
+    python -m benchmarks.bench_e2e --compare benchmarks/results/e2e-abc1234.json benchmarks/results/e2e-def5678.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+from exotelpy import Exotel, RetryPolicy, SmsQueue
+from exotelpy.helpers import get_list_id
+from tests.fake_exotel import FakeExotel
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def phone_numbers(count: int, start: int = 0):
+    return ["+9198{n:08d}".format(n=start + n) for n in range(count)]
+
+
+def measure(name: str, server: FakeExotel, items: int, func) -> dict:
+    requests_before = server.state.requests
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    sent = server.state.requests - requests_before
+    result = {
+        "name": name,
+        "items": items,
+        "seconds": elapsed,
+        "requests": sent,
+        "requests_per_second": sent / elapsed,
+        "items_per_second": items / elapsed,
+    }
+    print("{name:>36}: {seconds:8.2f}s {requests:>7} requests {rps:9.0f} req/s {ips:10.0f} items/s".format(
+        name=name, seconds=elapsed, requests=sent, rps=result["requests_per_second"],
+        ips=result["items_per_second"]))
+    return result
+
+
+def run_suite(client: Exotel, server: FakeExotel, args) -> list:
+    results = []
+
+    for size in args.sizes:
+        numbers = phone_numbers(size)
+        results.append(measure(
+            "create_list[{n}]".format(n=size), server, size,
+            lambda: client.create_list("bench-{n}".format(n=size), numbers=numbers,
+                                       max_workers=args.workers)))
+
+    numbers = phone_numbers(args.delete_count, start=10 ** 7)
+    sids = [item["data"]["sid"] for item in client.create_contacts(numbers)["response"]]
+    results.append(measure(
+        "delete_contacts[{n}]".format(n=len(sids)), server, len(sids),
+        lambda: client.delete_contacts(sids, max_workers=args.workers)))
+
+    recipients = phone_numbers(args.sms_recipients, start=2 * 10 ** 7)
+
+    def send_sms():
+        for _ in range(args.sms_calls):
+            client.send_bulk_sms("bench", recipients, "Hello from the benchmark")
+
+    results.append(measure(
+        "send_bulk_sms[{c}x{n}]".format(c=args.sms_calls, n=len(recipients)), server,
+        args.sms_calls * len(recipients), send_sms))
+
+    audience = phone_numbers(args.sms_calls * len(recipients), start=4 * 10 ** 7)
+    results.append(measure(
+        "send_bulk_sms_chunked[{n}, workers={w}]".format(n=len(audience), w=args.workers), server,
+        len(audience), lambda: client.send_bulk_sms_chunked(
+            "bench", audience, "Hello from the benchmark", chunk_size=len(recipients),
+            max_workers=args.workers)))
+
+    def queue_sms():
+        with SmsQueue(client, max_batch=len(recipients), max_workers=args.workers) as queue:
+            futures = [queue.send("bench", number, "Hello from the benchmark") for number in audience]
+        for future in futures:
+            future.result()
+
+    results.append(measure(
+        "sms_queue[{n}, workers={w}]".format(n=len(audience), w=args.workers), server,
+        len(audience), queue_sms))
+
+    if args.read_size:
+        list_id = get_list_id(client.create_list(
+            "bench-read", numbers=phone_numbers(args.read_size, start=3 * 10 ** 7),
+            max_workers=args.workers))
+        for workers in (1, args.workers):
+            results.append(measure(
+                "iter_list_contacts[{n}, workers={w}]".format(n=args.read_size, w=workers),
+                server, args.read_size,
+                lambda: sum(1 for _ in client.iter_list_contacts(
+                    list_id, limit=args.page_size, max_workers=workers))))
+    return results
+
+
+def save(results: list, args) -> str:
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    revision = git_revision()
+    path = os.path.join(RESULTS_DIR, "e2e-{rev}.json".format(rev=revision))
+    report = {
+        "revision": revision,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "settings": {
+            "latency": args.latency,
+            "error_rate": args.error_rate,
+            "throttle_rate": args.throttle_rate,
+            "workers": args.workers,
+        },
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+    return path
+
+
+def compare(baseline_path: str, candidate_path: str):
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    with open(candidate_path) as f:
+        candidate = json.load(f)
+
+    previous = {result["name"]: result for result in baseline["results"]}
+    print("{name:>36}  {a:>10}  {b:>10}  {x:>8}".format(
+        name="benchmark", a=baseline["revision"], b=candidate["revision"], x="speedup"))
+    for result in candidate["results"]:
+        old = previous.get(result["name"])
+        if old is None:
+            continue
+        print("{name:>36}  {a:>9.2f}s  {b:>9.2f}s  {x:>7.2f}x".format(
+            name=result["name"], a=old["seconds"], b=result["seconds"],
+            x=old["seconds"] / result["seconds"]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000],
+                        help="numbers uploaded by each create_list run")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--delete-count", type=int, default=2000)
+    parser.add_argument("--sms-calls", type=int, default=50)
+    parser.add_argument("--sms-recipients", type=int, default=100)
+    parser.add_argument("--read-size", type=int, default=10000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="seconds the fake server waits before answering")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CANDIDATE"),
+                        help="print the speedup between two saved result files and exit")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    retry_policy = None
+    if args.error_rate or args.throttle_rate:
+        retry_policy = RetryPolicy(max_attempts=10, backoff_base=0.01, backoff_cap=0.5,
+                                   idempotent_methods=("GET", "PUT", "DELETE", "POST"))
+
+    with FakeExotel(latency=args.latency, error_rate=args.error_rate,
+                    throttle_rate=args.throttle_rate, retry_after="0", seed=args.seed) as server:
+        with Exotel("bench", "key", "token", baseurl=server.url,
+                    pool_maxsize=args.workers, max_workers=args.workers,
+                    retry_policy=retry_policy) as client:
+            results = run_suite(client, server, args)
+
+    print("results saved to {path}".format(path=save(results, args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Micro-benchmarks of the client's pure-Python hot paths
+
+Times each case (best of --repeat runs) and measures its peak traced
+memory in a separate run, so tracemalloc doesn't skew the timings. Save a
+baseline, then check later runs against it; the check exits with status 1
+when a case got slower or hungrier than the threshold allows::
+
+    python -m benchmarks.bench_micro --save benchmarks/results/micro-baseline.json
+    python -m benchmarks.bench_micro --check benchmarks/results/micro-baseline.json --threshold 0.2
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from exotelpy import Exotel, Schedule
+from exotelpy.helpers import batch_contacts, merge_batch_response, validate_list_of_nums
+from exotelpy.validators import validate_url
+
+
+def phone_numbers(count: int):
+    return ["+9198{n:08d}".format(n=n) for n in range(count)]
+
+
+class OfflineExotel(Exotel):
+    """
+        Client whose request bodies are encoded, but never sent
+    """
+
+    def _call_api(self, method: str, endpoint: str, version: str = "v2", data: dict = None):
+        self._request_kwargs(method, endpoint, version, data)
+        return {}
+
+
+def batch_response(size: int) -> dict:
+    return {
+        "request_id": "bench",
+        "method": "POST",
+        "http_code": 207,
+        "metadata": {"failed": 0, "total": size, "success": size},
+        "response": [
+            {"code": 200, "status": "success",
+             "data": {"contact_sid": "sid{n}".format(n=n), "list_id": "list"}}
+            for n in range(size)
+        ],
+    }
+
+
+def build_cases(size: int) -> dict:
+    numbers = phone_numbers(size)
+    sids = ["{n:032x}".format(n=n) for n in range(size)]
+    responses = [batch_response(5000) for _ in range(max(size // 5000, 1))]
+    client = OfflineExotel("bench", "key", "token")
+    gzip_client = OfflineExotel("bench", "key", "token", compress_threshold=0)
+    schedule = Schedule(send_at=datetime(2030, 1, 1, 9, tzinfo=timezone.utc),
+                        end_at=datetime(2030, 1, 1, 18, tzinfo=timezone.utc))
+
+    def merge():
+        output = None
+        for response in responses:
+            output = merge_batch_response(output, response)
+
+    return {
+        "validate_list_of_nums[{n}]".format(n=size): lambda: validate_list_of_nums(numbers),
+        "validate_url[10000]": lambda: [validate_url("https://example.com/callback?n={n}".format(n=n))
+                                        for n in range(10000)],
+        "batch_contacts[{n}]".format(n=size): lambda: list(batch_contacts(numbers)),
+        "create_contacts_payload[{n}]".format(n=size): lambda: client.create_contacts(numbers),
+        "add_contacts_to_list_payload[{n}]".format(n=size): lambda: client.add_contacts_to_list(sids, "list"),
+        "create_contacts_payload_gzip[{n}]".format(n=size): lambda: gzip_client.create_contacts(numbers),
+        "schedule_to_json[10000]": lambda: [schedule.to_json() for _ in range(10000)],
+        "merge_batch_response[{n}]".format(n=len(responses) * 5000): merge,
+    }
+
+
+def time_case(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peak_memory(func) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(size: int, repeat: int) -> dict:
+    results = {}
+    for name, func in build_cases(size).items():
+        seconds = time_case(func, repeat)
+        peak = peak_memory(func)
+        results[name] = {"seconds": seconds, "peak_bytes": peak}
+        print("{name:>40}: {ms:10.2f} ms {mib:10.2f} MiB".format(
+            name=name, ms=seconds * 1000, mib=peak / 2 ** 20))
+    return results
+
+
+# Slowdowns smaller than this are timer noise rather than regressions
+MIN_DELTA = {"seconds": 0.001, "peak_bytes": 0}
+
+
+def check(results: dict, baseline_path: str, threshold: float) -> list:
+    with open(baseline_path) as f:
+        baseline = json.load(f)["results"]
+
+    regressions = []
+    for name, result in results.items():
+        old = baseline.get(name)
+        if old is None:
+            continue
+        for metric in ("seconds", "peak_bytes"):
+            limit = max(old[metric] * (1 + threshold), old[metric] + MIN_DELTA[metric])
+            if old[metric] and result[metric] > limit:
+                regressions.append("{name} {metric}: {old:.6g} -> {new:.6g}".format(
+                    name=name, metric=metric, old=old[metric], new=result[metric]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=100000, help="phone numbers per case")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", metavar="PATH", help="write the results to PATH")
+    parser.add_argument("--check", metavar="PATH", help="compare against the results in PATH")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="allowed relative slowdown or memory growth. Defaults to 0.2")
+    args = parser.parse_args()
+
+    results = run(args.size, args.repeat)
+
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, "w") as f:
+            json.dump({"python": sys.version.split()[0], "size": args.size,
+                       "results": results}, f, indent=2)
+
+    if args.check:
+        regressions = check(results, args.check, args.threshold)
+        for regression in regressions:
+            print("REGRESSION {r}".format(r=regression))
+        if regressions:
+            sys.exit(1)
+        print("no regressions beyond {t:.0%}".format(t=args.threshold))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Compares one-connection-per-request calls against the pooled session
+
+Run from the repository root::
+
+    python -m benchmarks.bench_session --requests 2000 --threads 8
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from exotelpy import Exotel
+from tests.fake_exotel import FakeExotel
+
+
+def unpooled(client: Exotel, contact_sid: str):
+    url = "{base}/v2/accounts/{sid}/contacts/{cid}".format(
+        base=client.baseurl, sid=client.sid, cid=contact_sid)
+    return requests.request("GET", url, auth=client.auth_headers).json()
+
+
+def pooled(client: Exotel, contact_sid: str):
+    return client.get_contact_details(contact_sid)
+
+
+def run(label: str, func, client: Exotel, contact_sid: str,
+        total: int, threads: int) -> float:
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        for _ in executor.map(lambda _: func(client, contact_sid), range(total)):
+            pass
+    elapsed = time.perf_counter() - start
+    print("{label:>10}: {total} requests in {elapsed:.2f}s ({rps:.0f} req/s)".format(
+        label=label, total=total, elapsed=elapsed, rps=total / elapsed))
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    with FakeExotel() as server:
+        with Exotel("bench", "key", "token", baseurl=server.url,
+                    pool_maxsize=args.threads) as client:
+            data = client.create_contacts(["+919876543210"])
+            contact_sid = data["response"][0]["data"]["sid"]
+
+            baseline = run("unpooled", unpooled, client, contact_sid,
+                           args.requests, args.threads)
+            session = run("pooled", pooled, client, contact_sid,
+                          args.requests, args.threads)
+            print("speedup: {x:.2f}x".format(x=baseline / session))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,13 @@
 __version__ = '0.1.0'
-from .exotel import Exotel, Retry, Schedule
+from .async_exotel import AsyncExotel
+from .backoff import RetryPolicy
+from .cache import ResponseCache
+from .contact_index import ContactIndex
 from .exceptions import *
+from .exotel import Exotel, Retry, Schedule
+from .journal import Journal
+from .metrics import Metrics
+from .ratelimit import RateLimiter, TokenBucket
+from .sms import SmsQueue
+from .tracing import JSONLinesExporter, Tracer
+from .uploads import AdaptiveBatchSizer
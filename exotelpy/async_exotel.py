@@ -0,0 +1,409 @@
+import asyncio
+import inspect
+import logging
+import time
+from collections import deque
+from typing import AsyncIterator, Callable, Iterable, List, Optional, Tuple
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from .contact_index import split_known
+from .exceptions import *
+from .exotel import Exotel
+from .helpers import (
+    collect_failures,
+    decode_json,
+    gather_bounded,
+    get_contact_sids,
+    merge_batch_response,
+    offset_batches,
+    validated_batches,
+)
+from .journal import Job
+from .pagination import aiter_records, aiter_records_parallel
+from .rollback import RollbackHandle, attach_rollback
+from .sms import BulkSmsResult, collect_sms_chunks
+from .tracing import NOOP_SPAN
+from .uploads import BatchCounter, BatchResult, CreatedResources
+
+logger = logging.getLogger("exotelpy")
+
+
+class AsyncExotel(Exotel):
+    """asyncio counterpart of :class:`Exotel`
+
+    Every public method of :class:`Exotel` is available and has to be
+    awaited. Arguments are validated eagerly, so invalid input raises at call
+    time, before anything is awaited. All requests are multiplexed over a
+    single `httpx <https://www.python-httpx.org/>`_ connection pool, install
+    it with ``pip install exotelpy[async]``.
+
+    Args:
+        sid (str): Exotel Account SID
+        key (str): API Key
+        token (str): API Token
+        baseurl (str, optional): Account Subdomain. Defaults to "https://api.exotel.com".
+        max_connections (int, optional): Maximum number of concurrent connections. Defaults to 100.
+        max_keepalive_connections (int, optional): Maximum number of idle connections kept open. Defaults to 20.
+        keep_alive_expiry (float, optional): Seconds an idle connection is kept open. Defaults to 5.0.
+        **kwargs: accepts the rest of the arguments of :class:`Exotel`, except pool_connections,
+            pool_maxsize and pool_block which size the requests pool and are replaced by the
+            arguments above. httpx always waits for a free connection once max_connections are open.
+
+    Raises:
+        TypeError: raised when pool_connections, pool_maxsize or pool_block is passed
+    """
+
+    def __init__(self, sid: str, key: str, token: str,
+                 baseurl: str = "https://api.exotel.com",
+                 max_connections: int = 100, max_keepalive_connections: int = 20,
+                 keep_alive_expiry: float = 5.0, **kwargs):
+        unsupported = sorted({"pool_connections", "pool_maxsize", "pool_block"} & kwargs.keys())
+        if unsupported:
+            raise TypeError(
+                "AsyncExotel doesn't accept {args}, use max_connections and max_keepalive_connections".format(
+                    args=", ".join(unsupported)))
+        self._limits = {
+            "max_connections": max_connections,
+            "max_keepalive_connections": max_keepalive_connections,
+            "keepalive_expiry": keep_alive_expiry,
+        }
+        super().__init__(sid, key, token, baseurl=baseurl, **kwargs)
+
+    def _build_session(self, pool_connections: int, pool_maxsize: int,
+                       pool_block: bool, keep_alive: bool):
+        if httpx is None:
+            raise ImportError(
+                "AsyncExotel requires httpx, install it with `pip install exotelpy[async]`")
+
+        headers = {} if keep_alive else {"Connection": "close"}
+        return httpx.AsyncClient(
+            auth=(self.auth_headers.username, self.auth_headers.password),
+            limits=httpx.Limits(**self._limits), headers=headers, timeout=self.timeout)
+
+    def __repr__(self) -> str:
+        return "Async" + super().__repr__()
+
+    async def close(self):
+        """Closes the pooled connections held by the client"""
+        await self._session.aclose()
+
+    def __enter__(self):
+        raise TypeError("Use `async with` with AsyncExotel")
+
+    async def __aenter__(self) -> "AsyncExotel":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _request_kwargs(self, method: str, endpoint: str,
+                        version: str = "v2", data: dict = None) -> dict:
+        kwargs = super()._request_kwargs(method, endpoint, version, data)
+        if isinstance(kwargs.get("data"), bytes):
+            # httpx takes raw bodies as content, data is reserved for forms
+            kwargs["content"] = kwargs.pop("data")
+        return kwargs
+
+    async def _call_api(self, method: str, endpoint: str,
+                        version: str = "v2", data: dict = None) -> dict:
+        cached = self._cached_response(method, endpoint, version, data)
+        if cached is not None:
+            return cached
+
+        kwargs = self._request_kwargs(method, endpoint, version, data)
+        attempt = 1
+        while True:
+            if self.rate_limiter is not None:
+                await asyncio.sleep(self.rate_limiter.reserve(version, endpoint))
+            started = time.perf_counter()
+            try:
+                response = await self._session.request(**kwargs)
+            except httpx.TransportError as e:
+                delay = self._retry_delay(
+                    attempt, method, sent=not isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout)))
+                if self.metrics is not None:
+                    self.metrics.record(method, endpoint, None, time.perf_counter() - started,
+                                        retried=delay is not None)
+                if delay is None:
+                    raise
+            else:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.feedback(version, endpoint, response.status_code)
+                if self.batch_sizer is not None:
+                    self.batch_sizer.feedback(endpoint, response.status_code)
+                delay = self._retry_delay(
+                    attempt, method, response.status_code, response.headers)
+                if self.metrics is not None:
+                    self.metrics.record(
+                        method, endpoint, response.status_code, time.perf_counter() - started,
+                        len(response.request.content), len(response.content),
+                        retried=delay is not None)
+                if delay is None:
+                    return self._handle_response(
+                        method, endpoint, version, data,
+                        response.status_code, decode_json(response), kwargs["url"])
+
+            logger.info("Retrying {method} {url} in {delay:.2f}s after attempt {attempt}".format(
+                method=method, url=kwargs["url"], delay=delay, attempt=attempt))
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _iter_records(self, fetch, offset: int, limit: int, prefetch: bool,
+                      max_workers: int = 1, model: type = None):
+        if max_workers > 1:
+            records = aiter_records_parallel(
+                fetch, offset=offset, limit=limit, max_workers=max_workers)
+        else:
+            records = aiter_records(fetch, offset=offset, limit=limit, prefetch=prefetch)
+        return records if model is None else self._wrap_records(records, model)
+
+    @staticmethod
+    async def _wrap_records(records, model: type):
+        async for record in records:
+            yield model(record)
+
+    async def _create_with_list(self, operation: str, numbers: List[str], list_name: str,
+                                create, rollback_on: tuple = (Exception,),
+                                job_id: str = None) -> dict:
+        job = self._open_job(job_id)
+        if job is not None and job.campaign is not None and not job.rolled_back:
+            return job.campaign
+
+        numbers = self._check_job_numbers(numbers, job)
+        with self._span(operation, list_name=list_name) as span:
+            created = CreatedResources()
+            try:
+                summary = await self._create_list(
+                    list_name, numbers=numbers, job_id=job_id, created=created, sink=lambda batch: None)
+                span.set_attribute("list_id", summary["list_id"])
+                with self._span("campaign_creation"):
+                    response = await create([summary["list_id"]])
+            except rollback_on as e:
+                logger.warning(
+                    "Exotel API raised {error}, {operation} failed, reverting list and contacts creation".format(
+                        error=type(e).__name__, operation=operation))
+                if job is not None:
+                    handle = await self.rollback_job(job_id)
+                elif created.list_id is not None:
+                    handle = await self._rollback(created.list_id, created.created_sids())
+                else:
+                    handle = None
+                attach_rollback(e, handle)
+                raise
+
+            if job is not None:
+                job.record_campaign(response)
+            return response
+
+    async def _rollback(self, list_id: str, contact_sids: List[str], on_done=None) -> RollbackHandle:
+        handle = RollbackHandle(list_id, contact_sids, self.rollback_timeout, on_done)
+
+        async def delete(item):
+            key, func = item
+            if not handle.attempt(key):
+                return
+            try:
+                await func(key)
+            except NotFound:
+                handle.succeeded(key)
+            except Exception as e:
+                handle.failed(key, e)
+            else:
+                handle.succeeded(key)
+
+        async def run():
+            items = [(list_id, self.delete_list)] + [(sid, self.delete_contact) for sid in contact_sids]
+            try:
+                with self._span("rollback", list_id=list_id, contacts=len(contact_sids)) as span:
+                    await gather_bounded(delete, items, self.max_workers)
+                    span.set_attribute("deleted", handle.deleted)
+                    span.set_attribute("skipped", len(handle.skipped))
+            finally:
+                handle.finish()
+            if not handle.complete:
+                logger.warning("Rollback of list {list_id} incomplete: {progress}".format(
+                    list_id=list_id, progress=handle.progress()))
+
+        if self.background_rollback:
+            handle.task = asyncio.ensure_future(run())
+        else:
+            await run()
+        return handle
+
+    async def rollback_job(self, job_id: str) -> Optional[RollbackHandle]:
+        """Awaitable version of :meth:`Exotel.rollback_job`"""
+        job = self._open_job(job_id)
+        if not job.started:
+            job.discard()
+            return None
+        job.record_rollback()
+        return await self._rollback(job.list_id, job.created_sids(),
+                                    on_done=lambda handle: handle.complete and job.discard())
+
+    async def delete_contact(self, sid: str) -> dict:
+        """Awaitable version of :meth:`Exotel.delete_contact`"""
+        data = await self._call_api("DELETE", "contacts/{cid}".format(cid=sid))
+        if self.contact_index is not None:
+            self.contact_index.discard(self.sid, [sid])
+        return data
+
+    async def send_bulk_sms_chunked(self, from_: str, to: Iterable[str], body: str,
+                                    chunk_size: int = 100, max_workers: int = None,
+                                    **kwargs) -> BulkSmsResult:
+        """Awaitable version of :meth:`Exotel.send_bulk_sms_chunked`"""
+        to, chunks = self._sms_chunks(to, chunk_size, kwargs)
+        results = await gather_bounded(
+            lambda chunk: self.send_bulk_sms(from_, chunk, body, **kwargs),
+            chunks, max_workers or self.max_workers)
+        return collect_sms_chunks(chunks, results)
+
+    async def delete_contacts(self, sids: List[str], max_workers: int = None,
+                              return_exceptions: bool = False) -> List[dict]:
+        """Awaitable version of :meth:`Exotel.delete_contacts`"""
+        sids = list(sids)
+        results = await gather_bounded(
+            self.delete_contact, sids, max_workers or self.max_workers)
+        return collect_failures(sids, results, "Contact deletion", return_exceptions)
+
+    async def create_list(self, name: str, tag: str = "demo",
+                          numbers: Iterable[str] = None, max_workers: int = 1,
+                          sink: Callable[[BatchResult], None] = None, job_id: str = None) -> dict:
+        """Awaitable version of :meth:`Exotel.create_list`, sink may be a coroutine function"""
+        return await self._create_list(name, tag, numbers, max_workers, sink, job_id)
+
+    async def _create_list(self, name: str, tag: str = "demo", numbers: Iterable[str] = None,
+                           max_workers: int = 1, sink: Callable[[BatchResult], None] = None,
+                           job_id: str = None, created: CreatedResources = None) -> dict:
+        job = self._open_job(job_id)
+        with self._span("create_list", list_name=name) as span:
+            numbers = self._prepare_numbers(numbers, job)
+            data = await self._start_list(name, tag, numbers, job)
+            list_id = data["response"][0]["data"]["sid"]
+            span.set_attribute("list_id", list_id)
+            if created is not None:
+                created.list_id = list_id
+
+            if numbers is None:
+                return data
+
+            responses = self._upload_batches(numbers, list_id, max_workers, job, created)
+            if job is not None and job.attached:
+                responses = self._prepend(job.attached_response(), responses)
+
+            if sink is not None:
+                counter = BatchCounter(list_id)
+                async for response in responses:
+                    result = sink(counter(response))
+                    if inspect.isawaitable(result):
+                        await result
+                return counter.summary()
+
+            output = None
+            async for response in responses:
+                output = merge_batch_response(output, response)
+            return output
+
+    @staticmethod
+    async def _prepend(first, rest):
+        yield first
+        async for item in rest:
+            yield item
+
+    async def iter_create_list(self, name: str, tag: str = "demo", numbers: Iterable[str] = (),
+                               max_workers: int = 1, job_id: str = None) -> AsyncIterator[BatchResult]:
+        """Asynchronous iterator version of :meth:`Exotel.iter_create_list`"""
+        job = self._open_job(job_id)
+        numbers = self._prepare_numbers(numbers, job)
+        list_id = (await self._start_list(name, tag, numbers, job))["response"][0]["data"]["sid"]
+        counter = BatchCounter(list_id)
+        if job is not None and job.attached:
+            yield counter(job.attached_response())
+        async for response in self._upload_batches(numbers, list_id, max_workers, job):
+            yield counter(response)
+
+    async def _start_list(self, name: str, tag: str, numbers: Optional[Iterable[str]], job: Job = None) -> dict:
+        if job is not None and job.started:
+            job.check(numbers)
+            return job.list_response()
+        data = await self._create_empty_list(name, tag)
+        if job is not None:
+            job.start(data["response"][0]["data"]["sid"], name, numbers)
+        return data
+
+    async def _create_empty_list(self, name: str, tag: str) -> dict:
+        payload = {
+            "lists": [
+                {
+                    "name": name,
+                    "tag": tag
+                }
+            ]
+        }
+        with self._span("list_creation"):
+            data = await self._call_api("POST", "lists", data=payload)
+
+        if data["response"][0]["code"] == 409:
+            description = data["response"][0]["error_data"]["description"]
+            raise UniqueViolationError(description)
+        return data
+
+    async def _upload_batch(self, numbers: List[str], list_id: str, index: int = None,
+                            job: Job = None, start: int = 0, created: CreatedResources = None) -> dict:
+        with self._span("batch", batch_index=index, batch_size=len(numbers)) as batch:
+            started = time.perf_counter()
+            try:
+                contact_sids = job.contacts.get(start) if job is not None else None
+                if contact_sids is None:
+                    with self._span("contact_creation") as span:
+                        contact_sids, known = await self._contact_sids(numbers, span)
+                    if job is not None:
+                        job.record_contacts(start, contact_sids, known)
+                    if created is not None:
+                        created.record_contacts(contact_sids, known)
+                with self._span("list_attachment"):
+                    response = await self.add_contacts_to_list(contact_sids, list_id)
+            except Exception:
+                self._observe_batch(numbers, started, batch, failed=True)
+                raise
+            self._observe_batch(numbers, started, batch)
+            if job is not None:
+                job.record_attached(start)
+            return response
+
+    async def _contact_sids(self, numbers: List[str], span=NOOP_SPAN) -> Tuple[List[str], List[str]]:
+        if self.contact_index is None:
+            return get_contact_sids(await self.create_contacts(numbers)), []
+
+        known, unknown = split_known(self.contact_index, self.sid, numbers)
+        reused = list(known.values())
+        span.set_attribute("reused", len(numbers) - len(unknown))
+        if unknown:
+            created = list(zip(unknown, get_contact_sids(await self.create_contacts(unknown))))
+            self.contact_index.update(self.sid, created)
+            known.update(created)
+        return [known[number] for number in numbers], reused
+
+    async def _upload_batches(self, numbers: Iterable[str], list_id: str, max_workers: int = 1,
+                              job: Job = None, created: CreatedResources = None):
+        limit = self.batch_sizer if self.batch_sizer is not None else 5000
+        if job is not None:
+            batches = job.remaining(numbers, limit)
+        else:
+            batches = offset_batches(validated_batches(numbers, limit))
+        pending = deque()
+        try:
+            for index, (start, nums) in enumerate(batches):
+                if len(pending) >= max(max_workers, 1):
+                    yield await pending.popleft()
+                pending.append(asyncio.ensure_future(
+                    self._upload_batch(nums, list_id, index, job, start, created)))
+            while pending:
+                yield await pending.popleft()
+        finally:
+            # like the executor of the sync client, let the batches in flight
+            # finish so the contacts they create are recorded for a rollback
+            await asyncio.gather(*pending, return_exceptions=True)
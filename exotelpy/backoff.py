@@ -0,0 +1,109 @@
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Mapping, Optional
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed API request is sent again
+
+    Delays grow exponentially from backoff_base up to backoff_cap, with full
+    jitter by default, and a ``Retry-After`` header sent by Exotel takes
+    precedence. Only idempotent methods are replayed after a 5xx response or
+    after the connection dropped mid-request. Any method is retried after a
+    429 or when the connection could not be established, since Exotel never
+    processed those requests.
+
+    POST requests, which create contacts, lists, campaigns and SMS, are
+    therefore not retried after a 5xx: Exotel may have processed them and a
+    replay could create everything twice. A transient 503 while uploading
+    contacts fails the upload (and rolls back what
+    :meth:`exotelpy.Exotel.create_message_campaign_with_list` or
+    :meth:`exotelpy.Exotel.create_campaign_with_list` created so far)
+    instead of re-sending the batch. Resume such an upload with a journaled
+    job, or add "POST" to idempotent_methods if duplicates are acceptable.
+
+    Args:
+        max_attempts (int, optional): Total number of attempts including the first one. Defaults to 3.
+        backoff_base (float, optional): Delay in seconds before the first retry. Defaults to 0.5.
+        backoff_cap (float, optional): Upper bound of the computed delay in seconds. Defaults to 30.
+        jitter (bool, optional): Pick a random delay between 0 and the computed one. Defaults to True.
+        respect_retry_after (bool, optional): Honor the Retry-After header. Defaults to True.
+        retry_statuses (Iterable[int], optional): Status codes worth retrying. Defaults to 429, 500, 502, 503 and 504.
+        idempotent_methods (Iterable[str], optional): Methods that are safe to replay. Defaults to GET, PUT, DELETE, HEAD and OPTIONS.
+    """
+
+    def __init__(self, max_attempts: int = 3, backoff_base: float = 0.5,
+                 backoff_cap: float = 30.0, jitter: bool = True,
+                 respect_retry_after: bool = True,
+                 retry_statuses: Iterable[int] = (429, 500, 502, 503, 504),
+                 idempotent_methods: Iterable[str] = (
+                     "GET", "PUT", "DELETE", "HEAD", "OPTIONS")):
+        if max_attempts < 1:
+            raise ValueError("max_attempts should be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+        self.retry_statuses = frozenset(retry_statuses)
+        self.idempotent_methods = frozenset(m.upper() for m in idempotent_methods)
+
+    def is_retryable(self, method: str, status_code: int = None, sent: bool = True) -> bool:
+        """
+            Whether a request may be replayed, status_code is None when no
+            response was received and sent tells if the request could have
+            reached Exotel
+        """
+        idempotent = method.upper() in self.idempotent_methods
+        if status_code is None:
+            return idempotent or not sent
+        if status_code not in self.retry_statuses:
+            return False
+        return status_code == 429 or idempotent
+
+    def backoff(self, attempt: int) -> float:
+        """
+            Delay before the retry following the given (1-based) attempt
+        """
+        delay = min(self.backoff_cap, self.backoff_base * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    @staticmethod
+    def parse_retry_after(value: str) -> Optional[float]:
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            moment = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=timezone.utc)
+        return max(0.0, (moment - datetime.now(timezone.utc)).total_seconds())
+
+    def delay(self, attempt: int, method: str, status_code: int = None,
+              headers: Mapping[str, str] = None, sent: bool = True) -> Optional[float]:
+        """
+            Seconds to wait before the next attempt, None when the request
+            shouldn't be retried
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if not self.is_retryable(method, status_code, sent):
+            return None
+        if self.respect_retry_after and headers is not None:
+            retry_after = self.parse_retry_after(headers.get("Retry-After"))
+            if retry_after is not None:
+                return retry_after
+        return self.backoff(attempt)
+
+    def __repr__(self) -> str:
+        return "RetryPolicy(max_attempts={attempts}, backoff_base={base}, backoff_cap={cap}, jitter={jitter})".format(
+            attempts=self.max_attempts, base=self.backoff_base, cap=self.backoff_cap, jitter=self.jitter)
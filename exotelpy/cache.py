@@ -0,0 +1,99 @@
+import threading
+import time
+from collections import OrderedDict
+from copy import deepcopy
+from typing import Callable, Dict, Optional
+
+from .helpers import endpoint_template
+
+DEFAULT_TTLS = {
+    "IncomingPhoneNumbers": 300.0,
+    "IncomingPhoneNumbers/{exophone_sid}": 300.0,
+    "lists/{list_id}": 60.0,
+    "campaigns/{campaign_id}": 30.0,
+}
+
+
+class ResponseCache:
+    """
+    Size-bounded LRU cache of GET responses with per-endpoint TTLs
+
+    Only GET requests whose endpoint template (see
+    :func:`exotelpy.helpers.endpoint_template`) has a TTL are cached. Any
+    other request made through the client evicts the cached responses of
+    the resource it touched, e.g. deleting a list evicts its details::
+
+        client = Exotel(sid, key, token, cache=ResponseCache(ttls={"lists/{list_id}": 120}))
+
+    Args:
+        ttls (Dict[str, float], optional): Seconds to keep responses per endpoint template. Defaults to
+            caching exophones for 5 minutes, list details for 1 minute and campaign details for 30 seconds.
+        maxsize (int, optional): Maximum number of cached responses. Defaults to 1024.
+    """
+
+    def __init__(self, ttls: Dict[str, float] = None, maxsize: int = 1024,
+                 clock: Callable[[], float] = time.monotonic):
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.maxsize = maxsize
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(version: str, endpoint: str, params: dict = None) -> tuple:
+        return (version, endpoint.strip("/"), tuple(sorted((params or {}).items())))
+
+    def get(self, version: str, endpoint: str, params: dict = None) -> Optional[dict]:
+        """
+            Returns a copy of the cached response, None on a miss
+        """
+        key = self._key(version, endpoint, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > self._clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return deepcopy(entry[1])
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+        return None
+
+    def set(self, version: str, endpoint: str, params: dict, response: dict):
+        ttl = self.ttls.get(endpoint_template(endpoint))
+        if not ttl:
+            return
+        key = self._key(version, endpoint, params)
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, deepcopy(response))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def cacheable(self, method: str, endpoint: str) -> bool:
+        return method == "GET" and bool(self.ttls.get(endpoint_template(endpoint)))
+
+    def invalidate(self, endpoint: str = None, version: str = None):
+        """
+            Evicts the responses of endpoint, of its parents and of the
+            resources nested under it, everything when endpoint is None
+        """
+        with self._lock:
+            if endpoint is None and version is None:
+                self._entries.clear()
+                return
+            path = endpoint.strip("/") if endpoint is not None else None
+            for key in list(self._entries):
+                if version is not None and key[0] != version:
+                    continue
+                if path is None or key[1] == path or \
+                        key[1].startswith(path + "/") or path.startswith(key[1] + "/"):
+                    del self._entries[key]
+
+    def clear(self):
+        self.invalidate()
+
+    def __len__(self) -> int:
+        return len(self._entries)
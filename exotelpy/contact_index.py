@@ -0,0 +1,104 @@
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Tuple
+
+# Stays below SQLITE_MAX_VARIABLE_NUMBER of older SQLite builds
+_QUERY_CHUNK = 900
+
+
+class ContactIndex:
+    """
+    On-disk map of phone number to contact sid, per Exotel account
+
+    Lets :meth:`exotelpy.Exotel.create_list` reuse the contacts that
+    already exist instead of creating every number again. The index is fed
+    from the contacts the client creates and forgets the contacts it
+    deletes; contacts deleted by other means have to be dropped with
+    :meth:`discard`::
+
+        index = ContactIndex("contacts.sqlite3")
+        client = Exotel(sid, key, token, contact_index=index)
+
+    Args:
+        path (str, optional): SQLite database file, created when missing. Defaults to ":memory:".
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS contacts ("
+                "account TEXT NOT NULL, number TEXT NOT NULL, sid TEXT NOT NULL, "
+                "PRIMARY KEY (account, number)) WITHOUT ROWID")
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS contacts_sid ON contacts (account, sid)")
+
+    def lookup(self, account: str, numbers: Iterable[str]) -> Dict[str, str]:
+        """
+            Returns the known contact sid of each of numbers, unknown numbers are left out
+        """
+        numbers = list(set(numbers))
+        found = {}
+        with self._lock:
+            for i in range(0, len(numbers), _QUERY_CHUNK):
+                chunk = numbers[i:i + _QUERY_CHUNK]
+                rows = self._db.execute(
+                    "SELECT number, sid FROM contacts WHERE account = ? AND number IN ({marks})".format(
+                        marks=",".join("?" * len(chunk))),
+                    [account] + chunk)
+                found.update(rows)
+        return found
+
+    def update(self, account: str, contacts: Iterable[Tuple[str, str]]):
+        """
+            Records (number, sid) pairs, replacing the sid of known numbers
+        """
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO contacts (account, number, sid) VALUES (?, ?, ?)",
+                ((account, number, sid) for number, sid in contacts))
+
+    def discard(self, account: str, sids: Iterable[str]):
+        """
+            Forgets the contacts with the given sids
+        """
+        sids = list(sids)
+        with self._lock, self._db:
+            for i in range(0, len(sids), _QUERY_CHUNK):
+                chunk = sids[i:i + _QUERY_CHUNK]
+                self._db.execute(
+                    "DELETE FROM contacts WHERE account = ? AND sid IN ({marks})".format(
+                        marks=",".join("?" * len(chunk))),
+                    [account] + chunk)
+
+    def clear(self, account: str = None):
+        with self._lock, self._db:
+            if account is None:
+                self._db.execute("DELETE FROM contacts")
+            else:
+                self._db.execute("DELETE FROM contacts WHERE account = ?", (account,))
+
+    def count(self, account: str) -> int:
+        with self._lock:
+            return self._db.execute(
+                "SELECT COUNT(*) FROM contacts WHERE account = ?", (account,)).fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def __repr__(self) -> str:
+        return "ContactIndex(path='{path}')".format(path=self.path)
+
+
+def split_known(index: ContactIndex, account: str, numbers: List[str]) -> Tuple[Dict[str, str], List[str]]:
+    """
+        Splits numbers into the sids already in index and the numbers still to be created
+
+        :meta private:
+    """
+    known = index.lookup(account, numbers)
+    return known, list(dict.fromkeys(number for number in numbers if number not in known))
@@ -9,6 +9,24 @@ class ValidationError(PyexotelBaseException):
     pass
 
 
+class InvalidPhoneNumbers(ValidationError):
+    """
+        Raised when phone numbers aren't valid as per E.164 format
+
+        Attributes:
+            positions (List[int]): Indexes of the invalid numbers
+            numbers (list): The invalid numbers
+    """
+
+    def __init__(self, positions: list, numbers: list):
+        super().__init__(
+            "Received {count} invalid numbers as per E.164 format, please check: {sample}".format(
+                count=len(positions),
+                sample=", ".join(repr(num) for num in numbers[:5]) + (", ..." if len(numbers) > 5 else "")))
+        self.positions = positions
+        self.numbers = numbers
+
+
 class AuthenticationFailed(PyexotelBaseException):
     """
         Raised when 401 status code is returned by Exotel API
@@ -44,5 +62,56 @@ class Throttled(PyexotelBaseException):
     pass
 
 
+class ServerError(PyexotelBaseException):
+    """
+        Raised when a 5xx status code is returned by Exotel API
+    """
+    pass
+
+
+class UnexpectedResponse(PyexotelBaseException):
+    """
+        Raised when Exotel API answers with a body that isn't JSON where one is expected
+
+        Attributes:
+            status_code (int): Status code of the response
+    """
+
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
+
+
 class UniqueViolationError(PyexotelBaseException):
     pass
+
+
+class BulkOperationFailed(PyexotelBaseException):
+    """
+        Raised when some items of a bulk operation failed
+
+        Attributes:
+            results (list): Per-item outcome in input order, the raised exception in place of failed items
+            errors (dict): Mapping of failed item to the exception it raised
+    """
+
+    def __init__(self, message: str, results: list, errors: dict):
+        super().__init__(message)
+        self.results = results
+        self.errors = errors
+
+
+class SmsRejected(PyexotelBaseException):
+    """
+        Raised when Exotel accepted a bulk SMS request but rejected one of its recipients
+
+        Attributes:
+            number (str): The rejected recipient
+            response: Item Exotel returned for the recipient, None when it returned none
+    """
+
+    def __init__(self, number: str, response=None):
+        super().__init__("Exotel rejected the SMS to {number}: {response}".format(
+            number=number, response=response))
+        self.number = number
+        self.response = response
@@ -1,20 +1,45 @@
 import logging
-from copy import deepcopy
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List
+from itertools import chain
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
 from urllib.parse import urljoin
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.exceptions import NewConnectionError
 
+from .backoff import RetryPolicy
+from .cache import ResponseCache
+from .contact_index import ContactIndex, split_known
 from .exceptions import *
 from .helpers import (
     batch_contacts,
+    collect_failures,
+    decode_json,
     get_contact_sids,
-    get_error_description,
-    get_list_id,
+    is_streamed,
+    merge_batch_response,
+    offset_batches,
+    raise_for_status,
+    run_concurrently,
     validate_list_of_nums,
+    validated_batches,
 )
+from .journal import Job, Journal
+from .metrics import Metrics
+from .models import CallDetail, Campaign, Contact, ContactList, SmsDetail
+from .pagination import iter_records, iter_records_parallel
+from .ratelimit import RateLimiter
+from .rollback import RollbackHandle, attach_rollback
+from .serialization import RecordsPayload, encode_body
+from .sms import BulkSmsResult, collect_sms_chunks
+from .tracing import NOOP_SPAN, Tracer
+from .uploads import AdaptiveBatchSizer, BatchCounter, BatchResult, CreatedResources
 from .validators import validate_url
 
 logger = logging.getLogger("exotelpy")
@@ -164,20 +189,103 @@ class Retry:
 class Exotel:
     """Object to initialize and interact with Exotel API
 
-    It holds the authentication details
+    It holds the authentication details and a pooled keep-alive HTTP session,
+    which is safe to share across threads. Use it as a context manager (or
+    call :meth:`close`) to release the pooled connections.
 
     Args:
         sid (str): Exotel Account SID
         key (str): API Key
         token (str): API Token
         baseurl (str, optional): Account Subdomain. Defaults to "https://api.exotel.com".
+        pool_connections (int, optional): Number of per-host connection pools to keep. Defaults to 10.
+        pool_maxsize (int, optional): Maximum number of connections kept open per host. Defaults to 10.
+        pool_block (bool, optional): Block when all connections of a host are busy instead of opening throwaway ones. Defaults to False.
+        keep_alive (bool, optional): Reuse connections between requests. Defaults to True.
+        max_workers (int, optional): Default number of concurrent requests used by bulk helpers. Defaults to 8.
+        rate_limiter (RateLimiter, optional): Shapes outgoing requests, any object with the same
+            reserve/feedback methods can be plugged in. Defaults to None.
+        retry_policy (RetryPolicy, optional): Retries transient failures, requests aren't retried when None. Defaults to None.
+        timeout (float, optional): Seconds to wait for Exotel to respond, waits forever when None. Defaults to None.
+        cache (ResponseCache, optional): Serves repeated reads of rarely changing resources from memory. Defaults to None.
+        metrics (Metrics, optional): Records latency, throughput and errors per endpoint. Defaults to None.
+        tracer (Tracer, optional): Emits spans for the phases of composite operations like create_list. Defaults to None.
+        contact_index (ContactIndex, optional): Lets create_list reuse the contacts of numbers it has seen before
+            instead of creating them again. Defaults to None.
+        journal (Journal, optional): Checkpoints uploads started with a job_id so they can be resumed. Defaults to None.
+        rollback_timeout (float, optional): Seconds a failed ``*_with_list`` call spends deleting what it created
+            before giving up on the remaining contacts, unbounded when None. Defaults to None.
+        background_rollback (bool, optional): Roll back failed ``*_with_list`` calls on a background thread and
+            raise right away, the exception's ``rollback`` attribute reports the progress. Defaults to False.
+        batch_sizer (AdaptiveBatchSizer, optional): Tunes the number of contacts create_list uploads per batch
+            from observed latency and errors, batches hold 5000 contacts when None. Defaults to None.
+        compress_threshold (int, optional): Gzips v2 request bodies of at least this many bytes, e.g. the
+            contact payloads of create_list. Bodies are sent uncompressed when None. Defaults to None.
     """
 
     def __init__(self, sid: str, key: str, token: str,
-                 baseurl: str = "https://api.exotel.com"):
+                 baseurl: str = "https://api.exotel.com",
+                 pool_connections: int = 10, pool_maxsize: int = 10,
+                 pool_block: bool = False, keep_alive: bool = True,
+                 max_workers: int = 8, rate_limiter: RateLimiter = None,
+                 retry_policy: RetryPolicy = None, timeout: float = None,
+                 cache: ResponseCache = None, metrics: Metrics = None,
+                 tracer: Tracer = None, contact_index: ContactIndex = None,
+                 journal: Journal = None, rollback_timeout: float = None,
+                 background_rollback: bool = False, batch_sizer: AdaptiveBatchSizer = None,
+                 compress_threshold: int = None):
         self.sid = sid
+        self.max_workers = max_workers
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.timeout = timeout
+        self.cache = cache
+        self.metrics = metrics
+        self.tracer = tracer
+        self.contact_index = contact_index
+        self.journal = journal
+        self.rollback_timeout = rollback_timeout
+        self.background_rollback = background_rollback
+        self.batch_sizer = batch_sizer
+        self.compress_threshold = compress_threshold
         self.baseurl = baseurl
         self.auth_headers = HTTPBasicAuth(key, token)
+        self._session = self._build_session(
+            pool_connections, pool_maxsize, pool_block, keep_alive)
+
+    def _build_session(self, pool_connections: int, pool_maxsize: int,
+                       pool_block: bool, keep_alive: bool) -> requests.Session:
+        session = requests.Session()
+        session.auth = self.auth_headers
+        adapter = HTTPAdapter(pool_connections=pool_connections,
+                              pool_maxsize=pool_maxsize, pool_block=pool_block)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def _open_job(self, job_id: str = None) -> Optional[Job]:
+        if job_id is None:
+            return None
+        if self.journal is None:
+            raise ValueError("job_id requires a client created with a journal")
+        return self.journal.open(job_id)
+
+    def _span(self, name: str, parent=None, **attributes):
+        if self.tracer is None:
+            return NOOP_SPAN
+        return self.tracer.span(name, parent=parent, **attributes)
+
+    def close(self):
+        """Closes the pooled connections held by the client"""
+        self._session.close()
+
+    def __enter__(self) -> "Exotel":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
     def __repr__(self) -> str:
         return "Exotel(sid='{sid}', baseurl='{baseurl}', key='{key}', token='{token}')".format(
@@ -191,51 +299,134 @@ class Exotel:
         if version == "v2_beta":
             return urljoin(self.baseurl, "v2_beta/Accounts/{sid}/".format(sid=self.sid))
 
-    def __call_api(self, method: str, endpoint: str,
-                   version: str = "v2", data: dict = None) -> dict:
+    def _request_kwargs(self, method: str, endpoint: str,
+                        version: str = "v2", data: dict = None) -> dict:
+        """
+            Builds the transport-agnostic arguments of an API request
 
-        url = urljoin(self.__api_url(version), endpoint)
+            :meta private:
+        """
+        kwargs = {"method": method,
+                  "url": urljoin(self.__api_url(version), endpoint)}
 
         if data is not None:
             if version == "v1":
-                response = requests.request(
-                    method=method, url=url, auth=self.auth_headers, data=data)
+                kwargs["data"] = data
+            elif method in ["POST", "PUT", "PATCH"]:
+                kwargs["data"], kwargs["headers"] = encode_body(data, self.compress_threshold)
+            elif method == "GET":
+                kwargs["params"] = data
+        return kwargs
+
+    def _cached_response(self, method: str, endpoint: str,
+                         version: str, data: dict = None):
+        """
+            Returns the cached response of a read, None on a miss
+
+            :meta private:
+        """
+        if self.cache is None or not self.cache.cacheable(method, endpoint):
+            return None
+        return self.cache.get(version, endpoint, data)
+
+    def _handle_response(self, method: str, endpoint: str, version: str,
+                         data: dict, status_code: int, body: dict, url: str) -> dict:
+        """
+            Logs the exchange, keeps the response cache coherent and maps
+            error status codes to exceptions
+
+            :meta private:
+        """
+        logger.debug(
+            "Making API request to %s with payload: %s, received response: %s",
+            url, data, body)
+
+        if self.cache is not None and method != "GET":
+            self.cache.invalidate(endpoint, version=version)
+
+        raise_for_status(status_code, body, version=version)
+
+        if self.cache is not None and method == "GET":
+            self.cache.set(version, endpoint, data, body)
+        return body
+
+    def _retry_delay(self, attempt: int, method: str, status_code: int = None,
+                     headers: dict = None, sent: bool = True):
+        """
+            Seconds to wait before retrying, None when the request is final
+
+            :meta private:
+        """
+        if self.retry_policy is None:
+            return None
+        return self.retry_policy.delay(attempt, method, status_code, headers, sent)
+
+    @staticmethod
+    def _is_connect_error(error: Exception) -> bool:
+        reason = getattr(error.args[0], "reason", None) if error.args else None
+        return isinstance(error, requests.exceptions.ConnectTimeout) or \
+            isinstance(reason, NewConnectionError)
+
+    @staticmethod
+    def _body_size(body) -> int:
+        if body is None:
+            return 0
+        if isinstance(body, str):
+            return len(body.encode())
+        return len(body)
+
+    def _call_api(self, method: str, endpoint: str,
+                  version: str = "v2", data: dict = None) -> dict:
+        cached = self._cached_response(method, endpoint, version, data)
+        if cached is not None:
+            return cached
+
+        kwargs = self._request_kwargs(method, endpoint, version, data)
+        attempt = 1
+        while True:
+            if self.rate_limiter is not None:
+                time.sleep(self.rate_limiter.reserve(version, endpoint))
+            started = time.perf_counter()
+            try:
+                response = self._session.request(timeout=self.timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                delay = self._retry_delay(
+                    attempt, method, sent=not self._is_connect_error(e))
+                if self.metrics is not None:
+                    self.metrics.record(method, endpoint, None, time.perf_counter() - started,
+                                        retried=delay is not None)
+                if delay is None:
+                    raise
             else:
-                if method in ["POST", "PUT", "PATCH"]:
-                    response = requests.request(
-                        method=method, url=url, auth=self.auth_headers, json=data)
-                elif method == "GET":
-                    response = requests.request(
-                        method=method, url=url, auth=self.auth_headers, params=data)
+                if self.rate_limiter is not None:
+                    self.rate_limiter.feedback(version, endpoint, response.status_code)
+                if self.batch_sizer is not None:
+                    self.batch_sizer.feedback(endpoint, response.status_code)
+                delay = self._retry_delay(
+                    attempt, method, response.status_code, response.headers)
+                if self.metrics is not None:
+                    self.metrics.record(
+                        method, endpoint, response.status_code, time.perf_counter() - started,
+                        self._body_size(response.request.body), len(response.content),
+                        retried=delay is not None)
+                if delay is None:
+                    return self._handle_response(
+                        method, endpoint, version, data,
+                        response.status_code, decode_json(response), kwargs["url"])
+
+            logger.info("Retrying {method} {url} in {delay:.2f}s after attempt {attempt}".format(
+                method=method, url=kwargs["url"], delay=delay, attempt=attempt))
+            time.sleep(delay)
+            attempt += 1
+
+    def _iter_records(self, fetch, offset: int, limit: int, prefetch: bool,
+                      max_workers: int = 1, model: type = None):
+        if max_workers > 1:
+            records = iter_records_parallel(
+                fetch, offset=offset, limit=limit, max_workers=max_workers)
         else:
-            response = requests.request(
-                method=method, url=url, auth=self.auth_headers)
-
-        logging.debug(
-            "Making API request to {url} with payload: {payload}, received response: {response}".format(
-                url=url, payload=data, response=response.json()))
-
-        if response.status_code == 401:
-            description = get_error_description(response.json())
-            raise AuthenticationFailed(description)
-        elif response.status_code == 403:
-            raise PermissionDenied(
-                "Your credentials are valid, but you don't have access to the requested resource.")
-        elif response.status_code == 402:
-            description = get_error_description(response.json())
-            raise PaymentRequired(description)
-        elif response.status_code == 429:
-            raise Throttled("Request was throttled.")
-        elif response.status_code == 400:
-            description = get_error_description(
-                response.json(), version=version)
-            raise ValidationError(description)
-        elif response.status_code == 404:
-            description = get_error_description(
-                response.json(), version=version)
-            raise NotFound(description)
-
-        return response.json()
+            records = iter_records(fetch, offset=offset, limit=limit, prefetch=prefetch)
+        return records if model is None else model.wrap(records)
 
     def create_campaign(
             self, caller_id: str, app_id: str, from_: List[str] = None, lists: List[str] = None,
@@ -281,8 +472,7 @@ class Exotel:
                 "Either from_ or lists must be passed, can't create campaign without it")
 
         if from_ is not None:
-            validate_list_of_nums(from_)
-            campaign["from"] = from_
+            campaign["from"] = validate_list_of_nums(from_)
 
         if lists is not None:
             campaign["lists"] = lists
@@ -312,45 +502,132 @@ class Exotel:
 
         payload = {"campaigns": [campaign]}
 
-        return self.__call_api("POST", 'campaigns', data=payload)
+        return self._call_api("POST", 'campaigns', data=payload)
 
     def create_campaign_with_list(
-            self, numbers: List[str],
-            list_name: str, caller_id: str, app_id: str, **kwargs) -> dict:
+            self, numbers: Iterable[str],
+            list_name: str, caller_id: str, app_id: str, job_id: str = None, **kwargs) -> dict:
         """Slightly customized to create list with numbers
         passed as argument implicitly
 
         Args:
-            numbers (List[str]): List of numbers in E.164 format
+            numbers (Iterable[str]): Numbers in E.164 format, any iterable, see :meth:`create_list`
             list_name (str): name of contact list that will be created implicitly
             caller_id (str): This is your exophone
             app_id (str): Identifier of the flow that you want to connect to once the from number picks up the call, this is used to build the `url` param for API
+            job_id (str, optional): Journals the upload under this id, calling again with it resumes
+                the job, see :class:`exotelpy.journal.Journal`. Defaults to None.
             **kwargs: accepts the rest of the arguments of create_campaign
 
         Returns:
             dict: json containing API response
         """
-        validate_list_of_nums(numbers)
-        data = self.create_list(name=list_name, numbers=numbers)
-        list_id = get_list_id(data)
-        contact_sids = get_contact_sids(data)
-        lists = [list_id]
-
-        try:
-            return self.create_campaign(caller_id=caller_id,
-                                        app_id=app_id, lists=lists, **kwargs)
-        except ValidationError as e:
-            logger.warn(
-                "Exotel API raised validation error, reverting list and contacts creation")
-            self.delete_list(list_id)
-            self.delete_contacts(contact_sids)
-            raise e
-        except PaymentRequired as e:
-            logging.warn(
-                "Exotel API raised payment required error, campaign creation failed, reverting contact and list creation")
-            self.delete_list(list_id)
-            self.delete_contacts(contact_sids)
-            raise e
+        return self._create_with_list(
+            "create_campaign_with_list", numbers, list_name,
+            lambda lists: self.create_campaign(
+                caller_id=caller_id, app_id=app_id, lists=lists, **kwargs),
+            job_id=job_id)
+
+    def _create_with_list(self, operation: str, numbers: Iterable[str], list_name: str,
+                          create, rollback_on: tuple = (Exception,),
+                          job_id: str = None) -> dict:
+        """
+            Creates a list holding numbers, then calls create with it and
+            reverts the list and contacts when that raises rollback_on, the
+            exception's rollback attribute holds the :class:`RollbackHandle`
+
+            :meta private:
+        """
+        job = self._open_job(job_id)
+        if job is not None and job.campaign is not None and not job.rolled_back:
+            return job.campaign
+
+        numbers = self._check_job_numbers(numbers, job)
+        with self._span(operation, list_name=list_name) as span:
+            created = CreatedResources()
+            try:
+                summary = self._create_list(
+                    list_name, numbers=numbers, job_id=job_id, created=created, sink=lambda batch: None)
+                span.set_attribute("list_id", summary["list_id"])
+                with self._span("campaign_creation"):
+                    response = create([summary["list_id"]])
+            except rollback_on as e:
+                logger.warning(
+                    "Exotel API raised {error}, {operation} failed, reverting list and contacts creation".format(
+                        error=type(e).__name__, operation=operation))
+                if job is not None:
+                    handle = self.rollback_job(job_id)
+                elif created.list_id is not None:
+                    handle = self._rollback(created.list_id, created.created_sids())
+                else:
+                    handle = None
+                attach_rollback(e, handle)
+                raise
+
+            if job is not None:
+                job.record_campaign(response)
+            return response
+
+    def _check_job_numbers(self, numbers: Optional[Iterable[str]], job: Job = None):
+        """
+            Refuses to resume a job with other numbers before anything can
+            be rolled back, the job's own work is left alone
+
+            :meta private:
+        """
+        if job is None or not job.started:
+            return numbers
+        numbers = self._prepare_numbers(numbers, job)
+        job.check(numbers)
+        return numbers
+
+    def _rollback(self, list_id: str, contact_sids: List[str], on_done=None) -> RollbackHandle:
+        """
+            Deletes the list and contacts concurrently within the rollback
+            time budget, on a background thread with background_rollback
+
+            :meta private:
+        """
+        handle = RollbackHandle(list_id, contact_sids, self.rollback_timeout, on_done)
+        parent = self.tracer.current() if self.tracer is not None else None
+
+        def run():
+            with self._span("rollback", parent=parent, list_id=list_id,
+                            contacts=len(contact_sids)) as span:
+                handle.run(self.delete_list, self.delete_contact, self.max_workers)
+                span.set_attribute("deleted", handle.deleted)
+                span.set_attribute("skipped", len(handle.skipped))
+            if not handle.complete:
+                logger.warning("Rollback of list {list_id} incomplete: {progress}".format(
+                    list_id=list_id, progress=handle.progress()))
+
+        if self.background_rollback:
+            threading.Thread(target=run, name="exotelpy-rollback").start()
+        else:
+            run()
+        return handle
+
+    def rollback_job(self, job_id: str) -> Optional[RollbackHandle]:
+        """Deletes the list and the contacts created by a journaled job, then its checkpoints
+
+        Contacts the job reused from the contact index are kept. The
+        checkpoints are only removed once everything was deleted, so an
+        incomplete rollback can be run again; until then the job can't be
+        resumed and its id can't be reused.
+
+        Args:
+            job_id (str): id the job was started with
+
+        Returns:
+            RollbackHandle: progress of the deletes, None when the job never created its list
+        """
+        job = self._open_job(job_id)
+        if not job.started:
+            job.discard()
+            return None
+        job.record_rollback()
+        return self._rollback(job.list_id, job.created_sids(),
+                              on_done=lambda handle: handle.complete and job.discard())
 
     def get_campaign_details(self, campaign_id: str) -> dict:
         """Retrieve the details of a specific campaign in your account
@@ -363,7 +640,7 @@ class Exotel:
         Returns:
             dict: json object containg the API response
         """
-        return self.__call_api("GET", 'campaigns/{cid}'.format(cid=campaign_id))
+        return self._call_api("GET", 'campaigns/{cid}'.format(cid=campaign_id))
 
     def delete_campaign(self, campaign_id: str) -> dict:
         """Delete a specific campaign
@@ -376,7 +653,7 @@ class Exotel:
         Returns:
             dict: json object containing the API response
         """
-        return self.__call_api("DELETE", "campaigns/{cid}".format(cid=campaign_id))
+        return self._call_api("DELETE", "campaigns/{cid}".format(cid=campaign_id))
 
     def get_bulk_campaign_details(
             self, offset: int = None, limit: int = None, name: str = None, status: str = None,
@@ -411,7 +688,34 @@ class Exotel:
         if sort_by is not None:
             data["sort_by"] = sort_by
 
-        return self.__call_api("GET", 'campaigns', data=data)
+        return self._call_api("GET", 'campaigns', data=data)
+
+    def iter_bulk_campaign_details(
+            self, limit: int = 100, offset: int = 0, name: str = None, status: str = None,
+            sort_by: str = None, prefetch: bool = True,
+            max_workers: int = 1, typed: bool = False) -> Iterator[dict]:
+        """Lazily iterates over every campaign of the account, see :meth:`get_bulk_campaign_details`
+
+        Args:
+            limit (int, optional): Page size. Defaults to 100.
+            offset (int, optional): Offset of the first record. Defaults to 0.
+            name (str, optional): Defaults to None.
+            status (str, optional): Defaults to None.
+            sort_by (str, optional): Defaults to None.
+            prefetch (bool, optional): Fetch the next page in the background. Defaults to True.
+            max_workers (int, optional): Number of pages fetched concurrently, more than one plans the
+                offsets from the first page's total and drops records repeated across pages. Defaults to 1.
+            typed (bool, optional): Yield :class:`~exotelpy.models.Campaign` records instead of dicts. Defaults to False.
+
+        Returns:
+            Iterator[dict]: campaign records
+        """
+        return self._iter_records(
+            lambda offset, limit: self.get_bulk_campaign_details(
+                offset=offset, limit=limit,
+                name=name, status=status, sort_by=sort_by),
+            offset=offset, limit=limit, prefetch=prefetch, max_workers=max_workers,
+            model=Campaign if typed else None)
 
     def get_campaign_call_details(
             self, campaign_id: str, offset: int = None, limit: int = None, status: str = None,
@@ -441,28 +745,51 @@ class Exotel:
         if sort_by is not None:
             data["sort_by"] = sort_by
 
-        return self.__call_api(
+        return self._call_api(
             "GET", 'campaigns/{cid}/call-details'.format(cid=campaign_id),
             data=data)
 
-    def create_contacts(self, numbers: List[str]):
+    def iter_campaign_call_details(
+            self, campaign_id: str, limit: int = 100, offset: int = 0, status: str = None,
+            sort_by: str = None, prefetch: bool = True,
+            max_workers: int = 1, typed: bool = False) -> Iterator[dict]:
+        """Lazily iterates over the call details of a campaign, see :meth:`get_campaign_call_details`
+
+        Args:
+            campaign_id (str): ID of the campaign
+            limit (int, optional): Page size. Defaults to 100.
+            offset (int, optional): Offset of the first record. Defaults to 0.
+            status (str, optional): Defaults to None.
+            sort_by (str, optional): Defaults to None.
+            prefetch (bool, optional): Fetch the next page in the background. Defaults to True.
+            max_workers (int, optional): Number of pages fetched concurrently, more than one plans the
+                offsets from the first page's total and drops records repeated across pages. Defaults to 1.
+            typed (bool, optional): Yield :class:`~exotelpy.models.CallDetail` records instead of dicts. Defaults to False.
+
+        Returns:
+            Iterator[dict]: call detail records
+        """
+        return self._iter_records(
+            lambda offset, limit: self.get_campaign_call_details(
+                campaign_id, offset=offset, limit=limit,
+                status=status, sort_by=sort_by),
+            offset=offset, limit=limit, prefetch=prefetch, max_workers=max_workers,
+            model=CallDetail if typed else None)
+
+    def create_contacts(self, numbers: Iterable[str]):
         """Create contacts
 
         https://developer.exotel.com/api/campaigns-contacts#create-contacts
 
         Args:
-            numbers (List[str]): List of E.164 formatted phone numbers
+            numbers (Iterable[str]): E.164 formatted phone numbers
 
         Returns:
             dict: json object containing API response
         """
-        validate_list_of_nums(numbers)
-        payload = {
-            "contacts": [
-                {"number": num} for num in numbers
-            ]
-        }
-        return self.__call_api("POST", "contacts", data=payload)
+        numbers = validate_list_of_nums(numbers)
+        payload = RecordsPayload("contacts", "number", numbers)
+        return self._call_api("POST", "contacts", data=payload)
 
     def get_contact_details(self, contact_id: str) -> dict:
         """
@@ -474,7 +801,7 @@ class Exotel:
         Returns:
             dict: json object containing API response
         """
-        return self.__call_api("GET", "contacts/{cid}".format(cid=contact_id))
+        return self._call_api("GET", "contacts/{cid}".format(cid=contact_id))
 
     def delete_contact(self, sid: str) -> dict:
         """https://developer.exotel.com/api/campaigns-contacts#delete-a-contact
@@ -486,25 +813,37 @@ class Exotel:
             dict: json object containing API response
         """
 
-        return self.__call_api("DELETE", "contacts/{cid}".format(cid=sid))
+        data = self._call_api("DELETE", "contacts/{cid}".format(cid=sid))
+        if self.contact_index is not None:
+            self.contact_index.discard(self.sid, [sid])
+        return data
 
-    def delete_contacts(self, sids: List[str]) -> List[dict]:
+    def delete_contacts(self, sids: List[str], max_workers: int = None,
+                        return_exceptions: bool = False) -> List[dict]:
         """Utility method for deleting multiple contact at once
 
+        Deletes run concurrently, every sid is attempted even when some of
+        them fail.
+
         Args:
-            sids (List[str]): List of E.164 formatted numbers
+            sids (List[str]): List of contact sids
+            max_workers (int, optional): Number of concurrent deletes. Defaults to the client's max_workers.
+            return_exceptions (bool, optional): Return the raised exception in place of a failed sid's response instead of raising. Defaults to False.
+
+        Raises:
+            BulkOperationFailed: raised when any delete failed and return_exceptions is False
 
         Returns:
-            List[dict]: List of json object containing API response for each contact
+            List[dict]: List of json object containing API response for each contact, in the order of sids
         """
-        responses = []
-        for sid in sids:
-            responses.append(self.delete_contact(sid))
-
-        return responses
+        sids = list(sids)
+        results = run_concurrently(
+            self.delete_contact, sids, max_workers or self.max_workers)
+        return collect_failures(sids, results, "Contact deletion", return_exceptions)
 
     def create_list(self, name: str, tag: str = "demo",
-                    numbers: List[str] = None) -> dict:
+                    numbers: Iterable[str] = None, max_workers: int = 1,
+                    sink: Callable[[BatchResult], None] = None, job_id: str = None) -> dict:
         """
         Slightly modded implementation that takes number as arguments and add
         those numbers to list after creation
@@ -514,17 +853,128 @@ class Exotel:
         Args:
             name (str): Name of the list
             tag (str, optional): Defaults to "demo".
-            numbers (List[str], optional): List of E.164 formatted phone numbers. Defaults to None.
+            numbers (Iterable[str], optional): E.164 formatted phone numbers. Lists are validated before
+                the list is created, other iterables like generators or :func:`exotelpy.sources.read_numbers`
+                are validated and uploaded batch by batch, holding only the batches in flight in memory.
+                Defaults to None.
+            max_workers (int, optional): Number of batches uploaded concurrently, with more than one
+                creating the contacts of a batch overlaps adding the previous batch to the list. Defaults to 1.
+            sink (Callable[[BatchResult], None], optional): Receives the result of every batch as soon as
+                it is uploaded instead of merging them into one response, so memory stays proportional to
+                a single batch. Defaults to None.
+            job_id (str, optional): Journals the upload under this id, calling again with the same id and
+                numbers resumes it from the last completed batch, see :class:`exotelpy.journal.Journal`.
+                Batches attached by an earlier call are reported first. Defaults to None.
 
         Raises:
             UniqueViolationError: When contact list with same name already exists
+            InvalidPhoneNumbers: When any number is invalid, for streamed numbers once its batch is reached
+            ValueError: When job_id is resumed with different numbers
 
         Returns:
-            dict: json object containing API response
+            dict: json object containing API response, with a sink only the list id, the number of
+            batches and the success/failed/total counters
+        """
+        return self._create_list(name, tag, numbers, max_workers, sink, job_id)
+
+    def _create_list(self, name: str, tag: str = "demo", numbers: Iterable[str] = None,
+                     max_workers: int = 1, sink: Callable[[BatchResult], None] = None,
+                     job_id: str = None, created: CreatedResources = None) -> dict:
         """
-        if numbers is not None:
-            validate_list_of_nums(numbers)
+            :meth:`create_list`, recording the list and contacts it creates
+            into created as it goes
 
+            :meta private:
+        """
+        job = self._open_job(job_id)
+        with self._span("create_list", list_name=name) as span:
+            numbers = self._prepare_numbers(numbers, job)
+            data = self._start_list(name, tag, numbers, job)
+            list_id = data["response"][0]["data"]["sid"]
+            span.set_attribute("list_id", list_id)
+            if created is not None:
+                created.list_id = list_id
+
+            if numbers is None:
+                return data
+
+            responses = self._upload_batches(numbers, list_id, max_workers, job, created)
+            if job is not None and job.attached:
+                responses = chain([job.attached_response()], responses)
+
+            if sink is not None:
+                counter = BatchCounter(list_id)
+                for response in responses:
+                    sink(counter(response))
+                return counter.summary()
+
+            output = None
+            for response in responses:
+                output = merge_batch_response(output, response)
+            return output
+
+    def _prepare_numbers(self, numbers: Optional[Iterable[str]], job: Job = None):
+        """
+            Validates numbers up front, except for streamed numbers which are
+            validated batch by batch unless a journal needs them all
+
+            :meta private:
+        """
+        if numbers is None or (is_streamed(numbers) and job is None):
+            return numbers
+        if is_streamed(numbers):
+            numbers = list(numbers)
+        with self._span("validation", numbers=len(numbers)):
+            return validate_list_of_nums(numbers)
+
+    def iter_create_list(self, name: str, tag: str = "demo", numbers: Iterable[str] = (),
+                         max_workers: int = 1, job_id: str = None) -> Iterator[BatchResult]:
+        """
+        Streaming version of :meth:`create_list`, creates the list and yields
+        the result of every uploaded batch with running success/total counters
+
+        ::
+
+            for batch in client.iter_create_list("audience", numbers=numbers):
+                print(batch.success, "of", batch.total)
+
+        Args:
+            name (str): Name of the list
+            tag (str, optional): Defaults to "demo".
+            numbers (Iterable[str], optional): E.164 formatted phone numbers, see :meth:`create_list`. Defaults to ().
+            max_workers (int, optional): Number of batches uploaded concurrently. Defaults to 1.
+            job_id (str, optional): Journals the upload under this id, see :meth:`create_list`. Defaults to None.
+
+        Raises:
+            UniqueViolationError: When contact list with same name already exists
+
+        Yields:
+            BatchResult: outcome of each batch, in order
+        """
+        job = self._open_job(job_id)
+        numbers = self._prepare_numbers(numbers, job)
+        list_id = self._start_list(name, tag, numbers, job)["response"][0]["data"]["sid"]
+        counter = BatchCounter(list_id)
+        if job is not None and job.attached:
+            yield counter(job.attached_response())
+        for response in self._upload_batches(numbers, list_id, max_workers, job):
+            yield counter(response)
+
+    def _start_list(self, name: str, tag: str, numbers: Optional[Iterable[str]], job: Job = None) -> dict:
+        """
+            Creates the list, or picks up the one of a resumed job
+
+            :meta private:
+        """
+        if job is not None and job.started:
+            job.check(numbers)
+            return job.list_response()
+        data = self._create_empty_list(name, tag)
+        if job is not None:
+            job.start(data["response"][0]["data"]["sid"], name, numbers)
+        return data
+
+    def _create_empty_list(self, name: str, tag: str) -> dict:
         payload = {
             "lists": [
                 {
@@ -533,29 +983,108 @@ class Exotel:
                 }
             ]
         }
-        data = self.__call_api("POST", "lists", data=payload)
+        with self._span("list_creation"):
+            data = self._call_api("POST", "lists", data=payload)
 
         if data["response"][0]["code"] == 409:
             description = data["response"][0]["error_data"]["description"]
             raise UniqueViolationError(description)
+        return data
 
-        list_id = data["response"][0]["data"]["sid"]
+    def _upload_batch(self, numbers: List[str], list_id: str, index: int = None,
+                      parent=None, job: Job = None, start: int = 0, created: CreatedResources = None) -> dict:
+        with self._span("batch", parent=parent, batch_index=index, batch_size=len(numbers)) as batch:
+            started = time.perf_counter()
+            try:
+                contact_sids = job.contacts.get(start) if job is not None else None
+                if contact_sids is None:
+                    with self._span("contact_creation") as span:
+                        contact_sids, known = self._contact_sids(numbers, span)
+                    if job is not None:
+                        job.record_contacts(start, contact_sids, known)
+                    if created is not None:
+                        created.record_contacts(contact_sids, known)
+                with self._span("list_attachment"):
+                    response = self.add_contacts_to_list(contact_sids, list_id)
+            except Exception:
+                self._observe_batch(numbers, started, batch, failed=True)
+                raise
+            self._observe_batch(numbers, started, batch)
+            if job is not None:
+                job.record_attached(start)
+            return response
+
+    def _observe_batch(self, numbers: List[str], started: float, span=NOOP_SPAN, failed: bool = False):
+        """
+            Feeds an uploaded batch to the batch sizer and publishes its decision
 
-        if numbers is not None:
-            output = None
-            for nums in batch_contacts(numbers):
-                contact_sids = get_contact_sids(self.create_contacts(nums))
+            :meta private:
+        """
+        if self.batch_sizer is None:
+            return
+        # {"number": "..."} around every number of the create_contacts body
+        payload_bytes = sum(map(len, numbers)) + 16 * len(numbers)
+        size = self.batch_sizer.observe(
+            len(numbers), time.perf_counter() - started, payload_bytes, failed)
+        span.set_attribute("next_batch_size", size)
+        if self.metrics is not None:
+            self.metrics.set_gauge("upload_batch_size", size)
+        logger.debug("Next contact batch holds %s contacts", size)
+
+    def _contact_sids(self, numbers: List[str], span=NOOP_SPAN) -> Tuple[List[str], List[str]]:
+        """
+            Creates the contacts of numbers, reusing the ones in the contact
+            index, and returns their sids in the order of numbers along with
+            the reused sids
 
-                response = self.add_contacts_to_list(contact_sids, list_id)
-                if output is None:
-                    output = deepcopy(response)
-                else:
-                    output["response"] += response["response"]
-                    output["metadata"]["success"] += response["metadata"]["success"]
-                    output["metadata"]["total"] += response["metadata"]["total"]
-            return output
+            :meta private:
+        """
+        if self.contact_index is None:
+            return get_contact_sids(self.create_contacts(numbers)), []
+
+        known, unknown = split_known(self.contact_index, self.sid, numbers)
+        reused = list(known.values())
+        span.set_attribute("reused", len(numbers) - len(unknown))
+        if unknown:
+            created = list(zip(unknown, get_contact_sids(self.create_contacts(unknown))))
+            self.contact_index.update(self.sid, created)
+            known.update(created)
+        return [known[number] for number in numbers], reused
+
+    def _upload_batches(self, numbers: Iterable[str], list_id: str, max_workers: int = 1,
+                        job: Job = None, created: CreatedResources = None):
+        """
+            Yields the add_contacts_to_list response of every batch in order,
+            keeping at most max_workers batches in flight, batches a resumed
+            job already attached are skipped. Numbers are validated a batch
+            at a time as they are read
 
-        return data
+            :meta private:
+        """
+        limit = self.batch_sizer if self.batch_sizer is not None else 5000
+        if job is not None:
+            batches = job.remaining(numbers, limit)
+        else:
+            batches = offset_batches(validated_batches(numbers, limit))
+        if max_workers <= 1:
+            for index, (start, nums) in enumerate(batches):
+                yield self._upload_batch(nums, list_id, index, job=job, start=start, created=created)
+            return
+
+        parent = self.tracer.current() if self.tracer is not None else None
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = deque()
+            try:
+                for index, (start, nums) in enumerate(batches):
+                    if len(pending) >= max_workers:
+                        yield pending.popleft().result()
+                    pending.append(executor.submit(
+                        self._upload_batch, nums, list_id, index, parent, job, start, created))
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
 
     def add_contacts_to_list(self, sids: List[str], list_id: str) -> dict:
         """
@@ -568,12 +1097,10 @@ class Exotel:
         Returns:
             dict: json object containing API response
         """
-        payload = {
-            "contact_references": [
-                {"contact_sid": sid} for sid in sids
-            ]
-        }
-        return self.__call_api("POST", "lists/{list_id}/contacts".format(list_id=list_id),
+        if not isinstance(sids, (list, tuple)):
+            sids = list(sids)
+        payload = RecordsPayload("contact_references", "contact_sid", sids)
+        return self._call_api("POST", "lists/{list_id}/contacts".format(list_id=list_id),
                                data=payload)
 
     def delete_list(self, list_id: str) -> dict:
@@ -587,7 +1114,7 @@ class Exotel:
         Returns:
             dict: json object containing API response
         """
-        return self.__call_api("DELETE", "lists/{list_id}".format(list_id=list_id))
+        return self._call_api("DELETE", "lists/{list_id}".format(list_id=list_id))
 
     def get_list_details(self, list_id: str) -> dict:
         """
@@ -596,7 +1123,7 @@ class Exotel:
         Args:
             list_id (str): Contact List ID
         """
-        return self.__call_api("GET", "lists/{list_id}".format(list_id=list_id))
+        return self._call_api("GET", "lists/{list_id}".format(list_id=list_id))
 
     def get_bulk_lists(self, offset: int = None, limit: int = None,
                        name: str = None, sort_by: str = None) -> dict:
@@ -625,7 +1152,33 @@ class Exotel:
         if sort_by is not None:
             data["sort_by"] = sort_by
 
-        return self.__call_api("GET", "lists", data=data)
+        return self._call_api("GET", "lists", data=data)
+
+    def iter_bulk_lists(
+            self, limit: int = 100, offset: int = 0, name: str = None, sort_by: str = None,
+            prefetch: bool = True,
+            max_workers: int = 1, typed: bool = False) -> Iterator[dict]:
+        """Lazily iterates over every contact list of the account, see :meth:`get_bulk_lists`
+
+        Args:
+            limit (int, optional): Page size. Defaults to 100.
+            offset (int, optional): Offset of the first record. Defaults to 0.
+            name (str, optional): Defaults to None.
+            sort_by (str, optional): Defaults to None.
+            prefetch (bool, optional): Fetch the next page in the background. Defaults to True.
+            max_workers (int, optional): Number of pages fetched concurrently, more than one plans the
+                offsets from the first page's total and drops records repeated across pages. Defaults to 1.
+            typed (bool, optional): Yield :class:`~exotelpy.models.ContactList` records instead of dicts. Defaults to False.
+
+        Returns:
+            Iterator[dict]: list records
+        """
+        return self._iter_records(
+            lambda offset, limit: self.get_bulk_lists(
+                offset=offset, limit=limit,
+                name=name, sort_by=sort_by),
+            offset=offset, limit=limit, prefetch=prefetch, max_workers=max_workers,
+            model=ContactList if typed else None)
 
     def get_list_contacts(self, list_id: str, limit: int = None, offset: int = None) -> dict:
         """
@@ -647,10 +1200,32 @@ class Exotel:
         if limit is not None:
             data["limit"] = limit
 
-        return self.__call_api(
+        return self._call_api(
             "GET", "lists/{list_id}/contacts".format(list_id=list_id),
             data=data)
 
+    def iter_list_contacts(
+            self, list_id: str, limit: int = 100, offset: int = 0, prefetch: bool = True,
+            max_workers: int = 1, typed: bool = False) -> Iterator[dict]:
+        """Lazily iterates over the contacts of a list, see :meth:`get_list_contacts`
+
+        Args:
+            list_id (str): Contact List ID
+            limit (int, optional): Page size. Defaults to 100.
+            offset (int, optional): Offset of the first record. Defaults to 0.
+            prefetch (bool, optional): Fetch the next page in the background. Defaults to True.
+            max_workers (int, optional): Number of pages fetched concurrently, more than one plans the
+                offsets from the first page's total and drops records repeated across pages. Defaults to 1.
+            typed (bool, optional): Yield :class:`~exotelpy.models.Contact` records instead of dicts. Defaults to False.
+
+        Returns:
+            Iterator[dict]: contact records
+        """
+        return self._iter_records(
+            lambda offset, limit: self.get_list_contacts(list_id, offset=offset, limit=limit),
+            offset=offset, limit=limit, prefetch=prefetch, max_workers=max_workers,
+            model=Contact if typed else None)
+
     def create_sms_campaign(
             self, content_type: str, lists: List[str],
             dlt_entity_id: int, dlt_template_id: int, sender_id: str, sms_type: str,
@@ -683,7 +1258,7 @@ class Exotel:
         if sms_status_callback is not None:
             data["sms_status_callback"] = validate_url(sms_status_callback)
 
-        return self.__call_api("POST", "sms-campaigns", data=data)
+        return self._call_api("POST", "sms-campaigns", data=data)
 
     def create_message_campaign(
             self, content_type: str, lists: List[str],
@@ -733,46 +1308,40 @@ class Exotel:
             data["message_status_callback"] = validate_url(
                 message_status_callback)
 
-        return self.__call_api("POST", "message-campaigns", data=data)
+        return self._call_api("POST", "message-campaigns", data=data)
 
-    def create_message_campaign_with_list(self, numbers: List[str],
-                                          list_name: str, *args, **kwargs) -> dict:
+    def create_message_campaign_with_list(self, numbers: Iterable[str],
+                                          list_name: str, *args, job_id: str = None, **kwargs) -> dict:
         """Slightly customized to create list with numbers
         passed as argument implicitly
 
         https://developer.exotel.com/api/sms-campaigns#create-sms-campaigns
 
         Args:
-            numbers (List[str]): List of E.164 formatted phone numbers
+            numbers (Iterable[str]): E.164 formatted phone numbers, any iterable, see :meth:`create_list`
             list_name: Name of the contact list which will be used implicitly
+            job_id (str, optional): Journals the upload under this id, calling again with it resumes
+                the job, see :class:`exotelpy.journal.Journal`. Defaults to None.
 
         Raises:
             ValidationError: raised when any of the parameters isn't passed correctly
         """
-        validate_list_of_nums(numbers)
-        data = self.create_list(name=list_name, numbers=numbers)
-        list_id = get_list_id(data)
-        contact_sids = get_contact_sids(data)
-        lists = [list_id]
-
-        try:
-            return self.create_message_campaign(*args, lists=lists, **kwargs)
-        except ValidationError as e:
-            logger.warn(
-                "Exotel API raised validation error, reverting lists and contacts creation")
-            self.delete_list(list_id)
-            self.delete_contacts(contact_sids)
-            raise e
-
-    def create_sms_campaign_with_list(self, numbers: List[str],
-                                      list_name: str, *args, **kwargs) -> dict:
+        return self._create_with_list(
+            "create_message_campaign_with_list", numbers, list_name,
+            lambda lists: self.create_message_campaign(*args, lists=lists, **kwargs),
+            job_id=job_id)
+
+    def create_sms_campaign_with_list(self, numbers: Iterable[str],
+                                      list_name: str, *args, job_id: str = None, **kwargs) -> dict:
         """Slightly customized to create list with numbers
         passed as argument implicitly
         https://developer.exotel.com/api/sms-campaigns#create-sms-campaigns
 
         Args:
-            numbers (List[str]): List of E.164 formatted phone numbers
+            numbers (Iterable[str]): E.164 formatted phone numbers, any iterable, see :meth:`create_list`
             list_name: Name of the contact list which will be used implicitly
+            job_id (str, optional): Journals the upload under this id, calling again with it resumes
+                the job, see :class:`exotelpy.journal.Journal`. Defaults to None.
 
         Returns:
             dict: json object containing API response
@@ -780,20 +1349,10 @@ class Exotel:
         Raises:
             ValidationError: raised when any of the parameters isn't passed correctly
         """
-        validate_list_of_nums(numbers)
-        data = self.create_list(name=list_name, numbers=numbers)
-        list_id = get_list_id(data)
-        contact_sids = get_contact_sids(data)
-        lists = [list_id]
-
-        try:
-            return self.create_sms_campaign(*args, lists=lists, **kwargs)
-        except ValidationError as e:
-            logger.warn(
-                "Exotel API raised validation error, reverting lists and contacts creation")
-            self.delete_list(list_id)
-            self.delete_contacts(contact_sids)
-            raise e
+        return self._create_with_list(
+            "create_sms_campaign_with_list", numbers, list_name,
+            lambda lists: self.create_sms_campaign(*args, lists=lists, **kwargs),
+            job_id=job_id)
 
     def get_sms_campaign_details(self, campaign_id: str) -> dict:
         """Get details of the SMS Campaign
@@ -805,7 +1364,7 @@ class Exotel:
         Returns:
             dict: json object containing the API response
         """
-        return self.__call_api(
+        return self._call_api(
             "GET", "sms-campaigns/{campaign_id}".format(campaign_id=campaign_id))
 
     def get_bulk_sms_campaign_details(
@@ -840,7 +1399,34 @@ class Exotel:
         if sort_by is not None:
             data["sort_by"] = sort_by
 
-        return self.__call_api("GET", "sms-campaigns", data=data)
+        return self._call_api("GET", "sms-campaigns", data=data)
+
+    def iter_bulk_sms_campaign_details(
+            self, limit: int = 100, offset: int = 0, name: str = None, status: str = None,
+            sort_by: str = None, prefetch: bool = True,
+            max_workers: int = 1, typed: bool = False) -> Iterator[dict]:
+        """Lazily iterates over every SMS campaign of the account, see :meth:`get_bulk_sms_campaign_details`
+
+        Args:
+            limit (int, optional): Page size. Defaults to 100.
+            offset (int, optional): Offset of the first record. Defaults to 0.
+            name (str, optional): Defaults to None.
+            status (str, optional): Defaults to None.
+            sort_by (str, optional): Defaults to None.
+            prefetch (bool, optional): Fetch the next page in the background. Defaults to True.
+            max_workers (int, optional): Number of pages fetched concurrently, more than one plans the
+                offsets from the first page's total and drops records repeated across pages. Defaults to 1.
+            typed (bool, optional): Yield :class:`~exotelpy.models.Campaign` records instead of dicts. Defaults to False.
+
+        Returns:
+            Iterator[dict]: SMS campaign records
+        """
+        return self._iter_records(
+            lambda offset, limit: self.get_bulk_sms_campaign_details(
+                offset=offset, limit=limit,
+                name=name, status=status, sort_by=sort_by),
+            offset=offset, limit=limit, prefetch=prefetch, max_workers=max_workers,
+            model=Campaign if typed else None)
 
     def get_sms_campaign_sms_details(
             self, campaign_id: str, limit: int = None, offset: int = None, sort_by: str = None) -> dict:
@@ -866,9 +1452,34 @@ class Exotel:
         if sort_by is not None:
             data["sort_by"] = sort_by
 
-        return self.__call_api(
+        return self._call_api(
             "GET", "sms-campaigns/{campaign_id}/sms-details".format(campaign_id=campaign_id), data=data)
 
+    def iter_sms_campaign_sms_details(
+            self, campaign_id: str, limit: int = 100, offset: int = 0, sort_by: str = None, prefetch: bool = True,
+            max_workers: int = 1, typed: bool = False) -> Iterator[dict]:
+        """Lazily iterates over the SMS details of an SMS campaign, see :meth:`get_sms_campaign_sms_details`
+
+        Args:
+            campaign_id (str): ID of the campaign
+            limit (int, optional): Page size. Defaults to 100.
+            offset (int, optional): Offset of the first record. Defaults to 0.
+            sort_by (str, optional): Defaults to None.
+            prefetch (bool, optional): Fetch the next page in the background. Defaults to True.
+            max_workers (int, optional): Number of pages fetched concurrently, more than one plans the
+                offsets from the first page's total and drops records repeated across pages. Defaults to 1.
+            typed (bool, optional): Yield :class:`~exotelpy.models.SmsDetail` records instead of dicts. Defaults to False.
+
+        Returns:
+            Iterator[dict]: SMS detail records
+        """
+        return self._iter_records(
+            lambda offset, limit: self.get_sms_campaign_sms_details(
+                campaign_id, offset=offset, limit=limit,
+                sort_by=sort_by),
+            offset=offset, limit=limit, prefetch=prefetch, max_workers=max_workers,
+            model=SmsDetail if typed else None)
+
     def get_sms_details(self, sms_sid: str) -> dict:
         """https://developer.exotel.com/api/sms#sms-details
 
@@ -878,12 +1489,12 @@ class Exotel:
         Returns:
             dict: json object containing API response
         """
-        return self.__call_api(
+        return self._call_api(
             "GET", "SMS/Messages/{sms_sid}.json".format(sms_sid=sms_sid),
             version="v1")
 
     def send_bulk_sms(
-            self, from_: str, to: List[str],
+            self, from_: str, to: Iterable[str],
             body: str, encoding_type: str = None, priority: str = None,
             status_callback: str = None, dlt_entity_id: str = None, dlt_template_id: str = None,
             sms_type: str = None) -> dict:
@@ -892,7 +1503,7 @@ class Exotel:
 
         Args:
             from_ (str): Refer Exotel docs
-            to (List[str]): Refer Exotel docs
+            to (Iterable[str]): Refer Exotel docs
             body (str): Refer Exotel docs
             encoding_type (str, optional): Defaults to None.
             priority (str, optional): Defaults to None.
@@ -904,7 +1515,7 @@ class Exotel:
         Returns:
             dict: json object containing API response
         """
-        validate_list_of_nums(to)
+        to = validate_list_of_nums(to)
 
         data = {
             "From": from_,
@@ -930,7 +1541,49 @@ class Exotel:
         if sms_type is not None:
             data["SmsType"] = sms_type
 
-        return self.__call_api("POST", "Sms/send.json", version="v1", data=data)
+        return self._call_api("POST", "Sms/send.json", version="v1", data=data)
+
+    def send_bulk_sms_chunked(self, from_: str, to: Iterable[str], body: str,
+                              chunk_size: int = 100, max_workers: int = None,
+                              **kwargs) -> BulkSmsResult:
+        """
+        Sends the same SMS to a large number of recipients, in chunks sent concurrently
+
+        Each chunk is one :meth:`send_bulk_sms` request, going through the
+        client's rate limiter and retry policy. Every chunk is attempted even
+        when some of them fail, the failed ones are reported separately so
+        only their recipients have to be sent again.
+
+        Args:
+            from_ (str): Refer Exotel docs
+            to (Iterable[str]): E.164 formatted phone numbers
+            body (str): Refer Exotel docs
+            chunk_size (int, optional): Recipients per request. Defaults to 100.
+            max_workers (int, optional): Number of concurrent requests. Defaults to the client's max_workers.
+            **kwargs: accepts the rest of the arguments of send_bulk_sms
+
+        Returns:
+            BulkSmsResult: the accepted messages in recipient order and the failed chunks
+        """
+        to, chunks = self._sms_chunks(to, chunk_size, kwargs)
+        results = run_concurrently(
+            lambda chunk: self.send_bulk_sms(from_, chunk, body, **kwargs),
+            chunks, max_workers or self.max_workers)
+        return collect_sms_chunks(chunks, results)
+
+    @staticmethod
+    def _sms_chunks(to: Iterable[str], chunk_size: int, kwargs: dict) -> Tuple[List[str], List[List[str]]]:
+        """
+            Validates what every chunk would reject, before anything is sent
+
+            :meta private:
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size should be at least 1")
+        if kwargs.get("status_callback") is not None:
+            validate_url(kwargs["status_callback"])
+        to = validate_list_of_nums(to)
+        return to, list(batch_contacts(to, chunk_size))
 
     def get_all_exophones(self) -> dict:
         """Get a list of all the ExoPhone numbers that have been assigned to an account
@@ -939,7 +1592,7 @@ class Exotel:
         Returns:
             dict : json object containing API response
         """
-        return self.__call_api("GET", "IncomingPhoneNumbers", version="v2_beta")
+        return self._call_api("GET", "IncomingPhoneNumbers", version="v2_beta")
 
     def get_exophone_details(self, exophone_sid: str) -> dict:
         """Get the details of a specific ExoPhone number of an account
@@ -952,7 +1605,7 @@ class Exotel:
         Returns:
             dict: json object containing API response
         """
-        return self.__call_api("GET", f"IncomingPhoneNumbers/{exophone_sid}", version="v2_beta")
+        return self._call_api("GET", f"IncomingPhoneNumbers/{exophone_sid}", version="v2_beta")
 
     def get_exophone_heartbeat(self, exophone_sid: str) -> dict:
         """Get the details of a specific ExoPhone in your account including connectivity information
@@ -965,4 +1618,4 @@ class Exotel:
         Returns:
             dict: json object containing API response
         """
-        return self.__call_api("GET", f"incoming-phone-numbers/{exophone_sid}", version="v2")
+        return self._call_api("GET", f"incoming-phone-numbers/{exophone_sid}", version="v2")
@@ -1,22 +1,64 @@
-from typing import List
+import asyncio
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Union
 
-from .exceptions import ValidationError
-from .validators import validate_phone_number
+from .exceptions import *
+from .validators import ValidatedNumbers, validate_phone_numbers
 
+ENDPOINT_TEMPLATES = [
+    "contacts",
+    "contacts/{contact_sid}",
+    "lists",
+    "lists/{list_id}",
+    "lists/{list_id}/contacts",
+    "campaigns",
+    "campaigns/{campaign_id}",
+    "campaigns/{campaign_id}/call-details",
+    "sms-campaigns",
+    "sms-campaigns/{campaign_id}",
+    "sms-campaigns/{campaign_id}/sms-details",
+    "message-campaigns",
+    "Sms/send.json",
+    "SMS/Messages/{sms_sid}.json",
+    "IncomingPhoneNumbers",
+    "IncomingPhoneNumbers/{exophone_sid}",
+    "incoming-phone-numbers/{exophone_sid}",
+]
+
+
+def _template_matches(template: List[str], segments: List[str]) -> bool:
+    for pattern, segment in zip(template, segments):
+        if pattern.startswith("{"):
+            suffix = pattern[pattern.index("}") + 1:]
+            if not segment.endswith(suffix) or len(segment) == len(suffix):
+                return False
+        elif pattern != segment:
+            return False
+    return True
+
+
+_TEMPLATES = [(template, template.split("/")) for template in ENDPOINT_TEMPLATES]
 
-def validate_list_of_nums(numbers: List[str]):
-    if not isinstance(numbers, list):
-        raise ValueError("numbers argument should be a list of strings")
-    invalid = []
-    for num in numbers:
-        try:
-            validate_phone_number(num)
-        except ValidationError:
-            invalid.append(num)
 
-    if len(invalid) > 0:
-        raise ValidationError(
-            "Received invalid numbers as per E.164 format, please check")
+def endpoint_template(endpoint: str) -> str:
+    """
+        Maps an endpoint like "lists/abc/contacts" to its template
+        "lists/{list_id}/contacts", unknown endpoints are returned as is
+    """
+    segments = endpoint.strip("/").split("/")
+    for template, parts in _TEMPLATES:
+        if len(parts) == len(segments) and _template_matches(parts, segments):
+            return template
+    return endpoint
+
+
+def validate_list_of_nums(numbers: Iterable[str]) -> ValidatedNumbers:
+    if isinstance(numbers, (str, bytes)) or not hasattr(numbers, "__iter__"):
+        raise ValueError("numbers argument should be an iterable of strings")
+    return validate_phone_numbers(numbers)
 
 
 def get_error_description(data: dict, version: str = None):
@@ -30,6 +72,41 @@ def get_error_description(data: dict, version: str = None):
     return error_description
 
 
+def raise_for_status(status_code: int, data: dict, version: str = None):
+    # only these statuses are mapped without reading the body
+    if data is None and status_code not in (204, 403, 429) and status_code < 500:
+        raise UnexpectedResponse(
+            "Exotel API answered with status code {status} and a body that isn't JSON".format(
+                status=status_code), status_code)
+    if status_code == 401:
+        description = get_error_description(data)
+        raise AuthenticationFailed(description)
+    elif status_code == 403:
+        raise PermissionDenied(
+            "Your credentials are valid, but you don't have access to the requested resource.")
+    elif status_code == 402:
+        description = get_error_description(data)
+        raise PaymentRequired(description)
+    elif status_code == 429:
+        raise Throttled("Request was throttled.")
+    elif status_code == 400:
+        description = get_error_description(data, version=version)
+        raise ValidationError(description)
+    elif status_code == 404:
+        description = get_error_description(data, version=version)
+        raise NotFound(description)
+    elif status_code >= 500:
+        raise ServerError(
+            "Exotel API failed with status code {status}".format(status=status_code))
+
+
+def decode_json(response):
+    try:
+        return response.json()
+    except ValueError:
+        return None
+
+
 def get_contact_sids(data: dict) -> List[str]:
     sids = [i["data"]["sid"] for i in data["response"]]
     return sids
@@ -39,11 +116,108 @@ def get_list_id(data: dict) -> str:
     return data["response"][0]["data"]["list_id"]
 
 
-def batch_contacts(contacts: list, limit: int = 5000):
-    length = len(contacts)
-    if length % limit == 0:
-        times = length // limit
-    else:
-        times = (length // limit) + 1
-    for i in range(times):
-        yield contacts[i*limit:limit*(i+1)]
+def merge_batch_response(output: dict, response: dict) -> dict:
+    if output is None:
+        return deepcopy(response)
+    output["response"] += response["response"]
+    output["metadata"]["success"] += response["metadata"]["success"]
+    output["metadata"]["total"] += response["metadata"]["total"]
+    return output
+
+
+def is_streamed(numbers: Iterable) -> bool:
+    """
+        Whether numbers is a one-shot iterable, e.g. a generator or a file
+        reader, which is validated and batched on the fly
+    """
+    return numbers is not None and not isinstance(numbers, Sequence)
+
+
+def batch_contacts(contacts: Iterable, limit: Union[int, Callable[[], int]] = 5000):
+    """
+        Splits contacts into batches of limit, a callable limit is asked for
+        the size of every batch
+    """
+    size = limit if callable(limit) else lambda: limit
+    if not isinstance(contacts, Sequence):
+        iterator = iter(contacts)
+        batch = list(islice(iterator, size()))
+        while batch:
+            yield batch
+            batch = list(islice(iterator, size()))
+        return
+
+    start, length = 0, len(contacts)
+    while start < length:
+        end = start + size()
+        yield contacts[start:end]
+        start = end
+
+
+def validated_batches(numbers: Iterable[str],
+                      limit: Union[int, Callable[[], int]] = 5000) -> Iterator[ValidatedNumbers]:
+    """
+        Batches numbers and validates each batch as it is reached, so only
+        one batch of a streamed source is held in memory
+
+        Raises:
+            InvalidPhoneNumbers: raised for the first batch holding invalid numbers, positions count from the first number
+    """
+    start = 0
+    for batch in batch_contacts(numbers, limit):
+        try:
+            yield validate_list_of_nums(batch)
+        except InvalidPhoneNumbers as e:
+            raise InvalidPhoneNumbers([start + i for i in e.positions], e.numbers) from None
+        start += len(batch)
+
+
+def offset_batches(batches: Iterable[list]):
+    """
+        Yields (position of the first contact, batch) for every batch
+    """
+    start = 0
+    for batch in batches:
+        yield start, batch
+        start += len(batch)
+
+
+def run_concurrently(func: Callable, items: Iterable, max_workers: int) -> list:
+    """
+        Calls func on every item with at most max_workers threads, results
+        are returned in input order with the raised exception in place of
+        failed items
+    """
+    def call(item):
+        try:
+            return func(item)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(call, items))
+
+
+async def gather_bounded(func: Callable, items: Iterable, max_workers: int) -> list:
+    """
+        asyncio counterpart of :func:`run_concurrently`
+    """
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def call(item):
+        async with semaphore:
+            return await func(item)
+
+    return await asyncio.gather(*(call(item) for item in items), return_exceptions=True)
+
+
+def collect_failures(items: list, results: list, action: str,
+                     return_exceptions: bool = False) -> list:
+    errors = {item: result for item, result in zip(items, results)
+              if isinstance(result, Exception)}
+    if errors and not return_exceptions:
+        raise BulkOperationFailed(
+            "{action} failed for {failed} of {total} items".format(
+                action=action, failed=len(errors), total=len(items)),
+            results=results, errors=errors)
+    return results
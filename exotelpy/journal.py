@@ -0,0 +1,232 @@
+import hashlib
+import json
+import os
+import threading
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from .helpers import batch_contacts, offset_batches
+
+
+def _digest(numbers: List[str]) -> str:
+    digest = hashlib.sha1()
+    for number in numbers:
+        digest.update(number.encode())
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+class Job:
+    """
+    Checkpoints of a single journaled list upload
+
+    Every completed step is appended to the job's file before the next one
+    starts: the list creation, the contact sids of each batch (keyed by the
+    position of its first number) and each batch attached to the list. A
+    rollback is recorded before it starts deleting, a rolled back job can
+    only be rolled back again.
+
+    :meta private:
+    """
+
+    def __init__(self, journal: "Journal", job_id: str):
+        self.journal = journal
+        self.job_id = job_id
+        self.path = journal.path(job_id)
+        self.list_id = None
+        self.list_name = None
+        self.count = None
+        self.digest = None
+        self.contacts: Dict[int, List[str]] = {}
+        self.reused: Dict[int, List[str]] = {}
+        self.attached = set()
+        self.campaign = None
+        self.rolled_back = False
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        valid = 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    break
+                self._apply(event)
+                valid += len(line)
+        if valid < os.path.getsize(self.path):
+            # drop the line torn by a crash while it was being written
+            with open(self.path, "r+b") as f:
+                f.truncate(valid)
+
+    def _apply(self, event: dict):
+        kind = event["event"]
+        if kind == "list":
+            self.list_id = event["list_id"]
+            self.list_name = event["name"]
+            self.count = event["count"]
+            self.digest = event["digest"]
+        elif kind == "contacts":
+            self.contacts[event["start"]] = event["sids"]
+            if event.get("reused"):
+                self.reused[event["start"]] = event["reused"]
+        elif kind == "attached":
+            self.attached.add(event["start"])
+        elif kind == "campaign":
+            self.campaign = event["response"]
+        elif kind == "rollback":
+            self.rolled_back = True
+
+    def _record(self, **event):
+        line = json.dumps(event) + "\n"
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                if self.journal.fsync:
+                    os.fsync(f.fileno())
+            self._apply(event)
+
+    @property
+    def started(self) -> bool:
+        return self.list_id is not None
+
+    def start(self, list_id: str, name: str, numbers: Optional[List[str]]):
+        numbers = numbers or []
+        self._record(event="list", list_id=list_id, name=name,
+                     count=len(numbers), digest=_digest(numbers))
+
+    def check(self, numbers: Optional[List[str]]):
+        """
+            Raises ValueError unless the job can be resumed with numbers: it
+            wasn't rolled back and numbers are the ones it started with
+        """
+        if self.rolled_back:
+            raise ValueError(
+                "Job {job} was rolled back, finish the rollback with rollback_job before reusing its id".format(
+                    job=self.job_id))
+        numbers = numbers or []
+        if len(numbers) != self.count or _digest(numbers) != self.digest:
+            raise ValueError(
+                "Job {job} was started with different numbers, it can't be resumed with these".format(
+                    job=self.job_id))
+
+    def record_contacts(self, start: int, sids: List[str], reused: List[str] = ()):
+        event = {"event": "contacts", "start": start, "sids": sids}
+        if reused:
+            event["reused"] = list(reused)
+        self._record(**event)
+
+    def record_attached(self, start: int):
+        self._record(event="attached", start=start)
+
+    def record_campaign(self, response: dict):
+        self._record(event="campaign", response=response)
+
+    def record_rollback(self):
+        self._record(event="rollback")
+
+    def remaining(self, numbers: List[str], limit: Union[int, Callable[[], int]] = 5000
+                  ) -> Iterator[Tuple[int, List[str]]]:
+        """
+            Yields (start, numbers) of the batches that still have to be
+            attached; batches whose contacts were created keep their bounds
+        """
+        starts = sorted(self.contacts)
+        position, total = 0, len(numbers)
+        while position < total:
+            if position in self.contacts:
+                size = len(self.contacts[position])
+                if position not in self.attached:
+                    yield position, numbers[position:position + size]
+                position += size
+                continue
+            end = next((start for start in starts if start > position), total)
+            for offset, chunk in offset_batches(batch_contacts(numbers[position:end], limit)):
+                yield position + offset, chunk
+            position = end
+
+    def created_sids(self) -> List[str]:
+        """
+            Sids of the contacts this job created, leaving out reused ones
+        """
+        sids = []
+        for start in sorted(self.contacts):
+            reused = set(self.reused.get(start, ()))
+            sids.extend(sid for sid in self.contacts[start] if sid not in reused)
+        return sids
+
+    def attached_response(self) -> Optional[dict]:
+        """
+            Stands in for the add_contacts_to_list responses of the batches
+            attached before the job was resumed
+        """
+        if not self.attached:
+            return None
+        records = [
+            {"code": 200, "status": "success", "data": {"sid": sid, "list_id": self.list_id}}
+            for start in sorted(self.attached) for sid in self.contacts[start]
+        ]
+        return {"metadata": {"success": len(records), "failed": 0, "total": len(records)},
+                "response": records}
+
+    def list_response(self) -> dict:
+        return {"response": [{"code": 200, "status": "success",
+                              "data": {"sid": self.list_id, "name": self.list_name}}]}
+
+    def discard(self):
+        self.journal.discard(self.job_id)
+
+
+class Journal:
+    """
+    Directory of append-only checkpoint files for resumable uploads
+
+    Pass a job id to :meth:`exotelpy.Exotel.create_list` or one of the
+    ``*_with_list`` helpers and every completed step is written to
+    ``<directory>/<job_id>.jsonl``. Calling again with the same job id and
+    numbers after a crash picks up at the last checkpoint, and
+    :meth:`exotelpy.Exotel.rollback_job` deletes exactly what the job
+    created::
+
+        client = Exotel(sid, key, token, journal=Journal("journal/"))
+        client.create_campaign_with_list(numbers, "audience", caller_id, app_id, job_id="march-drive")
+
+    Args:
+        directory (str): Where the checkpoint files are kept, created when missing
+        fsync (bool, optional): Flush every checkpoint to disk before moving on. Defaults to True.
+    """
+
+    def __init__(self, directory: str, fsync: bool = True):
+        self.directory = directory
+        self.fsync = fsync
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, job_id: str) -> str:
+        if not job_id or os.sep in job_id or (os.altsep and os.altsep in job_id):
+            raise ValueError("Invalid job id {job_id!r}".format(job_id=job_id))
+        return os.path.join(self.directory, "{job_id}.jsonl".format(job_id=job_id))
+
+    def open(self, job_id: str) -> Job:
+        return Job(self, job_id)
+
+    def discard(self, job_id: str):
+        """
+            Removes the checkpoints of a job
+        """
+        try:
+            os.remove(self.path(job_id))
+        except FileNotFoundError:
+            pass
+
+    def jobs(self) -> List[str]:
+        """
+            Ids of the jobs with checkpoints
+        """
+        return sorted(name[:-len(".jsonl")] for name in os.listdir(self.directory)
+                      if name.endswith(".jsonl"))
+
+    def __repr__(self) -> str:
+        return "Journal(directory='{directory}')".format(directory=self.directory)
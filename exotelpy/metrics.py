@@ -0,0 +1,183 @@
+import threading
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, Iterable, Tuple
+
+from .helpers import endpoint_template
+
+DEFAULT_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class EndpointStats:
+    """
+        Counters of a single method and endpoint template
+
+        :meta private:
+    """
+    __slots__ = ("count", "latency_sum", "buckets", "request_bytes",
+                 "response_bytes", "retries", "statuses")
+
+    def __init__(self, size: int):
+        self.count = 0
+        self.latency_sum = 0.0
+        self.buckets = [0] * size
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.retries = 0
+        self.statuses = Counter()
+
+    def copy(self) -> "EndpointStats":
+        other = EndpointStats(0)
+        for attr in self.__slots__:
+            value = getattr(self, attr)
+            setattr(other, attr, value.copy() if hasattr(value, "copy") else value)
+        return other
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    return ",".join('{k}="{v}"'.format(k=k, v=_escape(str(v))) for k, v in labels.items())
+
+
+class Metrics:
+    """
+    Per-endpoint request instrumentation of :class:`exotelpy.Exotel`
+
+    Every HTTP attempt is recorded under its method and endpoint template
+    (e.g. ``POST lists/{list_id}/contacts``): request count, latency
+    histogram, request and response bytes, retries and status codes.
+    Transport failures are counted under the "error" status::
+
+        metrics = Metrics()
+        client = Exotel(sid, key, token, metrics=metrics)
+        ...
+        metrics.snapshot()
+        metrics.to_prometheus()
+
+    Args:
+        buckets (Iterable[float], optional): Upper bounds of the latency histogram in seconds.
+        namespace (str, optional): Prefix of the exported metric names. Defaults to "exotel".
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS, namespace: str = "exotel"):
+        self.bounds = tuple(sorted(buckets))
+        self.namespace = namespace
+        self._stats: Dict[Tuple[str, str], EndpointStats] = {}
+        self._gauges: Dict[Tuple[str, str], float] = {}
+        self._lock = threading.Lock()
+
+    def record(self, method: str, endpoint: str, status_code, latency: float,
+               request_bytes: int = 0, response_bytes: int = 0, retried: bool = False):
+        """
+            Records one HTTP attempt, status_code is None for transport failures
+        """
+        key = (method, endpoint_template(endpoint))
+        index = bisect_left(self.bounds, latency)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = EndpointStats(len(self.bounds) + 1)
+            stats.count += 1
+            stats.latency_sum += latency
+            stats.buckets[index] += 1
+            stats.request_bytes += request_bytes
+            stats.response_bytes += response_bytes
+            stats.retries += retried
+            stats.statuses["error" if status_code is None else str(status_code)] += 1
+
+    def set_gauge(self, name: str, value: float, endpoint: str = ""):
+        """
+            Publishes a point-in-time value, e.g. a tuned batch size
+        """
+        with self._lock:
+            self._gauges[(name, endpoint)] = value
+
+    def snapshot(self) -> dict:
+        """
+            Returns a copy of the collected metrics keyed by "METHOD endpoint"
+        """
+        with self._lock:
+            endpoints = {}
+            for (method, endpoint), stats in self._stats.items():
+                cumulative, total = {}, 0
+                for bound, count in zip(self.bounds + (float("inf"),), stats.buckets):
+                    total += count
+                    cumulative[bound] = total
+                endpoints["{m} {e}".format(m=method, e=endpoint)] = {
+                    "count": stats.count,
+                    "latency_sum": stats.latency_sum,
+                    "latency_mean": stats.latency_sum / stats.count,
+                    "latency_buckets": cumulative,
+                    "request_bytes": stats.request_bytes,
+                    "response_bytes": stats.response_bytes,
+                    "retries": stats.retries,
+                    "statuses": dict(stats.statuses),
+                }
+            gauges = {"{n} {e}".format(n=name, e=endpoint).strip(): value
+                      for (name, endpoint), value in self._gauges.items()}
+        return {"endpoints": endpoints, "gauges": gauges}
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+            self._gauges.clear()
+
+    def to_prometheus(self) -> str:
+        """
+            Renders the metrics in the Prometheus text exposition format
+        """
+        ns = self.namespace
+        with self._lock:
+            items = [(key, stats.copy()) for key, stats in self._stats.items()]
+            gauges = dict(self._gauges)
+
+        lines = []
+
+        def header(name, kind, help_text):
+            lines.append("# HELP {ns}_{name} {help}".format(ns=ns, name=name, help=help_text))
+            lines.append("# TYPE {ns}_{name} {kind}".format(ns=ns, name=name, kind=kind))
+
+        header("requests_total", "counter", "HTTP attempts by status code")
+        for (method, endpoint), stats in items:
+            for status, count in sorted(stats.statuses.items()):
+                lines.append("{ns}_requests_total{{{labels}}} {value}".format(
+                    ns=ns, labels=_labels(method=method, endpoint=endpoint, status=status),
+                    value=count))
+
+        header("request_duration_seconds", "histogram", "Latency of HTTP attempts")
+        for (method, endpoint), stats in items:
+            total = 0
+            for bound, count in zip(self.bounds + (float("inf"),), stats.buckets):
+                total += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append("{ns}_request_duration_seconds_bucket{{{labels}}} {value}".format(
+                    ns=ns, labels=_labels(method=method, endpoint=endpoint, le=le), value=total))
+            labels = _labels(method=method, endpoint=endpoint)
+            lines.append("{ns}_request_duration_seconds_sum{{{labels}}} {value}".format(
+                ns=ns, labels=labels, value=stats.latency_sum))
+            lines.append("{ns}_request_duration_seconds_count{{{labels}}} {value}".format(
+                ns=ns, labels=labels, value=stats.count))
+
+        for name, attr, help_text in (
+                ("request_bytes_total", "request_bytes", "Bytes sent in request bodies"),
+                ("response_bytes_total", "response_bytes", "Bytes received in response bodies"),
+                ("retries_total", "retries", "HTTP attempts that were retried")):
+            header(name, "counter", help_text)
+            for (method, endpoint), stats in items:
+                lines.append("{ns}_{name}{{{labels}}} {value}".format(
+                    ns=ns, name=name, labels=_labels(method=method, endpoint=endpoint),
+                    value=getattr(stats, attr)))
+
+        for name in sorted({name for name, _ in gauges}):
+            header(name, "gauge", name.replace("_", " "))
+            for (gauge, endpoint), value in sorted(gauges.items()):
+                if gauge != name:
+                    continue
+                labels = "{{{l}}}".format(l=_labels(endpoint=endpoint)) if endpoint else ""
+                lines.append("{ns}_{name}{labels} {value}".format(
+                    ns=ns, name=name, labels=labels, value=value))
+
+        return "\n".join(lines) + "\n"
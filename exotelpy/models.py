@@ -0,0 +1,114 @@
+from datetime import datetime
+from typing import Iterable, Iterator, List, Union
+
+
+def _parse_datetime(value):
+    if not isinstance(value, str):
+        return value
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return value
+
+
+class Record:
+    """
+    Read-only typed view over a record returned by Exotel API
+
+    Declared fields are slots filled from the raw record on first access,
+    date fields are parsed into datetime objects. Fields that aren't
+    declared are still reachable as attributes or with ``record["key"]``.
+    A record keeps its raw dict alongside the fields read so far, so it
+    takes a little more memory than the dict alone; what it saves is the
+    response envelope, which isn't kept.
+    """
+    __slots__ = ("_raw",)
+    _fields = ()
+    _datetime_fields = ("date_created", "date_updated", "send_at", "end_at",
+                        "start_time", "end_time")
+
+    def __init__(self, raw: dict):
+        if isinstance(raw.get("data"), dict) and "status" in raw:
+            raw = raw["data"]
+        object.__setattr__(self, "_raw", raw)
+
+    def __getattr__(self, name: str):
+        raw = object.__getattribute__(self, "_raw")
+        if name not in raw and name not in self._fields:
+            raise AttributeError("{cls} has no field {name}".format(
+                cls=type(self).__name__, name=name))
+        value = raw.get(name)
+        if name in self._datetime_fields:
+            value = _parse_datetime(value)
+        if name in self._fields:
+            object.__setattr__(self, name, value)
+        return value
+
+    def __setattr__(self, name, value):
+        raise AttributeError("{cls} is read-only".format(cls=type(self).__name__))
+
+    def __getitem__(self, key: str):
+        return self._raw[key]
+
+    def __reduce__(self):
+        # rebuilt from the raw record, fields read so far are parsed again on access
+        return type(self), (self._raw,)
+
+    def __eq__(self, other) -> bool:
+        return type(self) is type(other) and self._raw == other._raw
+
+    def to_dict(self) -> dict:
+        return self._raw
+
+    @classmethod
+    def from_response(cls, response: dict) -> Union["Record", List["Record"]]:
+        """
+            Wraps the record(s) of an API response
+        """
+        data = response["response"]
+        if isinstance(data, list):
+            return [cls(item) for item in data]
+        return cls(data)
+
+    @classmethod
+    def wrap(cls, records: Iterable[dict]) -> Iterator["Record"]:
+        return map(cls, records)
+
+    def __repr__(self) -> str:
+        key = self._fields[0] if self._fields else None
+        return "{cls}({key}='{value}')".format(
+            cls=type(self).__name__, key=key, value=self._raw.get(key))
+
+
+class Contact(Record):
+    """Contact, see :meth:`exotelpy.Exotel.iter_list_contacts`"""
+    __slots__ = _fields = (
+        "sid", "number", "first_name", "last_name", "company_name", "email",
+        "list_id", "date_created", "date_updated", "uri")
+
+
+class ContactList(Record):
+    """Contact list, see :meth:`exotelpy.Exotel.iter_bulk_lists`"""
+    __slots__ = _fields = (
+        "sid", "name", "tag", "contact_count", "date_created", "date_updated", "uri")
+
+
+class Campaign(Record):
+    """Call or SMS campaign, see :meth:`exotelpy.Exotel.iter_bulk_campaign_details`"""
+    __slots__ = _fields = (
+        "id", "name", "status", "type", "campaign_type", "caller_id", "lists",
+        "schedule", "stats", "date_created", "date_updated", "uri")
+
+
+class CallDetail(Record):
+    """Call of a campaign, see :meth:`exotelpy.Exotel.iter_campaign_call_details`"""
+    __slots__ = _fields = (
+        "call_sid", "number", "status", "duration", "caller_id",
+        "date_created", "date_updated", "uri")
+
+
+class SmsDetail(Record):
+    """SMS of an SMS campaign, see :meth:`exotelpy.Exotel.iter_sms_campaign_sms_details`"""
+    __slots__ = _fields = (
+        "sms_sid", "number", "status", "detailed_status", "sender_id",
+        "date_created", "date_updated", "uri")
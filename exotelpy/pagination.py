@@ -0,0 +1,188 @@
+import asyncio
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Iterable, Iterator, Optional
+
+
+def _has_more(page: dict, offset: int, limit: int) -> bool:
+    count = len(page["response"])
+    total = page.get("metadata", {}).get("total")
+    if count == 0:
+        return False
+    if total is not None:
+        return offset + count < total
+    return count >= limit
+
+
+def _records(page: dict) -> list:
+    return [item.get("data", item) for item in page["response"]]
+
+
+def record_key(record: dict) -> Optional[str]:
+    """
+        Identifier used to drop records repeated across pages
+    """
+    for field in ("sid", "call_sid", "sms_sid", "id"):
+        if record.get(field) is not None:
+            return record[field]
+    return None
+
+
+class _Deduplicator:
+    def __init__(self, key: Callable[[dict], Optional[str]]):
+        self.key = key
+        self.seen = set()
+
+    def __call__(self, page: dict) -> Iterator[dict]:
+        return self.filter(_records(page))
+
+    def filter(self, records: Iterable[dict]) -> Iterator[dict]:
+        for record in records:
+            value = self.key(record) if self.key is not None else None
+            if value is not None:
+                if value in self.seen:
+                    continue
+                self.seen.add(value)
+            yield record
+
+
+def _remaining_offsets(first: dict, offset: int, limit: int) -> Optional[Iterable[int]]:
+    total = first.get("metadata", {}).get("total")
+    count = len(first["response"])
+    if total is None or count == 0:
+        return None
+    # Exotel may cap the page size below the requested limit
+    step = min(limit, count)
+    return range(offset + count, total, step)
+
+
+def iter_records(fetch: Callable[[int, int], dict], offset: int = 0,
+                 limit: int = 100, prefetch: bool = True) -> Iterator[dict]:
+    """
+        Yields the records of an offset/limit endpoint page by page
+
+        fetch(offset, limit) returns a single page. With prefetch the next
+        page is requested on a background thread while the current one is
+        consumed, so at most two pages are held in memory.
+    """
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+
+    def submit(page_offset: int) -> Future:
+        if executor is not None:
+            return executor.submit(fetch, page_offset, limit)
+        future = Future()
+        future.set_result(fetch(page_offset, limit))
+        return future
+
+    try:
+        future = submit(offset)
+        while future is not None:
+            page = future.result()
+            future = None
+            more = _has_more(page, offset, limit)
+            if more:
+                offset += len(page["response"])
+                if prefetch:
+                    future = submit(offset)
+            for record in _records(page):
+                yield record
+            if more and future is None:
+                future = submit(offset)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_records(fetch: Callable, offset: int = 0, limit: int = 100,
+                        prefetch: bool = True) -> AsyncIterator[dict]:
+    """
+        asyncio counterpart of :func:`iter_records`, fetch returns an awaitable
+    """
+    task = asyncio.ensure_future(fetch(offset, limit))
+    try:
+        while task is not None:
+            page = await task
+            task = None
+            more = _has_more(page, offset, limit)
+            if more:
+                offset += len(page["response"])
+                if prefetch:
+                    task = asyncio.ensure_future(fetch(offset, limit))
+            for record in _records(page):
+                yield record
+            if more and task is None:
+                task = asyncio.ensure_future(fetch(offset, limit))
+    finally:
+        if task is not None:
+            task.cancel()
+
+
+def iter_records_parallel(fetch: Callable[[int, int], dict], offset: int = 0,
+                          limit: int = 100, max_workers: int = 4,
+                          key: Callable[[dict], Optional[str]] = record_key) -> Iterator[dict]:
+    """
+        Yields the records of an offset/limit endpoint in order, fetching up
+        to max_workers pages concurrently
+
+        The offsets are planned from the total in the first page's metadata.
+        Records whose key was already yielded, because rows shifted between
+        pages while fetching, are dropped.
+    """
+    dedup = _Deduplicator(key)
+    first = fetch(offset, limit)
+    offsets = _remaining_offsets(first, offset, limit)
+    yield from dedup(first)
+
+    if offsets is None:
+        if _has_more(first, offset, limit):
+            yield from dedup.filter(
+                iter_records(fetch, offset + len(first["response"]), limit))
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        try:
+            for page_offset in offsets:
+                if len(pending) >= max_workers:
+                    yield from dedup(pending.popleft().result())
+                pending.append(executor.submit(fetch, page_offset, limit))
+            while pending:
+                yield from dedup(pending.popleft().result())
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+async def aiter_records_parallel(fetch: Callable, offset: int = 0, limit: int = 100,
+                                 max_workers: int = 4,
+                                 key: Callable[[dict], Optional[str]] = record_key
+                                 ) -> AsyncIterator[dict]:
+    """
+        asyncio counterpart of :func:`iter_records_parallel`
+    """
+    dedup = _Deduplicator(key)
+    first = await fetch(offset, limit)
+    offsets = _remaining_offsets(first, offset, limit)
+    for record in dedup(first):
+        yield record
+
+    if offsets is None:
+        if _has_more(first, offset, limit):
+            async for record in aiter_records(fetch, offset + len(first["response"]), limit):
+                for unique in dedup.filter([record]):
+                    yield unique
+        return
+
+    pending = deque()
+    try:
+        for page_offset in offsets:
+            if len(pending) >= max_workers:
+                for record in dedup(await pending.popleft()):
+                    yield record
+            pending.append(asyncio.ensure_future(fetch(page_offset, limit)))
+        while pending:
+            for record in dedup(await pending.popleft()):
+                yield record
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,124 @@
+import threading
+import time
+from typing import Callable, Dict, List
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket whose rate adapts to throttling
+
+    The rate is halved (by default) every time Exotel answers with 429 and
+    then recovers linearly towards the configured rate, so a bulk job settles
+    just below the sustainable throughput instead of oscillating around it.
+
+    Args:
+        rate (float): Requests per second
+        capacity (float, optional): Maximum burst size. Defaults to one second worth of requests.
+        decrease (float, optional): Factor applied to the rate on throttling. Defaults to 0.5.
+        recovery (float, optional): Fraction of the configured rate regained per second. Defaults to 0.02.
+        min_rate (float, optional): Floor of the adapted rate. Defaults to 0.1.
+    """
+
+    def __init__(self, rate: float, capacity: float = None, decrease: float = 0.5,
+                 recovery: float = 0.02, min_rate: float = 0.1,
+                 clock: Callable[[], float] = time.monotonic):
+        if rate <= 0:
+            raise ValueError("rate should be a positive number")
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self.decrease = decrease
+        self.recovery = recovery
+        self.min_rate = min(min_rate, rate)
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = self._clock()
+        elapsed = now - self._updated
+        self._updated = now
+        if self.rate < self.base_rate:
+            self.rate = min(self.base_rate,
+                            self.rate + self.base_rate * self.recovery * elapsed)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+            Takes tokens from the bucket and returns how many seconds the
+            caller has to wait before sending
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def throttled(self):
+        """Slows the bucket down after a 429 response"""
+        with self._lock:
+            self._refill()
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            self._tokens = min(self._tokens, 0.0)
+
+    def __repr__(self) -> str:
+        return "TokenBucket(rate={rate:.2f}, base_rate={base}, capacity={capacity})".format(
+            rate=self.rate, base=self.base_rate, capacity=self.capacity)
+
+
+class RateLimiter:
+    """
+    Shapes outgoing requests of :class:`exotelpy.Exotel` before they are sent
+
+    A request draws from the bucket of its API version and from the bucket of
+    its endpoint family (the first path segment of the endpoint, matched
+    case-insensitively, e.g. "contacts", "lists", "campaigns" or "sms"), when
+    a rate is configured for them::
+
+        limiter = RateLimiter(version_rates={"v1": 3}, endpoint_rates={"contacts": 10})
+        client = Exotel(sid, key, token, rate_limiter=limiter)
+
+    Args:
+        version_rates (Dict[str, float], optional): Requests per second for "v1", "v2" and "v2_beta". Defaults to None.
+        endpoint_rates (Dict[str, float], optional): Requests per second per endpoint family. Defaults to None.
+        **bucket_options: passed on to every :class:`TokenBucket`
+    """
+
+    def __init__(self, version_rates: Dict[str, float] = None,
+                 endpoint_rates: Dict[str, float] = None, **bucket_options):
+        self.versions = {
+            version: TokenBucket(rate, **bucket_options)
+            for version, rate in (version_rates or {}).items()}
+        self.endpoints = {
+            family.lower(): TokenBucket(rate, **bucket_options)
+            for family, rate in (endpoint_rates or {}).items()}
+
+    @staticmethod
+    def endpoint_family(endpoint: str) -> str:
+        return endpoint.strip("/").split("/")[0].lower()
+
+    def buckets(self, version: str, endpoint: str) -> List[TokenBucket]:
+        buckets = []
+        if version in self.versions:
+            buckets.append(self.versions[version])
+        family = self.endpoint_family(endpoint)
+        if family in self.endpoints:
+            buckets.append(self.endpoints[family])
+        return buckets
+
+    def reserve(self, version: str, endpoint: str) -> float:
+        """
+            Returns the number of seconds to wait before sending the request
+        """
+        return max([bucket.reserve() for bucket in self.buckets(version, endpoint)],
+                   default=0.0)
+
+    def feedback(self, version: str, endpoint: str, status_code: int):
+        """
+            Adapts the rates of the request's buckets to the response status
+        """
+        if status_code == 429:
+            for bucket in self.buckets(version, endpoint):
+                bucket.throttled()
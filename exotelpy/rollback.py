@@ -0,0 +1,159 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from .exceptions import NotFound
+
+
+class RollbackHandle:
+    """
+    Progress of reverting the list and contacts of a failed ``*_with_list`` call
+
+    The list and the contacts are deleted concurrently. Once the time budget
+    is spent no new deletes are started; the requests in flight still
+    finish, and the contacts that weren't attempted are reported as
+    skipped. A background rollback's handle is reachable from the raised
+    exception::
+
+        try:
+            client.create_campaign_with_list(numbers, "audience", caller_id, app_id)
+        except Exception as e:
+            e.rollback.wait(60)
+            print(e.rollback.progress())
+
+    Attributes:
+        list_id (str): List being deleted
+        total (int): Number of contacts to delete
+        deleted (int): Contacts deleted so far
+        errors (Dict[str, Exception]): Failed deletes keyed by list id or contact sid
+        skipped (List[str]): Contact sids left alone because the time budget ran out
+        task (asyncio.Task): Background rollback of :class:`exotelpy.AsyncExotel`, await it to wait for the rollback
+    """
+
+    def __init__(self, list_id: str, contact_sids: List[str], timeout: float = None,
+                 on_done: Callable[["RollbackHandle"], None] = None):
+        self.list_id = list_id
+        self.contact_sids = contact_sids
+        self.total = len(contact_sids)
+        self.deleted = 0
+        self.list_deleted = False
+        self.errors: Dict[str, Exception] = {}
+        self.skipped: List[str] = []
+        self.deadline = time.monotonic() + timeout if timeout is not None else None
+        self.task = None
+        self._on_done = on_done
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._finished = threading.Event()
+
+    def expired(self) -> bool:
+        return self._cancelled or (self.deadline is not None and time.monotonic() >= self.deadline)
+
+    def cancel(self):
+        """Stops starting new deletes"""
+        self._cancelled = True
+
+    @property
+    def done(self) -> bool:
+        return self._finished.is_set()
+
+    @property
+    def complete(self) -> bool:
+        """Whether the list and every contact were deleted"""
+        return self.done and self.list_deleted and self.deleted == self.total
+
+    def wait(self, timeout: float = None) -> bool:
+        """
+            Blocks until the rollback finished or timeout seconds passed, returns done
+        """
+        return self._finished.wait(timeout)
+
+    def progress(self) -> dict:
+        with self._lock:
+            return {
+                "list_id": self.list_id,
+                "list_deleted": self.list_deleted,
+                "total": self.total,
+                "deleted": self.deleted,
+                "failed": len(self.errors),
+                "skipped": len(self.skipped),
+                "done": self.done,
+            }
+
+    def attempt(self, key: str) -> bool:
+        """
+            Whether the delete of key should still be started, records it as skipped otherwise
+
+            :meta private:
+        """
+        if not self.expired():
+            return True
+        if key != self.list_id:
+            with self._lock:
+                self.skipped.append(key)
+        return False
+
+    def succeeded(self, key: str):
+        """:meta private:"""
+        with self._lock:
+            if key == self.list_id:
+                self.list_deleted = True
+            else:
+                self.deleted += 1
+
+    def failed(self, key: str, error: Exception):
+        """:meta private:"""
+        with self._lock:
+            self.errors[key] = error
+
+    def finish(self):
+        """:meta private:"""
+        self._finished.set()
+        if self._on_done is not None:
+            self._on_done(self)
+
+    def run(self, delete_list: Callable[[str], dict], delete_contact: Callable[[str], dict],
+            max_workers: int):
+        """
+            Deletes the list and the contacts on a thread pool
+
+            :meta private:
+        """
+        def delete(item):
+            key, func = item
+            if not self.attempt(key):
+                return
+            try:
+                func(key)
+            except NotFound:
+                # already gone, e.g. deleted by an earlier, partial rollback
+                self.succeeded(key)
+            except Exception as e:
+                self.failed(key, e)
+            else:
+                self.succeeded(key)
+
+        items = [(self.list_id, delete_list)] + [(sid, delete_contact) for sid in self.contact_sids]
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for _ in executor.map(delete, items):
+                    pass
+        finally:
+            self.finish()
+
+    def __repr__(self) -> str:
+        return "RollbackHandle(list_id='{list_id}', deleted={deleted}, total={total}, done={done})".format(
+            list_id=self.list_id, deleted=self.deleted, total=self.total, done=self.done)
+
+
+def attach_rollback(error: BaseException, handle: Optional[RollbackHandle]):
+    """
+        Exposes the rollback of a failed call on the raised exception
+
+        :meta private:
+    """
+    try:
+        error.rollback = handle
+    except AttributeError:
+        pass
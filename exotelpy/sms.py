@@ -0,0 +1,292 @@
+import inspect
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import zip_longest
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .exceptions import SmsRejected
+from .helpers import validate_list_of_nums
+from .validators import validate_url
+
+logger = logging.getLogger("exotelpy")
+
+
+class FailedChunk:
+    """
+    Recipients of a :meth:`exotelpy.Exotel.send_bulk_sms_chunked` chunk that weren't accepted
+
+    Attributes:
+        index (int): Position of the chunk, starting at 0
+        to (List[str]): Recipients to retry, the whole chunk when its request failed
+        error (Exception): Exception raised by the chunk's request, None when
+            Exotel accepted the request but rejected some of its recipients
+        responses (list): Per-recipient items Exotel returned for the rejected recipients
+    """
+    __slots__ = ("index", "to", "error", "responses")
+
+    def __init__(self, index: int, to: List[str], error: Optional[Exception] = None,
+                 responses: list = None):
+        self.index = index
+        self.to = to
+        self.error = error
+        self.responses = responses or []
+
+    def __repr__(self) -> str:
+        return "FailedChunk(index={index}, to={count} numbers, error={error!r})".format(
+            index=self.index, count=len(self.to), error=self.error)
+
+
+class BulkSmsResult:
+    """
+    Merged outcome of the chunks of :meth:`exotelpy.Exotel.send_bulk_sms_chunked`
+
+    Attributes:
+        total (int): Number of recipients
+        messages (List[dict]): SMSMessage of every accepted recipient, in recipient order
+        failed_chunks (List[FailedChunk]): Chunks with recipients that weren't accepted, in chunk order
+    """
+
+    def __init__(self, total: int):
+        self.total = total
+        self.messages: List[dict] = []
+        self.failed_chunks: List[FailedChunk] = []
+
+    @property
+    def success(self) -> int:
+        return len(self.messages)
+
+    @property
+    def failed(self) -> int:
+        return self.total - self.success
+
+    def sids(self) -> List[str]:
+        """
+            Sids of the accepted messages, in recipient order
+        """
+        return [message["Sid"] for message in self.messages]
+
+    def failed_recipients(self) -> List[str]:
+        """
+            Recipients to send again, so only they are retried::
+
+                result = client.send_bulk_sms_chunked(from_, numbers, body)
+                if result.failed_chunks:
+                    retried = client.send_bulk_sms_chunked(from_, result.failed_recipients(), body)
+        """
+        return [number for chunk in self.failed_chunks for number in chunk.to]
+
+    def __repr__(self) -> str:
+        return "BulkSmsResult(success={success}, failed={failed}, failed_chunks={chunks})".format(
+            success=self.success, failed=self.failed, chunks=len(self.failed_chunks))
+
+
+def recipient_results(to: List[str], response) -> Iterator[Tuple[str, Optional[dict], object]]:
+    """
+        Pairs each recipient of a send_bulk_sms request with its SMSMessage,
+        None when it was rejected, and the item Exotel returned for it
+
+        :meta private:
+    """
+    # a single recipient may be answered with the bare item
+    items = response if isinstance(response, list) else [response]
+    for number, item in zip_longest(to, items[:len(to)]):
+        message = item.get("SMSMessage") if isinstance(item, dict) else None
+        yield number, message, item
+
+
+def collect_sms_chunks(chunks: List[List[str]], results: list) -> BulkSmsResult:
+    """
+        Merges the send_bulk_sms responses of chunks, the raised exception in
+        place of failed chunks, into a :class:`BulkSmsResult`
+
+        :meta private:
+    """
+    result = BulkSmsResult(sum(map(len, chunks)))
+    for index, (to, response) in enumerate(zip(chunks, results)):
+        if isinstance(response, Exception):
+            result.failed_chunks.append(FailedChunk(index, list(to), response))
+            continue
+
+        rejected, responses = [], []
+        for number, message, item in recipient_results(to, response):
+            if message is None:
+                rejected.append(number)
+                responses.append(item)
+            else:
+                result.messages.append(message)
+        if rejected:
+            result.failed_chunks.append(FailedChunk(index, rejected, responses=responses))
+    return result
+
+
+class SmsQueue:
+    """
+    Coalesces individually sent SMS into :meth:`exotelpy.Exotel.send_bulk_sms` requests
+
+    Messages sharing the sender, body and every other send_bulk_sms option
+    (DLT template, SMS type, priority, ...) are grouped. A group is sent
+    as one request once it holds max_batch recipients or its oldest
+    message waited max_delay seconds, whichever comes first. Each message
+    gets a future resolved with its recipient's SMSMessage, or failed with
+    the request's exception or :class:`exotelpy.exceptions.SmsRejected`::
+
+        with SmsQueue(client, max_batch=100, max_delay=0.5) as queue:
+            future = queue.send("exo1", "+919876543210", body, dlt_template_id=template)
+            sid = future.result()["Sid"]
+
+    Requests go through the client, so its rate limiter and retry policy
+    apply. Leaving the ``with`` block (or calling :meth:`close`) sends the
+    messages still queued and waits for them.
+
+    Args:
+        client (Exotel): Synchronous client sending the requests
+        max_batch (int, optional): Recipients per request. Defaults to 100.
+        max_delay (float, optional): Seconds a message may wait for its group to fill up. Defaults to 0.5.
+        max_workers (int, optional): Number of concurrent requests. Defaults to the client's max_workers.
+    """
+
+    def __init__(self, client, max_batch: int = 100, max_delay: float = 0.5,
+                 max_workers: int = None):
+        if inspect.iscoroutinefunction(client._call_api):
+            raise TypeError("SmsQueue requires a synchronous Exotel client")
+        if max_batch < 1:
+            raise ValueError("max_batch should be at least 1")
+        self.client = client
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._groups: Dict[tuple, List[Tuple[str, Future]]] = {}
+        self._deadlines: Dict[tuple, float] = {}
+        self._closed = False
+        self._condition = threading.Condition()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or client.max_workers, thread_name_prefix="exotelpy-sms")
+        self._flusher = threading.Thread(target=self._run, name="exotelpy-sms-queue", daemon=True)
+        self._flusher.start()
+
+    def send(self, from_: str, to: str, body: str, encoding_type: str = None, priority: str = None,
+             status_callback: str = None, dlt_entity_id: str = None, dlt_template_id: str = None,
+             sms_type: str = None) -> Future:
+        """
+        Queues an SMS to a single recipient
+
+        Args:
+            from_ (str): Refer Exotel docs
+            to (str): E.164 formatted phone number
+            body (str): Refer Exotel docs
+            encoding_type (str, optional): Defaults to None.
+            priority (str, optional): Defaults to None.
+            status_callback (str, optional): Defaults to None.
+            dlt_entity_id (str, optional): Defaults to None.
+            dlt_template_id (str, optional): Defaults to None.
+            sms_type (str, optional): Defaults to None.
+
+        Raises:
+            RuntimeError: raised when the queue is closed
+
+        Returns:
+            Future: resolved with the recipient's SMSMessage
+        """
+        validate_list_of_nums([to])
+        if status_callback is not None:
+            validate_url(status_callback)
+        key = (from_, body, encoding_type, priority, status_callback,
+               dlt_entity_id, dlt_template_id, sms_type)
+        future = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Can't send through a closed SmsQueue")
+            group = self._groups.get(key)
+            if group is None:
+                group = self._groups[key] = []
+                self._deadlines[key] = time.monotonic() + self.max_delay
+                self._condition.notify()
+            group.append((to, future))
+            if len(group) >= self.max_batch:
+                self._dispatch(key)
+        return future
+
+    def pending(self) -> int:
+        """
+            Number of queued messages not handed to a request yet
+        """
+        with self._condition:
+            return sum(map(len, self._groups.values()))
+
+    def _dispatch(self, key: tuple):
+        """
+            Hands a group over to the executor, the condition must be held
+
+            :meta private:
+        """
+        messages = self._groups.pop(key)
+        del self._deadlines[key]
+        self._executor.submit(self._send, key, messages)
+
+    def _run(self):
+        with self._condition:
+            while not self._closed:
+                now = time.monotonic()
+                for key in [key for key, deadline in self._deadlines.items() if deadline <= now]:
+                    self._dispatch(key)
+                timeout = min(self._deadlines.values()) - now if self._deadlines else None
+                self._condition.wait(timeout)
+
+    def _send(self, key: tuple, messages: List[Tuple[str, Future]]):
+        messages = [(to, future) for to, future in messages if future.set_running_or_notify_cancel()]
+        if not messages:
+            return
+        from_, body, encoding_type, priority, status_callback, dlt_entity_id, dlt_template_id, sms_type = key
+        to = [number for number, _ in messages]
+        logger.debug("Sending %s queued SMS from %s in one request", len(to), from_)
+        try:
+            response = self.client.send_bulk_sms(
+                from_, to, body, encoding_type=encoding_type, priority=priority,
+                status_callback=status_callback, dlt_entity_id=dlt_entity_id,
+                dlt_template_id=dlt_template_id, sms_type=sms_type)
+        except Exception as e:
+            for _, future in messages:
+                future.set_exception(e)
+            return
+
+        for (_, future), (number, message, item) in zip(messages, recipient_results(to, response)):
+            if message is None:
+                future.set_exception(SmsRejected(number, item))
+            else:
+                future.set_result(message)
+
+    def flush(self):
+        """
+            Sends every queued message right away, without waiting for the requests
+        """
+        with self._condition:
+            for key in list(self._groups):
+                self._dispatch(key)
+
+    def close(self, wait: bool = True):
+        """
+            Sends the queued messages and stops the queue
+
+            Args:
+                wait (bool, optional): Block until every request finished. Defaults to True.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            for key in list(self._groups):
+                self._dispatch(key)
+            self._condition.notify()
+        self._flusher.join()
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self) -> "SmsQueue":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self) -> str:
+        return "SmsQueue(max_batch={max_batch}, max_delay={max_delay}, pending={pending})".format(
+            max_batch=self.max_batch, max_delay=self.max_delay, pending=self.pending())
@@ -0,0 +1,82 @@
+import csv
+import mmap
+from contextlib import contextmanager
+from typing import Iterator, Union
+
+
+@contextmanager
+def _lines(path: str, encoding: str):
+    """
+        Decoded lines of a file, read through a memory map when the file
+        can be mapped so they are paged in lazily instead of buffered
+
+        :meta private:
+    """
+    with open(path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # empty files and pipes can't be mapped
+            mapped = None
+
+        if mapped is None:
+            yield (line.decode(encoding) for line in f)
+            return
+        try:
+            yield (line.decode(encoding) for line in iter(mapped.readline, b""))
+        finally:
+            mapped.close()
+
+
+def read_numbers(path: str, column: Union[int, str] = None, delimiter: str = ",",
+                 header: bool = None, encoding: str = "utf-8-sig") -> Iterator[str]:
+    """
+    Streams phone numbers from a file without loading it in memory
+
+    Reads one number per line, or one column of a CSV file. Blank values are
+    skipped, validation is left to the client, which checks every batch
+    before uploading it::
+
+        client.create_list("audience", numbers=read_numbers("audience.csv", column="phone"))
+
+    Args:
+        path (str): Path of the file
+        column (Union[int, str], optional): Position or header name of the CSV column holding the numbers,
+            the whole line is the number when None. Defaults to None.
+        delimiter (str, optional): CSV field delimiter. Defaults to ",".
+        header (bool, optional): Whether the first line is a header, defaults to True when column is a name.
+        encoding (str, optional): Text encoding of the file. Defaults to "utf-8-sig".
+
+    Raises:
+        ValueError: raised when column is a name missing from the header
+
+    Yields:
+        str: phone numbers, in file order
+    """
+    if header is None:
+        header = isinstance(column, str)
+
+    with _lines(path, encoding) as lines:
+        if column is None:
+            if header:
+                next(lines, None)
+            for line in lines:
+                number = line.strip()
+                if number:
+                    yield number
+            return
+
+        rows = csv.reader(lines, delimiter=delimiter)
+        if header:
+            names = next(rows, [])
+            if isinstance(column, str):
+                try:
+                    column = [name.strip() for name in names].index(column)
+                except ValueError:
+                    raise ValueError("Column {column!r} not found in the header of {path}".format(
+                        column=column, path=path)) from None
+        for row in rows:
+            if len(row) > column:
+                number = row[column].strip()
+                if number:
+                    yield number
@@ -0,0 +1,175 @@
+import contextvars
+import json
+import threading
+import time
+import uuid
+from typing import IO, List, Optional, Union
+
+_current_span = contextvars.ContextVar("exotelpy_current_span", default=None)
+
+
+class Span:
+    """
+    Timed phase of a client operation, used as a context manager
+
+    Spans opened while another one is active become its children, worker
+    threads pass the parent explicitly. Attributes can be added until the
+    span ends, an exception leaving the span marks it as failed.
+
+    :meta private:
+    """
+    __slots__ = ("tracer", "name", "attributes", "trace_id", "span_id", "parent_id",
+                 "start_time", "duration", "status", "error", "_started", "_token")
+
+    def __init__(self, tracer: "Tracer", name: str, parent: "Span" = None, **attributes):
+        self.tracer = tracer
+        self.name = name
+        self.attributes = attributes
+        self.trace_id = parent.trace_id if parent is not None else uuid.uuid4().hex
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent.span_id if parent is not None else None
+        self.start_time = None
+        self.duration = None
+        self.status = "ok"
+        self.error = None
+        self._started = None
+        self._token = None
+
+    def set_attribute(self, key: str, value):
+        self.attributes[key] = value
+
+    def __enter__(self) -> "Span":
+        self.start_time = time.time()
+        self._started = time.perf_counter()
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.duration = time.perf_counter() - self._started
+        _current_span.reset(self._token)
+        if exc is not None:
+            self.status = "error"
+            self.error = "{cls}: {exc}".format(cls=type(exc).__name__, exc=exc)
+        self.tracer.exporter.export(self)
+        return False
+
+    def to_dict(self) -> dict:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_time": self.start_time,
+            "duration": self.duration,
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+    def __repr__(self) -> str:
+        return "Span(name='{name}', duration={duration})".format(
+            name=self.name, duration=self.duration)
+
+
+class _NoopSpan:
+    """
+        Stand-in used when tracing is disabled
+
+        :meta private:
+    """
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value):
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class SpanExporter:
+    """
+        Receives every finished span, subclass it to ship spans elsewhere
+    """
+
+    def export(self, span: Span):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class JSONLinesExporter(SpanExporter):
+    """
+    Appends finished spans as JSON lines to a file
+
+    Args:
+        target (Union[str, IO]): Path of the file, or an open text stream
+    """
+
+    def __init__(self, target: Union[str, IO]):
+        if isinstance(target, str):
+            self._stream = open(target, "a", encoding="utf-8")
+            self._owned = True
+        else:
+            self._stream = target
+            self._owned = False
+        self._lock = threading.Lock()
+
+    def export(self, span: Span):
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            self._stream.write(line + "\n")
+            self._stream.flush()
+
+    def close(self):
+        if self._owned:
+            self._stream.close()
+
+
+class InMemoryExporter(SpanExporter):
+    """
+        Keeps finished spans in a list, handy for tests and notebooks
+    """
+
+    def __init__(self):
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, span: Span):
+        with self._lock:
+            self.spans.append(span)
+
+
+class Tracer:
+    """
+    Emits nested spans for the phases of composite client operations
+
+    ::
+
+        tracer = Tracer(JSONLinesExporter("spans.jsonl"))
+        client = Exotel(sid, key, token, tracer=tracer)
+
+    Args:
+        exporter (SpanExporter): Receives every finished span
+    """
+
+    def __init__(self, exporter: SpanExporter):
+        self.exporter = exporter
+
+    @staticmethod
+    def current() -> Optional[Span]:
+        return _current_span.get()
+
+    def span(self, name: str, parent: Span = None, **attributes) -> Span:
+        """
+            Starts a span, a child of parent or of the active span
+        """
+        if parent is None:
+            parent = self.current()
+        return Span(self, name, parent=parent, **attributes)
@@ -0,0 +1,169 @@
+import threading
+from typing import List
+
+
+class BatchResult:
+    """
+    Outcome of one uploaded batch of a streamed :meth:`exotelpy.Exotel.create_list`
+
+    Attributes:
+        index (int): Position of the batch, starting at 0
+        list_id (str): Contact list the batch was added to
+        response (dict): add_contacts_to_list response of this batch only
+        success (int): Contacts added to the list so far, including this batch
+        total (int): Contacts submitted so far, including this batch
+    """
+    __slots__ = ("index", "list_id", "response", "success", "total")
+
+    def __init__(self, index: int, list_id: str, response: dict, success: int, total: int):
+        self.index = index
+        self.list_id = list_id
+        self.response = response
+        self.success = success
+        self.total = total
+
+    @property
+    def failed(self) -> int:
+        return self.total - self.success
+
+    def __repr__(self) -> str:
+        return "BatchResult(index={index}, list_id='{list_id}', success={success}, total={total})".format(
+            index=self.index, list_id=self.list_id, success=self.success, total=self.total)
+
+
+class BatchCounter:
+    """
+        Turns batch responses into :class:`BatchResult` objects with running counters
+
+        :meta private:
+    """
+
+    def __init__(self, list_id: str):
+        self.list_id = list_id
+        self.batches = 0
+        self.success = 0
+        self.total = 0
+
+    def __call__(self, response: dict) -> BatchResult:
+        self.success += response["metadata"]["success"]
+        self.total += response["metadata"]["total"]
+        result = BatchResult(self.batches, self.list_id, response, self.success, self.total)
+        self.batches += 1
+        return result
+
+    def summary(self) -> dict:
+        """
+            Returns the counters in the shape of an API response's metadata
+        """
+        return {
+            "list_id": self.list_id,
+            "batches": self.batches,
+            "metadata": {
+                "success": self.success,
+                "failed": self.total - self.success,
+                "total": self.total,
+            },
+        }
+
+
+class AdaptiveBatchSizer:
+    """
+    Tunes the contact batch size of :meth:`exotelpy.Exotel.create_list` (AIMD)
+
+    Every uploaded batch is reported with its latency and estimated payload
+    size. A batch that stayed under target_latency (and max_payload_bytes)
+    grows the next one by increase contacts. A slow, oversized or failed
+    batch, or a 429/5xx answer from a contacts endpoint, shrinks it by the
+    decrease factor. The size always stays between min_size and max_size.
+    The current size is published as the ``upload_batch_size`` gauge of the
+    client's :class:`exotelpy.metrics.Metrics`::
+
+        client = Exotel(sid, key, token, batch_sizer=AdaptiveBatchSizer(target_latency=5))
+
+    Args:
+        initial (int, optional): Size of the first batch. Defaults to 1000.
+        min_size (int, optional): Smallest batch. Defaults to 100.
+        max_size (int, optional): Largest batch, Exotel accepts up to 5000 contacts per request. Defaults to 5000.
+        target_latency (float, optional): Seconds a batch (contact creation and list attachment) should take. Defaults to 5.0.
+        increase (int, optional): Contacts added after a healthy batch. Defaults to 500.
+        decrease (float, optional): Factor applied after a slow or failed batch. Defaults to 0.5.
+        max_payload_bytes (int, optional): Shrinks batches whose request body is estimated above it. Defaults to None.
+    """
+
+    def __init__(self, initial: int = 1000, min_size: int = 100, max_size: int = 5000,
+                 target_latency: float = 5.0, increase: int = 500, decrease: float = 0.5,
+                 max_payload_bytes: int = None):
+        if not 0 < min_size <= max_size:
+            raise ValueError("min_size should be positive and at most max_size")
+        self.min_size = min_size
+        self.max_size = max_size
+        self.size = min(max(initial, min_size), max_size)
+        self.target_latency = target_latency
+        self.increase = increase
+        self.decrease = decrease
+        self.max_payload_bytes = max_payload_bytes
+        self.batches = 0
+        self.decreases = 0
+        self._lock = threading.Lock()
+
+    def __call__(self) -> int:
+        return self.size
+
+    def _shrink(self, factor: float):
+        self.size = max(self.min_size, int(self.size * factor))
+        self.decreases += 1
+
+    def observe(self, size: int, latency: float, payload_bytes: int = 0, failed: bool = False) -> int:
+        """
+            Records an uploaded batch and returns the size of the next one
+        """
+        with self._lock:
+            self.batches += 1
+            if failed or latency > self.target_latency:
+                self._shrink(self.decrease)
+            elif self.max_payload_bytes and payload_bytes > self.max_payload_bytes:
+                self.size = max(self.min_size, int(size * self.max_payload_bytes / payload_bytes))
+                self.decreases += 1
+            elif size >= self.size:
+                # only batches of the current size prove it can grow
+                self.size = min(self.max_size, self.size + self.increase)
+            return self.size
+
+    def feedback(self, endpoint: str, status_code: int):
+        """
+            Shrinks the next batch when a contacts endpoint is throttled or failing
+        """
+        if (status_code == 429 or status_code >= 500) and endpoint.rstrip("/").endswith("contacts"):
+            with self._lock:
+                self._shrink(self.decrease)
+
+    def __repr__(self) -> str:
+        return "AdaptiveBatchSizer(size={size}, min_size={min_size}, max_size={max_size})".format(
+            size=self.size, min_size=self.min_size, max_size=self.max_size)
+
+
+class CreatedResources:
+    """
+        List and contacts created so far by an upload, so a failed
+        ``*_with_list`` call can revert them even when the upload itself failed
+
+        :meta private:
+    """
+
+    def __init__(self):
+        self.list_id = None
+        self.contact_sids = []
+        self.reused = set()
+        self._lock = threading.Lock()
+
+    def record_contacts(self, sids: List[str], reused: List[str] = ()):
+        with self._lock:
+            self.reused.update(reused)
+            self.contact_sids.extend(sids)
+
+    def created_sids(self) -> List[str]:
+        """
+            Sids of the contacts the upload created, leaving out reused ones
+        """
+        with self._lock:
+            return [sid for sid in self.contact_sids if sid not in self.reused]
@@ -1,6 +1,21 @@
 import re
+from functools import lru_cache
+from typing import Iterable, List
 
-from .exceptions import ValidationError
+from .exceptions import InvalidPhoneNumbers, ValidationError
+
+URL_REGEX = re.compile(
+    r'^(?:http|ftp)s?://'  # http:// or https://
+    # domain...
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+(?:[A-Z]{2,6}\.?|[A-Z0-9-]{2,}\.?)|'
+    r'localhost|'  # localhost...
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+
+PHONE_NUMBER_REGEX = re.compile(r'^\+[1-9]\d{10,14}$')
+
+_SEPARATORS = re.compile(r'[\s\-().]')
 
 
 def validate_url(value: str) -> str:
@@ -13,15 +28,7 @@ def validate_url(value: str) -> str:
         Raises:
             ValidationError: raised when an invalid url is passed
     """
-    regex = re.compile(
-        r'^(?:http|ftp)s?://'  # http:// or https://
-        # domain...
-        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+(?:[A-Z]{2,6}\.?|[A-Z0-9-]{2,}\.?)|'
-        r'localhost|'  # localhost...
-        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-        r'(?::\d+)?'  # optional port
-        r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-    match = re.match(regex, value)
+    match = URL_REGEX.match(value)
 
     if match is not None:
         return value
@@ -43,8 +50,7 @@ def validate_phone_number(value: str) -> str:
         Raises:
             ValidationError: raised when the number isn't valid
     """
-    regex = re.compile(r'^\+[1-9]\d{10,14}$')
-    match = re.match(regex, value)
+    match = PHONE_NUMBER_REGEX.match(value)
 
     if match is not None:
         return value
@@ -52,3 +58,102 @@ def validate_phone_number(value: str) -> str:
         raise ValidationError(
             """{val} is not a valid phone number as per E.164 format
             For reference: https://www.twilio.com/docs/glossary/what-e164""".format(val=value))
+
+
+class ValidatedNumbers(list):
+    """
+        List of phone numbers already validated as per E.164 format
+
+        Returned by :func:`validate_phone_numbers`, passing it on to the
+        client skips validating the same numbers again. Slices keep the type,
+        it can't be modified in place so unvalidated numbers can't slip in.
+    """
+
+    def __getitem__(self, index):
+        item = super().__getitem__(index)
+        if isinstance(index, slice):
+            return ValidatedNumbers(item)
+        return item
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(
+            "ValidatedNumbers can't be modified, build a new list and validate it instead")
+
+    append = extend = insert = remove = pop = clear = sort = reverse = _readonly
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+
+    def __reduce__(self):
+        return ValidatedNumbers, (list(self),)
+
+
+def find_invalid_numbers(numbers: List[str]) -> List[int]:
+    """
+        Returns the positions of the numbers that aren't valid as per E.164 format
+
+        Args:
+            numbers (List[str]): phone numbers
+    """
+    match = PHONE_NUMBER_REGEX.match
+    try:
+        if None not in map(match, numbers):
+            return []
+    except TypeError:
+        pass
+    return [i for i, num in enumerate(numbers)
+            if not isinstance(num, str) or match(num) is None]
+
+
+@lru_cache(maxsize=65536)
+def normalize_phone_number(value: str, default_country_code: str = "91") -> str:
+    """
+        Converts common national formats to E.164, results are memoized
+
+        Spaces, dashes, dots and parentheses are dropped, a "00" international
+        prefix becomes "+" and national numbers, with or without a leading
+        trunk "0", get default_country_code prepended. The result still has
+        to be validated.
+
+        Args:
+            value (str): phone number
+            default_country_code (str, optional): country calling code of national numbers. Defaults to "91".
+    """
+    number = _SEPARATORS.sub("", value)
+    if number.startswith("+"):
+        return number
+    if number.startswith("00"):
+        return "+" + number[2:]
+    if number.startswith("0"):
+        number = number[1:]
+    if len(number) > 10 and number.startswith(default_country_code):
+        return "+" + number
+    return "+" + default_country_code + number
+
+
+def validate_phone_numbers(numbers: Iterable[str], normalize: bool = False,
+                           default_country_code: str = "91") -> ValidatedNumbers:
+    """
+        Validates many phone numbers as per E.164 format in one pass
+
+        Args:
+            numbers (Iterable[str]): phone numbers
+            normalize (bool, optional): Convert national formats to E.164 first, see :func:`normalize_phone_number`. Defaults to False.
+            default_country_code (str, optional): Used when normalizing. Defaults to "91".
+
+        Raises:
+            InvalidPhoneNumbers: raised when any number isn't valid, holds their positions
+
+        Returns:
+            ValidatedNumbers: the (normalized) numbers
+    """
+    if isinstance(numbers, ValidatedNumbers):
+        return numbers
+    if normalize:
+        numbers = [normalize_phone_number(num, default_country_code)
+                   if isinstance(num, str) else num for num in numbers]
+    elif not isinstance(numbers, list):
+        numbers = list(numbers)
+
+    positions = find_invalid_numbers(numbers)
+    if positions:
+        raise InvalidPhoneNumbers(positions, [numbers[i] for i in positions])
+    return ValidatedNumbers(numbers)
@@ -0,0 +1,17 @@
+import pytest
+
+from exotelpy import Exotel
+
+from .fake_exotel import FakeExotel
+
+
+@pytest.fixture
+def server():
+    with FakeExotel() as fake:
+        yield fake
+
+
+@pytest.fixture
+def client(server):
+    with Exotel("test", "key", "token", baseurl=server.url) as exotel:
+        yield exotel
@@ -0,0 +1,418 @@
+"""
+In-process stand-in for the Exotel API
+
+Serves the v1, v2 and v2_beta endpoints used by :class:`exotelpy.Exotel`
+from in-memory state so the client can be exercised (and benchmarked)
+without touching the real API::
+
+    with FakeExotel(latency=0.02, throttle_rate=0.01) as server:
+        client = Exotel("sid", "key", "token", baseurl=server.url)
+        client.create_list("audience", numbers=["+919876543210"])
+
+It can also run standalone::
+
+    python -m tests.fake_exotel --port 8080 --latency 0.05 --error-rate 0.01
+"""
+import argparse
+import gzip
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+ROUTE = re.compile(r"^/(v1|v2|v2_beta)/[Aa]ccounts/(?P<sid>[^/]+)/(?P<endpoint>.*)$")
+
+
+def _sid(prefix: str) -> str:
+    return "{prefix}{hex}".format(prefix=prefix, hex=uuid.uuid4().hex)
+
+
+def _item(data: dict, code: int = 200) -> dict:
+    return {"code": code, "error_data": None, "status": "success", "data": data}
+
+
+def _error_item(code: int, description: str) -> dict:
+    return {"code": code, "status": "failure", "data": None,
+            "error_data": {"code": code, "description": description}}
+
+
+def _v1_error(status: int, message: str) -> dict:
+    return {"RestException": {"Status": status, "Message": message}}
+
+
+class FakeExotelState:
+    """
+        In-memory resources and fault injection settings backing :class:`FakeExotel`
+    """
+
+    def __init__(self, latency=0.0, error_rate: float = 0.0, error_status: int = 503,
+                 throttle_rate: float = 0.0, retry_after: str = None, seed: int = None):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.contacts = {}
+        self.lists = {}
+        self.campaigns = {}
+        self.sms_campaigns = {}
+        self.sms = {}
+        self.exophones = {
+            "exo1": {"sid": "exo1", "phone_number": "+918000000001"},
+            "exo2": {"sid": "exo2", "phone_number": "+918000000002"},
+        }
+        self.requests = 0
+        self.compressed = 0
+        self.faults = []
+
+    def fail_next(self, status: int, count: int = 1, headers: dict = None):
+        """
+            Answers the next count requests with status instead of serving them
+        """
+        with self.lock:
+            self.faults.extend([(status, headers or {})] * count)
+
+    def pop_fault(self):
+        with self.lock:
+            if self.faults:
+                return self.faults.pop(0)
+            roll = self.random.random()
+        if roll < self.throttle_rate:
+            headers = {"Retry-After": self.retry_after} if self.retry_after is not None else {}
+            return 429, headers
+        if roll < self.throttle_rate + self.error_rate:
+            return self.error_status, {}
+        return None
+
+    def delay(self) -> float:
+        if isinstance(self.latency, (tuple, list)):
+            with self.lock:
+                return self.random.uniform(*self.latency)
+        return self.latency
+
+
+class FakeExotelHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def state(self) -> FakeExotelState:
+        return self.server.state
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        if self.headers.get("Content-Encoding") == "gzip":
+            with self.state.lock:
+                self.state.compressed += 1
+            body = gzip.decompress(body)
+        return body
+
+    def _send(self, status: int, payload, headers: dict = None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _dispatch(self, method: str):
+        parts = urlsplit(self.path)
+        match = ROUTE.match(parts.path)
+        body = self._read_body()
+        with self.state.lock:
+            self.state.requests += 1
+        if match is None:
+            return self._send(404, {"response": _error_item(404, "Not found")})
+
+        delay = self.state.delay()
+        if delay:
+            time.sleep(delay)
+
+        fault = self.state.pop_fault()
+        if fault is not None:
+            status, headers = fault
+            return self._send(status, {"response": _error_item(status, "Injected failure")},
+                              headers)
+
+        version = match.group(1)
+        endpoint = match.group("endpoint")
+        query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+
+        if version == "v1":
+            form = parse_qs(body.decode()) if body else {}
+            status, payload = self.v1(method, endpoint, form)
+        elif version == "v2_beta":
+            status, payload = self.v2_beta(method, endpoint)
+        else:
+            data = json.loads(body) if body else {}
+            status, payload = self.v2(method, endpoint, data, query)
+        self._send(status, payload)
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    @staticmethod
+    def _page(records: list, query: dict) -> dict:
+        offset = int(query.get("offset", 0))
+        limit = int(query.get("limit", 20))
+        page = records[offset:offset + limit]
+        return {
+            "metadata": {"offset": offset, "limit": limit,
+                         "count": len(page), "total": len(records)},
+            "response": [_item(record) for record in page],
+        }
+
+    @staticmethod
+    def _bulk(items: list) -> dict:
+        success = sum(1 for item in items if item["status"] == "success")
+        return {
+            "metadata": {"total": len(items), "success": success,
+                         "failed": len(items) - success},
+            "response": items,
+        }
+
+    def _not_found(self, resource: str):
+        return 404, {"response": _error_item(404, "{r} not found".format(r=resource))}
+
+    def v2(self, method: str, endpoint: str, data: dict, query: dict):
+        state = self.state
+        segments = endpoint.strip("/").split("/")
+        head = segments[0]
+
+        with state.lock:
+            if head == "contacts":
+                if method == "POST" and len(segments) == 1:
+                    items = []
+                    for contact in data.get("contacts", []):
+                        sid = _sid("c")
+                        state.contacts[sid] = {"sid": sid, "number": contact["number"]}
+                        items.append(_item(dict(state.contacts[sid])))
+                    return 200, self._bulk(items)
+                sid = segments[1] if len(segments) > 1 else None
+                if sid not in state.contacts:
+                    return self._not_found("Contact")
+                if method == "DELETE":
+                    state.contacts.pop(sid)
+                    return 200, {"response": _item({"sid": sid})}
+                return 200, {"response": _item(dict(state.contacts[sid]))}
+
+            if head == "lists":
+                if len(segments) == 1:
+                    if method == "POST":
+                        items = []
+                        for entry in data.get("lists", []):
+                            if any(lst["name"] == entry["name"]
+                                   for lst in state.lists.values()):
+                                items.append(_error_item(409, "List already exists"))
+                                continue
+                            sid = _sid("l")
+                            state.lists[sid] = {"sid": sid, "name": entry["name"],
+                                                "tag": entry.get("tag"), "contacts": []}
+                            items.append(_item(
+                                {"sid": sid, "name": entry["name"], "tag": entry.get("tag")}))
+                        return 200, self._bulk(items)
+                    records = [{k: v for k, v in lst.items() if k != "contacts"}
+                               for lst in state.lists.values()]
+                    return 200, self._page(records, query)
+
+                list_id = segments[1]
+                if list_id not in state.lists:
+                    return self._not_found("List")
+                lst = state.lists[list_id]
+                if len(segments) == 3 and segments[2] == "contacts":
+                    if method == "POST":
+                        items = []
+                        for ref in data.get("contact_references", []):
+                            sid = ref["contact_sid"]
+                            contact = state.contacts.get(sid)
+                            if contact is None:
+                                items.append(_error_item(404, "Contact not found"))
+                                continue
+                            lst["contacts"].append(sid)
+                            items.append(_item({"sid": sid, "list_id": list_id,
+                                                "number": contact["number"]}))
+                        return 200, self._bulk(items)
+                    records = [state.contacts.get(sid, {"sid": sid})
+                               for sid in lst["contacts"]]
+                    return 200, self._page(records, query)
+                if method == "DELETE":
+                    state.lists.pop(list_id)
+                    return 200, {"response": _item({"sid": list_id})}
+                return 200, {"response": _item(
+                    {"sid": list_id, "name": lst["name"], "tag": lst["tag"],
+                     "contact_count": len(lst["contacts"])})}
+
+            if head in ("campaigns", "sms-campaigns", "message-campaigns"):
+                store = state.campaigns if head == "campaigns" else state.sms_campaigns
+                if len(segments) == 1:
+                    if method == "POST":
+                        entries = data.get("campaigns", [data])
+                        items = []
+                        for entry in entries:
+                            missing = [lst for lst in entry.get("lists", [])
+                                       if lst not in state.lists]
+                            if missing:
+                                return 400, {"response": _error_item(
+                                    400, "Invalid list {l}".format(l=missing[0]))}
+                            sid = _sid("cmp")
+                            store[sid] = dict(entry, id=sid, calls=[])
+                            for list_id in entry.get("lists", []):
+                                for contact_sid in state.lists[list_id]["contacts"]:
+                                    store[sid]["calls"].append(
+                                        {"call_sid": _sid("call"),
+                                         "number": state.contacts.get(
+                                             contact_sid, {}).get("number"),
+                                         "status": "completed"})
+                            items.append(_item({"id": sid}))
+                        return 200, self._bulk(items)
+                    records = [{k: v for k, v in c.items() if k != "calls"}
+                               for c in store.values()]
+                    return 200, self._page(records, query)
+
+                campaign_id = segments[1]
+                if campaign_id not in store:
+                    return self._not_found("Campaign")
+                if len(segments) == 3:
+                    return 200, self._page(store[campaign_id]["calls"], query)
+                if method == "DELETE":
+                    store.pop(campaign_id)
+                    return 200, {"response": _item({"id": campaign_id})}
+                return 200, {"response": _item(
+                    {k: v for k, v in store[campaign_id].items() if k != "calls"})}
+
+            if head == "incoming-phone-numbers" and len(segments) == 2:
+                phone = state.exophones.get(segments[1])
+                if phone is None:
+                    return self._not_found("ExoPhone")
+                return 200, {"response": _item(dict(phone, status="active"))}
+
+        return self._not_found("Resource")
+
+    def v1(self, method: str, endpoint: str, form: dict):
+        state = self.state
+        with state.lock:
+            if method == "POST" and endpoint == "Sms/send.json":
+                messages = []
+                for number in form.get("To", []):
+                    sid = _sid("sms")
+                    state.sms[sid] = {"Sid": sid, "To": number,
+                                      "From": form.get("From", [None])[0],
+                                      "Body": form.get("Body", [None])[0],
+                                      "Status": "queued"}
+                    messages.append({"SMSMessage": dict(state.sms[sid])})
+                return 200, messages
+
+            match = re.match(r"^SMS/Messages/(?P<sid>[^/]+)\.json$", endpoint)
+            if method == "GET" and match is not None:
+                message = state.sms.get(match.group("sid"))
+                if message is None:
+                    return 404, _v1_error(404, "SMS not found")
+                return 200, {"SMSMessage": dict(message)}
+
+        return 404, _v1_error(404, "Resource not found")
+
+    def v2_beta(self, method: str, endpoint: str):
+        state = self.state
+        segments = endpoint.strip("/").split("/")
+        if segments[0] == "IncomingPhoneNumbers" and method == "GET":
+            with state.lock:
+                if len(segments) == 1:
+                    return 200, {"IncomingPhoneNumbers": list(state.exophones.values())}
+                phone = state.exophones.get(segments[1])
+            if phone is not None:
+                return 200, {"IncomingPhoneNumber": dict(phone)}
+            return 404, _v1_error(404, "ExoPhone not found")
+        return 404, _v1_error(404, "Resource not found")
+
+
+class FakeExotel:
+    """
+        Runs :class:`FakeExotelHandler` on a background thread
+
+        Args:
+            host (str, optional): Interface to bind. Defaults to "127.0.0.1".
+            port (int, optional): Port to bind, 0 picks a free one. Defaults to 0.
+            latency (float or tuple, optional): Seconds added to every request, a (min, max) tuple
+                picks a uniform random delay. Defaults to 0.
+            error_rate (float, optional): Share of requests answered with error_status. Defaults to 0.
+            error_status (int, optional): Status code of injected errors. Defaults to 503.
+            throttle_rate (float, optional): Share of requests answered with 429. Defaults to 0.
+            retry_after (str, optional): Retry-After header sent with injected 429s. Defaults to None.
+            seed (int, optional): Seed of the fault injection. Defaults to None.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, **settings):
+        self.state = FakeExotelState(**settings)
+        self._server = ThreadingHTTPServer((host, port), FakeExotelHandler)
+        self._server.daemon_threads = True
+        self._server.state = self.state
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return "http://{host}:{port}".format(host=host, port=port)
+
+    def start(self) -> "FakeExotel":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "FakeExotel":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a fake Exotel API server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    server = FakeExotel(
+        args.host, args.port, latency=args.latency, error_rate=args.error_rate,
+        error_status=args.error_status, throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after, seed=args.seed)
+    print("Fake Exotel API listening on {url}".format(url=server.url))
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
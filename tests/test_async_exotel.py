@@ -0,0 +1,88 @@
+import asyncio
+from unittest import mock
+
+import pytest
+
+from exotelpy import AdaptiveBatchSizer, AsyncExotel, Journal, NotFound, ServerError
+
+pytest.importorskip("httpx")
+
+
+def run(coro_factory, server):
+    async def main():
+        async with AsyncExotel("test", "key", "token", baseurl=server.url) as client:
+            return await coro_factory(client)
+    return asyncio.run(main())
+
+
+def test_create_list_and_read_back(server):
+    async def scenario(client):
+        data = await client.create_list("audience", numbers=["+919876543210", "+919876543211"])
+        list_id = data["response"][0]["data"]["list_id"]
+        details, contacts = await asyncio.gather(
+            client.get_list_details(list_id), client.get_list_contacts(list_id))
+        return data, details, contacts
+
+    data, details, contacts = run(scenario, server)
+    assert data["metadata"]["success"] == 2
+    assert details["response"]["data"]["contact_count"] == 2
+    assert contacts["metadata"]["total"] == 2
+
+
+def test_error_mapping_is_shared(server):
+    with pytest.raises(NotFound):
+        run(lambda client: client.get_campaign_details("missing"), server)
+
+
+def test_requests_pool_arguments_are_rejected():
+    with pytest.raises(TypeError):
+        AsyncExotel("test", "key", "token", pool_maxsize=50)
+
+
+def test_streamed_create_list(server):
+    async def scenario(client):
+        numbers = ["+91985{n:07d}".format(n=n) for n in range(6000)]
+        received = []
+
+        async def sink(batch):
+            received.append(batch)
+
+        summary = await client.create_list("sink", numbers=numbers, sink=sink)
+        streamed = [batch async for batch in client.iter_create_list("iter", numbers=numbers)]
+        return summary, received, streamed
+
+    summary, received, streamed = run(scenario, server)
+    assert summary["metadata"]["total"] == 6000
+    assert [batch.total for batch in received] == [5000, 6000]
+    assert [batch.success for batch in streamed] == [5000, 6000]
+
+
+def test_failed_batch_waits_for_batches_in_flight(server, tmp_path):
+    numbers = ["+91980{n:07d}".format(n=n) for n in range(60)]
+
+    async def main():
+        sizer = AdaptiveBatchSizer(initial=20, min_size=20, max_size=20)
+        async with AsyncExotel("test", "key", "token", baseurl=server.url,
+                               batch_sizer=sizer, journal=Journal(str(tmp_path))) as client:
+            create, calls = client.create_contacts, []
+
+            async def slow_response(batch):
+                calls.append(batch)
+                data = await create(batch)
+                if len(calls) > 1:
+                    # created on Exotel, the answer is still on its way
+                    await asyncio.sleep(0.2)
+                return data
+
+            async def fail(sids, list_id):
+                raise ServerError("boom")
+
+            with mock.patch.object(client, "create_contacts", side_effect=slow_response), \
+                    mock.patch.object(client, "add_contacts_to_list", side_effect=fail):
+                with pytest.raises(ServerError):
+                    await client.create_list("audience", numbers=numbers, max_workers=3, job_id="job")
+            return await client.rollback_job("job")
+
+    handle = asyncio.run(main())
+    assert handle.complete and handle.deleted == 60
+    assert server.state.contacts == {} and server.state.lists == {}
@@ -0,0 +1,46 @@
+import pytest
+
+from exotelpy import Exotel, RetryPolicy, ServerError
+
+from .fake_exotel import FakeExotel
+
+
+def test_policy_only_replays_idempotent_requests_after_5xx():
+    policy = RetryPolicy(jitter=False)
+    assert policy.delay(1, "GET", 503) == 0.5
+    assert policy.delay(2, "DELETE", 502) == 1.0
+    assert policy.delay(1, "POST", 503) is None
+    assert policy.delay(1, "POST", 429) == 0.5
+    assert policy.delay(1, "POST", sent=False) == 0.5
+    assert policy.delay(1, "POST", sent=True) is None
+    assert policy.delay(3, "GET", 503) is None
+    assert policy.delay(1, "GET", 400) is None
+
+
+def test_policy_honors_retry_after_and_cap():
+    policy = RetryPolicy(max_attempts=10, backoff_cap=2, jitter=False)
+    assert policy.delay(1, "GET", 429, {"Retry-After": "7"}) == 7.0
+    assert policy.delay(8, "GET", 503, {}) == 2
+
+
+def test_client_retries_transient_failures(server):
+    policy = RetryPolicy(backoff_base=0.01, jitter=False)
+    with Exotel("test", "key", "token", baseurl=server.url, retry_policy=policy) as client:
+        server.state.fail_next(503)
+        assert "IncomingPhoneNumbers" in client.get_all_exophones()
+
+        server.state.fail_next(429, headers={"Retry-After": "0"})
+        assert client.create_contacts(["+919876543210"])["metadata"]["success"] == 1
+
+        server.state.fail_next(503)
+        with pytest.raises(ServerError):
+            client.create_contacts(["+919876543210"])
+
+
+def test_client_rides_out_injected_faults():
+    policy = RetryPolicy(max_attempts=20, backoff_base=0.001, jitter=False)
+    with FakeExotel(error_rate=0.2, throttle_rate=0.2, retry_after="0", seed=7) as server:
+        with Exotel("test", "key", "token", baseurl=server.url, retry_policy=policy) as client:
+            for _ in range(20):
+                assert "IncomingPhoneNumbers" in client.get_all_exophones()
+        assert server.state.requests > 20
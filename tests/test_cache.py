@@ -0,0 +1,48 @@
+import pytest
+
+from exotelpy import Exotel, NotFound, ResponseCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_reads_are_served_from_cache_until_expiry(server):
+    clock = Clock()
+    cache = ResponseCache(ttls={"IncomingPhoneNumbers": 10}, clock=clock)
+    with Exotel("test", "key", "token", baseurl=server.url, cache=cache) as client:
+        first = client.get_all_exophones()
+        before = server.state.requests
+        first["IncomingPhoneNumbers"].clear()
+        assert client.get_all_exophones()["IncomingPhoneNumbers"]
+        assert server.state.requests == before
+
+        clock.now = 11
+        client.get_all_exophones()
+        assert server.state.requests == before + 1
+
+
+def test_mutations_evict_the_resource(server):
+    with Exotel("test", "key", "token", baseurl=server.url, cache=ResponseCache()) as client:
+        list_id = client.create_list("audience")["response"][0]["data"]["sid"]
+        client.get_list_details(list_id)
+        client.add_contacts_to_list(
+            [client.create_contacts(["+919876543210"])["response"][0]["data"]["sid"]], list_id)
+        assert client.get_list_details(list_id)["response"]["data"]["contact_count"] == 1
+
+        client.delete_list(list_id)
+        with pytest.raises(NotFound):
+            client.get_list_details(list_id)
+
+
+def test_lru_eviction():
+    cache = ResponseCache(ttls={"lists/{list_id}": 60}, maxsize=2)
+    for list_id in ("a", "b", "c"):
+        cache.set("v2", "lists/" + list_id, None, {"id": list_id})
+    assert cache.get("v2", "lists/a") is None
+    assert cache.get("v2", "lists/c") == {"id": "c"}
+    assert len(cache) == 2
@@ -0,0 +1,33 @@
+from exotelpy import ContactIndex, Exotel
+
+
+def test_index_lookup_update_discard(tmp_path):
+    index = ContactIndex(str(tmp_path / "contacts.sqlite3"))
+    index.update("acc", [("+919876543210", "sid1"), ("+919876543211", "sid2")])
+    index.update("other", [("+919876543210", "sid9")])
+
+    assert index.lookup("acc", ["+919876543210", "+919876543212"]) == {"+919876543210": "sid1"}
+    index.discard("acc", ["sid1"])
+    assert index.lookup("acc", ["+919876543210"]) == {}
+    assert index.count("acc") == 1
+    index.close()
+
+    reopened = ContactIndex(str(tmp_path / "contacts.sqlite3"))
+    assert reopened.lookup("other", ["+919876543210"]) == {"+919876543210": "sid9"}
+
+
+def test_create_list_reuses_indexed_contacts(server):
+    index = ContactIndex()
+    numbers = ["+91984{n:07d}".format(n=n) for n in range(100)]
+    with Exotel("test", "key", "token", baseurl=server.url, contact_index=index) as client:
+        first = client.create_list("first", numbers=numbers[:60])
+        created = len(server.state.contacts)
+        second = client.create_list("second", numbers=numbers)
+
+        assert len(server.state.contacts) == created + 40
+        sids = [item["data"]["sid"] for item in second["response"]]
+        assert sids[:60] == [item["data"]["sid"] for item in first["response"]]
+        assert len(set(sids)) == 100
+
+        client.delete_contact(sids[0])
+        assert numbers[0] not in index.lookup("test", numbers)
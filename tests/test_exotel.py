@@ -0,0 +1,83 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+
+from exotelpy import (
+    BulkOperationFailed,
+    Exotel,
+    NotFound,
+    ServerError,
+    UnexpectedResponse,
+)
+from exotelpy.helpers import raise_for_status
+
+
+def test_session_is_shared_across_threads(client):
+    sid = client.create_contacts(["+919876543210"])["response"][0]["data"]["sid"]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(
+            lambda _: client.get_contact_details(sid), range(20)))
+    assert all(r["response"]["data"]["sid"] == sid for r in results)
+
+
+def test_close_on_context_exit(server):
+    client = Exotel("test", "key", "token", baseurl=server.url)
+    with mock.patch.object(client._session, "close") as close:
+        with client:
+            client.get_all_exophones()
+    close.assert_called_once_with()
+
+
+def test_delete_contacts_collects_failures_in_order(client):
+    data = client.create_contacts(["+919876543210", "+919876543211"])
+    sids = [item["data"]["sid"] for item in data["response"]]
+    sids.insert(1, "missing")
+
+    with pytest.raises(BulkOperationFailed) as exc_info:
+        client.delete_contacts(sids, max_workers=2)
+
+    results = exc_info.value.results
+    assert [r["response"]["data"]["sid"] for r in (results[0], results[2])] == [sids[0], sids[2]]
+    assert isinstance(results[1], NotFound)
+    assert list(exc_info.value.errors) == ["missing"]
+
+
+def test_pipelined_create_list_matches_serial(client):
+    numbers = ["+91987{n:07d}".format(n=n) for n in range(11000)]
+    serial = client.create_list("serial", numbers=numbers)
+    pipelined = client.create_list("pipelined", numbers=numbers, max_workers=3)
+
+    assert pipelined["metadata"] == serial["metadata"]
+    assert [i["data"]["number"] for i in pipelined["response"]] == numbers
+
+
+def test_streamed_create_list_keeps_running_counters(client):
+    numbers = ["+91986{n:07d}".format(n=n) for n in range(11000)]
+    batches = []
+    summary = client.create_list("sink", numbers=numbers, max_workers=2, sink=batches.append)
+
+    assert [batch.index for batch in batches] == [0, 1, 2]
+    assert [batch.total for batch in batches] == [5000, 10000, 11000]
+    assert summary["metadata"] == {"success": 11000, "failed": 0, "total": 11000}
+    assert summary["list_id"] == batches[0].list_id
+
+    streamed = list(client.iter_create_list("iter", numbers=iter(numbers)))
+    assert [len(batch.response["response"]) for batch in streamed] == [5000, 5000, 1000]
+    assert streamed[-1].success == 11000
+
+
+def test_create_campaign_accepts_any_iterable_of_callers(client, server):
+    callers = ["+919876543210", "+919876543211"]
+    client.create_campaign("+918000000001", "app", from_=(number for number in callers))
+    assert [campaign["from"] for campaign in server.state.campaigns.values()] == [callers]
+
+
+@pytest.mark.parametrize("status", [200, 400, 404])
+def test_non_json_body_is_rejected_where_it_would_be_read(status):
+    with pytest.raises(UnexpectedResponse) as exc_info:
+        raise_for_status(status, None, version="v2")
+    assert exc_info.value.status_code == status
+
+    with pytest.raises(ServerError):
+        raise_for_status(502, None)
@@ -0,0 +1,87 @@
+from unittest import mock
+
+import pytest
+
+from exotelpy import Exotel, Journal, ServerError
+
+
+def test_resumed_create_list_skips_completed_batches(server, tmp_path):
+    numbers = ["+91983{n:07d}".format(n=n) for n in range(12000)]
+    client = Exotel("test", "key", "token", baseurl=server.url, journal=Journal(str(tmp_path)))
+    attach = client.add_contacts_to_list
+    calls = []
+
+    def crash_on_second_batch(sids, list_id):
+        calls.append(sids)
+        if len(calls) == 2:
+            raise ServerError("worker died")
+        return attach(sids, list_id)
+
+    with mock.patch.object(client, "add_contacts_to_list", side_effect=crash_on_second_batch):
+        with pytest.raises(ServerError):
+            client.create_list("resumable", numbers=numbers, job_id="job-1")
+    assert len(server.state.contacts) == 10000
+
+    with pytest.raises(ValueError):
+        client.create_list("resumable", numbers=numbers[1:], job_id="job-1")
+
+    data = client.create_list("resumable", numbers=numbers, job_id="job-1")
+    assert len(server.state.contacts) == 12000
+    assert len(server.state.lists) == 1
+    assert data["metadata"]["success"] == 12000
+    list_id = data["response"][0]["data"]["list_id"]
+    assert len(server.state.lists[list_id]["contacts"]) == 12000
+
+
+def test_rollback_job_deletes_what_the_job_created(server, tmp_path):
+    journal = Journal(str(tmp_path))
+    with Exotel("test", "key", "token", baseurl=server.url, journal=journal) as client:
+        client.create_list("rollback", numbers=["+919876543210", "+919876543211"], job_id="job-2")
+        assert journal.jobs() == ["job-2"]
+
+        client.rollback_job("job-2")
+    assert server.state.contacts == {}
+    assert server.state.lists == {}
+    assert journal.jobs() == []
+
+
+def test_partial_rollback_can_be_run_again(server, tmp_path):
+    journal = Journal(str(tmp_path))
+    numbers = ["+91981{n:07d}".format(n=n) for n in range(20)]
+    with Exotel("test", "key", "token", baseurl=server.url, journal=journal) as client:
+        client.create_list("rollback", numbers=numbers, job_id="job-3")
+        delete = client.delete_contact
+        failed = []
+
+        def fail_once(sid):
+            if not failed:
+                failed.append(sid)
+                raise ServerError("boom")
+            return delete(sid)
+
+        with mock.patch.object(client, "delete_contact", side_effect=fail_once):
+            first = client.rollback_job("job-3")
+        assert not first.complete and list(first.errors) == failed
+        assert journal.jobs() == ["job-3"]
+
+        # the job's list is gone, it can't be resumed until the rollback is finished
+        for resume in (lambda: client.create_list("rollback", numbers=numbers, job_id="job-3"),
+                       lambda: client.create_message_campaign_with_list(
+                           numbers, "rollback", "content", "sender", job_id="job-3")):
+            with pytest.raises(ValueError):
+                resume()
+        assert server.state.lists == {}
+
+        # what the first run deleted answers 404 now and counts as deleted
+        second = client.rollback_job("job-3")
+        assert second.complete and not second.errors
+        assert server.state.contacts == {} and server.state.lists == {}
+        assert journal.jobs() == []
+
+        client.create_list("rollback", numbers=numbers, job_id="job-3")
+    assert len(server.state.lists) == 1
+
+
+def test_job_id_requires_a_journal(client):
+    with pytest.raises(ValueError):
+        client.create_list("audience", numbers=["+919876543210"], job_id="job")
@@ -0,0 +1,37 @@
+import pytest
+
+from exotelpy import Exotel, Metrics, NotFound, RetryPolicy
+
+
+def test_requests_are_recorded_per_endpoint_template(server):
+    metrics = Metrics()
+    policy = RetryPolicy(backoff_base=0, jitter=False)
+    with Exotel("test", "key", "token", baseurl=server.url,
+                metrics=metrics, retry_policy=policy) as client:
+        list_id = client.create_list("audience", numbers=["+919876543210"])["response"][0]["data"]["list_id"]
+        server.state.fail_next(503)
+        client.get_list_details(list_id)
+        with pytest.raises(NotFound):
+            client.get_list_details("missing")
+
+    endpoints = metrics.snapshot()["endpoints"]
+    details = endpoints["GET lists/{list_id}"]
+    assert details["count"] == 3
+    assert details["retries"] == 1
+    assert details["statuses"] == {"503": 1, "200": 1, "404": 1}
+    assert endpoints["POST lists/{list_id}/contacts"]["request_bytes"] > 0
+    assert endpoints["POST contacts"]["response_bytes"] > 0
+
+
+def test_prometheus_export():
+    metrics = Metrics(buckets=(0.1, 1))
+    metrics.record("GET", "lists/abc", 200, 0.05, 0, 10)
+    metrics.record("GET", "lists/def", 200, 0.5, 0, 10)
+    metrics.set_gauge("batch_size", 5000, "contacts")
+    text = metrics.to_prometheus()
+
+    assert 'exotel_requests_total{method="GET",endpoint="lists/{list_id}",status="200"} 2' in text
+    assert 'exotel_request_duration_seconds_bucket{method="GET",endpoint="lists/{list_id}",le="0.1"} 1' in text
+    assert 'exotel_request_duration_seconds_bucket{method="GET",endpoint="lists/{list_id}",le="+Inf"} 2' in text
+    assert 'exotel_response_bytes_total{method="GET",endpoint="lists/{list_id}"} 20' in text
+    assert 'exotel_batch_size{endpoint="contacts"} 5000' in text
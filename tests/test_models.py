@@ -0,0 +1,41 @@
+import copy
+import pickle
+from unittest import mock
+
+import requests
+
+from exotelpy.models import Contact
+
+
+def test_response_body_is_decoded_once(client):
+    with mock.patch.object(requests.Response, "json", autospec=True,
+                           side_effect=requests.Response.json) as decode:
+        client.get_all_exophones()
+    assert decode.call_count == 1
+
+
+def test_typed_iteration_yields_lazy_records(client):
+    numbers = ["+919876543210", "+919876543211"]
+    list_id = client.create_list("audience", numbers=numbers)["response"][0]["data"]["list_id"]
+    records = list(client.iter_list_contacts(list_id, typed=True))
+
+    assert all(isinstance(r, Contact) for r in records)
+    assert [r.number for r in records] == numbers
+    assert records[0].email is None
+
+
+def test_from_response_unwraps_envelope():
+    contact = Contact.from_response({"response": {
+        "code": 200, "status": "success",
+        "data": {"sid": "c1", "date_created": "2024-01-01T10:00:00Z"}}})
+    assert contact.sid == "c1"
+    assert contact.date_created.year == 2024
+    assert contact.to_dict()["sid"] == "c1"
+
+
+def test_records_can_be_copied_and_pickled():
+    contact = Contact({"sid": "c1", "number": "+919876543210", "date_created": "2024-01-01T10:00:00Z"})
+    assert contact.date_created.year == 2024
+    for clone in (copy.copy(contact), copy.deepcopy(contact), pickle.loads(pickle.dumps(contact))):
+        assert clone == contact
+        assert clone.date_created == contact.date_created
@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from exotelpy import AsyncExotel
+from exotelpy.pagination import iter_records_parallel, record_key
+
+NUMBERS = ["+91987{n:07d}".format(n=n) for n in range(250)]
+
+
+def test_iter_list_contacts_yields_every_record_in_order(client):
+    list_id = client.create_list("audience", numbers=NUMBERS)["response"][0]["data"]["list_id"]
+    for prefetch in (True, False):
+        records = list(client.iter_list_contacts(list_id, limit=100, prefetch=prefetch))
+        assert [r["number"] for r in records] == NUMBERS
+
+
+def test_iter_stops_fetching_when_abandoned(client, server):
+    list_id = client.create_list("audience", numbers=NUMBERS)["response"][0]["data"]["list_id"]
+    before = server.state.requests
+    records = client.iter_list_contacts(list_id, limit=10)
+    assert next(records)["number"] == NUMBERS[0]
+    records.close()
+    assert server.state.requests - before <= 2
+
+
+def test_async_iter_list_contacts(server):
+    pytest.importorskip("httpx")
+
+    async def main():
+        async with AsyncExotel("test", "key", "token", baseurl=server.url) as client:
+            data = await client.create_list("audience", numbers=NUMBERS)
+            list_id = data["response"][0]["data"]["list_id"]
+            return [r["number"] async for r in client.iter_list_contacts(list_id, limit=100)]
+
+    assert asyncio.run(main()) == NUMBERS
+
+
+def test_parallel_call_details_are_complete_and_ordered(client):
+    list_id = client.create_list("audience", numbers=NUMBERS)["response"][0]["data"]["list_id"]
+    campaign = client.create_campaign("+918000000001", "app", lists=[list_id])
+    campaign_id = campaign["response"][0]["data"]["id"]
+
+    records = list(client.iter_campaign_call_details(campaign_id, limit=30, max_workers=4))
+    assert [r["number"] for r in records] == NUMBERS
+
+
+@pytest.mark.parametrize("field", ["sid", "sms_sid"])
+def test_parallel_fetch_drops_rows_shifted_between_pages(field):
+    rows = [{field: str(n)} for n in range(10)]
+
+    def fetch(offset, limit):
+        # a row inserted at the top after the first page pushes rows down by one
+        source = rows if offset == 0 else [{field: "new"}] + rows
+        return {"metadata": {"total": len(rows)},
+                "response": [{"data": r} for r in source[offset:offset + limit]]}
+
+    records = list(iter_records_parallel(fetch, limit=4, max_workers=2))
+    assert [record_key(r) for r in records] == [str(n) for n in range(10)]
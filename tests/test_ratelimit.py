@@ -0,0 +1,62 @@
+import time
+
+from exotelpy import Exotel, RateLimiter, RetryPolicy, TokenBucket
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_bucket_spaces_requests_after_burst():
+    clock = Clock()
+    bucket = TokenBucket(rate=2, capacity=2, clock=clock)
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+    clock.now = 2.0
+    assert bucket.reserve() == 0.0
+
+
+def test_bucket_slows_down_on_throttle_and_recovers():
+    clock = Clock()
+    bucket = TokenBucket(rate=10, decrease=0.5, recovery=0.1, clock=clock)
+    bucket.throttled()
+    assert bucket.rate == 5
+    clock.now = 2.0
+    bucket.reserve()
+    assert bucket.rate == 7
+    clock.now = 100.0
+    bucket.reserve()
+    assert bucket.rate == 10
+
+
+def test_limiter_combines_version_and_endpoint_buckets():
+    limiter = RateLimiter(version_rates={"v1": 100}, endpoint_rates={"Sms": 1})
+    assert len(limiter.buckets("v1", "Sms/send.json")) == 2
+    assert len(limiter.buckets("v1", "SMS/Messages/abc.json")) == 2
+    assert limiter.buckets("v2", "contacts") == []
+    assert limiter.reserve("v1", "Sms/send.json") == 0.0
+    assert limiter.reserve("v1", "Sms/send.json") > 0.0
+    limiter.feedback("v1", "Sms/send.json", 429)
+    assert limiter.versions["v1"].rate == 50
+
+
+def test_client_backs_off_after_429_and_recovers(server):
+    limiter = RateLimiter(endpoint_rates={"contacts": 20}, recovery=2.0)
+    bucket = limiter.endpoints["contacts"]
+    policy = RetryPolicy(backoff_base=0, jitter=False)
+    with Exotel("test", "key", "token", baseurl=server.url,
+                rate_limiter=limiter, retry_policy=policy) as client:
+        server.state.fail_next(429)
+        started = time.monotonic()
+        client.create_contacts(["+919876543210"])
+        # the retry waited for the halved bucket instead of going out at once
+        assert time.monotonic() - started >= 0.04
+        assert bucket.rate < 20
+
+        time.sleep(0.3)
+        client.create_contacts(["+919876543211"])
+        assert bucket.rate == 20
+    assert server.state.requests == 3
@@ -0,0 +1,53 @@
+from unittest import mock
+
+import pytest
+
+from exotelpy import AdaptiveBatchSizer, Exotel, ServerError
+
+NUMBERS = ["+91982{n:07d}".format(n=n) for n in range(50)]
+
+
+def test_any_failure_rolls_back_concurrently(client, server):
+    with mock.patch.object(client, "create_message_campaign", side_effect=RuntimeError("boom")):
+        with pytest.raises(RuntimeError) as exc_info:
+            client.create_message_campaign_with_list(NUMBERS, "audience", "content", "sender")
+
+    handle = exc_info.value.rollback
+    assert handle.complete
+    assert handle.progress()["deleted"] == 50
+    assert server.state.contacts == {} and server.state.lists == {}
+
+
+def test_failed_upload_rolls_back_created_contacts(server):
+    sizer = AdaptiveBatchSizer(initial=20, min_size=20, max_size=20)
+    with Exotel("test", "key", "token", baseurl=server.url, batch_sizer=sizer) as client:
+        attach = client.add_contacts_to_list
+        calls = []
+
+        def fail_second(sids, list_id):
+            calls.append(list_id)
+            if len(calls) == 2:
+                raise ServerError("boom")
+            return attach(sids, list_id)
+
+        with mock.patch.object(client, "add_contacts_to_list", side_effect=fail_second):
+            with pytest.raises(ServerError) as exc_info:
+                client.create_message_campaign_with_list(NUMBERS, "audience", "content", "sender")
+
+    # the contacts of the batch that failed to attach are reverted too
+    assert exc_info.value.rollback.progress()["deleted"] == 40
+    assert server.state.contacts == {} and server.state.lists == {}
+
+
+def test_background_rollback_within_time_budget(server):
+    with Exotel("test", "key", "token", baseurl=server.url,
+                background_rollback=True, rollback_timeout=0) as client:
+        with mock.patch.object(client, "create_message_campaign", side_effect=RuntimeError("boom")):
+            with pytest.raises(RuntimeError) as exc_info:
+                client.create_message_campaign_with_list(NUMBERS, "audience", "content", "sender")
+
+        handle = exc_info.value.rollback
+        assert handle.wait(5)
+        assert not handle.complete
+        assert len(handle.skipped) == 50
+    assert len(server.state.contacts) == 50
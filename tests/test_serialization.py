@@ -0,0 +1,61 @@
+import asyncio
+import gzip
+import json
+from unittest import mock
+
+import pytest
+
+from exotelpy import Exotel, serialization
+
+
+def test_dumps_falls_back_to_stdlib():
+    payload = {"contacts": [{"number": "+919876543210", "name": "ñ"}]}
+    with mock.patch.object(serialization, "orjson", None):
+        body = serialization.dumps(payload)
+    assert body == json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode()
+    assert json.loads(serialization.dumps(payload)) == payload
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_records_payload_matches_dict_encoding(fast):
+    values = ["+919876543210", 'quote"d', "back\\slash", '","', 'x",', "b", "ñ", 1, None]
+    with mock.patch.object(serialization, "orjson", serialization.orjson if fast else None):
+        body = serialization.RecordsPayload("contacts", "number", values).to_json()
+        empty = serialization.RecordsPayload("contacts", "number", []).to_json()
+    assert json.loads(body) == {"contacts": [{"number": value} for value in values]}
+    assert json.loads(empty) == {"contacts": []}
+
+
+def test_only_bodies_above_threshold_are_gzipped():
+    payload = {"contacts": [{"number": "+91987654{n:04d}".format(n=n)} for n in range(100)]}
+    body, headers = serialization.encode_body(payload, compress_threshold=1024)
+    assert headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(body)) == payload
+
+    body, headers = serialization.encode_body({"name": "audience"}, compress_threshold=1024)
+    assert "Content-Encoding" not in headers
+    assert json.loads(body) == {"name": "audience"}
+
+
+def test_create_list_sends_compressed_batches(server):
+    numbers = ["+91984{n:07d}".format(n=n) for n in range(6000)]
+    with Exotel("test", "key", "token", baseurl=server.url, compress_threshold=4096) as client:
+        data = client.create_list("compressed", numbers=numbers)
+
+    assert data["metadata"]["success"] == 6000
+    # contacts and list attachment of both batches, the list creation stays plain
+    assert server.state.compressed == 4
+
+
+def test_async_create_list_sends_compressed_batches(server):
+    pytest.importorskip("httpx")
+    from exotelpy import AsyncExotel
+
+    async def main():
+        async with AsyncExotel("test", "key", "token", baseurl=server.url,
+                               compress_threshold=4096) as client:
+            return await client.create_list(
+                "compressed", numbers=["+91983{n:07d}".format(n=n) for n in range(1000)])
+
+    assert asyncio.run(main())["metadata"]["success"] == 1000
+    assert server.state.compressed == 2
@@ -0,0 +1,82 @@
+import asyncio
+import time
+
+import pytest
+
+from exotelpy import ServerError, SmsQueue
+from exotelpy.sms import collect_sms_chunks
+
+
+def numbers(count: int, prefix: str = "+91982"):
+    return ["{prefix}{n:07d}".format(prefix=prefix, n=n) for n in range(count)]
+
+
+def test_chunks_are_merged_in_recipient_order(client, server):
+    to = numbers(250)
+    server.state.fail_next(500)
+    result = client.send_bulk_sms_chunked("exo1", to, "hello", chunk_size=100, max_workers=1)
+
+    assert (result.total, result.success, result.failed) == (250, 150, 100)
+    assert [chunk.index for chunk in result.failed_chunks] == [0]
+    assert result.failed_recipients() == to[:100]
+    assert [server.state.sms[sid]["To"] for sid in result.sids()] == to[100:]
+
+    retried = client.send_bulk_sms_chunked("exo1", result.failed_recipients(), "hello")
+    assert retried.success == 100 and not retried.failed_chunks
+
+
+def test_rejected_recipients_are_reported_per_chunk():
+    rejected = {"RestException": {"Status": 400, "Message": "Invalid number"}}
+    results = [
+        [{"SMSMessage": {"Sid": "a", "To": "1"}}, rejected],
+        {"SMSMessage": {"Sid": "c", "To": "3"}},
+    ]
+    result = collect_sms_chunks([["1", "2"], ["3"]], results)
+
+    assert result.sids() == ["a", "c"]
+    assert result.failed_recipients() == ["2"]
+    assert result.failed_chunks[0].error is None
+    assert result.failed_chunks[0].responses == [rejected]
+
+
+def test_async_chunks(server):
+    pytest.importorskip("httpx")
+    from exotelpy import AsyncExotel
+
+    async def main():
+        async with AsyncExotel("test", "key", "token", baseurl=server.url) as client:
+            return await client.send_bulk_sms_chunked("exo1", numbers(30), "hello", chunk_size=7)
+
+    result = asyncio.run(main())
+    assert result.success == 30
+    assert [server.state.sms[sid]["To"] for sid in result.sids()] == numbers(30)
+
+
+def test_queue_coalesces_messages_by_group(client, server):
+    to = numbers(5)
+    with SmsQueue(client, max_batch=3, max_delay=10) as queue:
+        futures = [queue.send("exo1", number, "hello") for number in to]
+        other = queue.send("exo1", to[0], "hello", dlt_template_id="t1")
+        # the full group left right away, the rest waits for its deadline
+        assert futures[0].result(timeout=5)["To"] == to[0]
+        assert queue.pending() == 3
+    assert [future.result()["To"] for future in futures] == to
+    assert other.result()["To"] == to[0]
+    # one full group of 3, the rest of it and the template group on close
+    assert server.state.requests == 3
+
+
+def test_queue_flushes_on_age_and_fails_whole_group(client, server):
+    with SmsQueue(client, max_batch=100, max_delay=0.05) as queue:
+        started = time.monotonic()
+        assert queue.send("exo1", numbers(1)[0], "hello").result(timeout=5)["Status"] == "queued"
+        assert time.monotonic() - started < 2
+
+        server.state.fail_next(500)
+        futures = [queue.send("exo1", number, "hi") for number in numbers(2)]
+        for future in futures:
+            with pytest.raises(ServerError):
+                future.result(timeout=5)
+
+    with pytest.raises(RuntimeError):
+        queue.send("exo1", numbers(1)[0], "hello")
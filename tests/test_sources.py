@@ -0,0 +1,38 @@
+import pytest
+
+from exotelpy import InvalidPhoneNumbers
+from exotelpy.sources import read_numbers
+
+
+def test_read_numbers_from_lines_and_csv(tmp_path):
+    lines = tmp_path / "numbers.txt"
+    lines.write_text("+919876543210\n\n+919876543211\r\n")
+    assert list(read_numbers(str(lines))) == ["+919876543210", "+919876543211"]
+
+    table = tmp_path / "audience.csv"
+    table.write_text("name,phone\nasha,+919876543210\nravi, +919876543211\nnobody,\n")
+    assert list(read_numbers(str(table), column="phone")) == ["+919876543210", "+919876543211"]
+    assert list(read_numbers(str(table), column=1, header=True)) == ["+919876543210", "+919876543211"]
+    with pytest.raises(ValueError):
+        list(read_numbers(str(table), column="mobile"))
+
+    empty = tmp_path / "empty.txt"
+    empty.write_text("")
+    assert list(read_numbers(str(empty))) == []
+
+
+def test_create_list_streams_numbers_from_a_file(client, server, tmp_path):
+    path = tmp_path / "numbers.txt"
+    path.write_text("".join("+91981{n:07d}\n".format(n=n) for n in range(7000)))
+
+    summary = client.create_list("from-file", numbers=read_numbers(str(path)),
+                                 max_workers=2, sink=lambda batch: None)
+    assert summary["batches"] == 2
+    assert summary["metadata"]["success"] == 7000
+
+
+def test_streamed_numbers_are_validated_per_batch(client):
+    numbers = ("+91981{n:07d}".format(n=n) if n != 5003 else "bogus" for n in range(6000))
+    with pytest.raises(InvalidPhoneNumbers) as exc_info:
+        client.create_list("invalid", numbers=numbers)
+    assert exc_info.value.positions == [5003]
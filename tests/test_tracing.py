@@ -0,0 +1,52 @@
+import io
+import json
+
+import pytest
+
+from exotelpy import Exotel, ValidationError
+from exotelpy.tracing import InMemoryExporter, JSONLinesExporter, Tracer
+
+NUMBERS = ["+91987{n:07d}".format(n=n) for n in range(6000)]
+
+
+def test_spans_cover_every_phase_and_nest(server):
+    exporter = InMemoryExporter()
+    with Exotel("test", "key", "token", baseurl=server.url, tracer=Tracer(exporter)) as client:
+        with pytest.raises(ValidationError):
+            client.create_campaign_with_list(
+                NUMBERS[:10], "audience", "+918000000001", "app", status_callback="not a url")
+
+    spans = {span.name: span for span in exporter.spans}
+    root = spans["create_campaign_with_list"]
+    assert root.status == "error" and root.parent_id is None
+    assert spans["create_list"].parent_id == root.span_id
+    assert spans["campaign_creation"].parent_id == root.span_id
+    assert spans["rollback"].parent_id == root.span_id
+
+    assert spans["batch"].attributes == {"batch_index": 0, "batch_size": 10}
+    assert spans["contact_creation"].parent_id == spans["batch"].span_id
+    assert spans["list_attachment"].parent_id == spans["batch"].span_id
+
+
+def test_batch_spans_keep_parent_across_threads(server):
+    exporter = InMemoryExporter()
+    with Exotel("test", "key", "token", baseurl=server.url, tracer=Tracer(exporter)) as client:
+        client.create_list("audience", numbers=NUMBERS, max_workers=2)
+
+    create_list = next(span for span in exporter.spans if span.name == "create_list")
+    batches = [span for span in exporter.spans if span.name == "batch"]
+    assert sorted(b.attributes["batch_index"] for b in batches) == [0, 1]
+    assert all(b.parent_id == create_list.span_id for b in batches)
+
+
+def test_json_lines_exporter():
+    stream = io.StringIO()
+    tracer = Tracer(JSONLinesExporter(stream))
+    with tracer.span("outer", job="export"):
+        with tracer.span("inner"):
+            pass
+
+    inner, outer = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert inner["parent_id"] == outer["span_id"]
+    assert outer["attributes"] == {"job": "export"}
+    assert outer["duration"] >= inner["duration"]
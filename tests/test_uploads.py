@@ -0,0 +1,37 @@
+from exotelpy import AdaptiveBatchSizer, Exotel, Metrics
+
+
+def test_sizer_grows_additively_and_shrinks_multiplicatively():
+    sizer = AdaptiveBatchSizer(initial=1000, min_size=100, max_size=2000, target_latency=1)
+    assert sizer.observe(1000, 0.2) == 1500
+    assert sizer.observe(1500, 0.2) == 2000
+    assert sizer.observe(2000, 0.2) == 2000
+    assert sizer.observe(2000, 3) == 1000
+    assert sizer.observe(1000, 0.2, failed=True) == 500
+    # a short tail batch says nothing about the current size
+    assert sizer.observe(20, 0.01) == 500
+
+    sizer.feedback("lists/abc/contacts", 429)
+    sizer.feedback("contacts", 503)
+    sizer.feedback("campaigns", 503)
+    assert sizer() == 125
+    sizer.feedback("contacts", 500)
+    assert sizer() == 100
+
+
+def test_sizer_caps_estimated_payload():
+    sizer = AdaptiveBatchSizer(initial=1000, max_payload_bytes=10000)
+    assert sizer.observe(1000, 0.1, payload_bytes=40000) == 250
+
+
+def test_create_list_varies_batch_size(server):
+    numbers = ["+91985{n:07d}".format(n=n) for n in range(3000)]
+    metrics = Metrics()
+    sizer = AdaptiveBatchSizer(initial=500, min_size=100, increase=500)
+    with Exotel("test", "key", "token", baseurl=server.url,
+                metrics=metrics, batch_sizer=sizer) as client:
+        batches = list(client.iter_create_list("adaptive", numbers=numbers))
+
+    assert [len(batch.response["response"]) for batch in batches] == [500, 1000, 1500]
+    assert batches[-1].success == 3000
+    assert metrics.snapshot()["gauges"]["upload_batch_size"] == 2000
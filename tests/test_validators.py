@@ -0,0 +1,45 @@
+from unittest import mock
+
+import pytest
+
+from exotelpy import InvalidPhoneNumbers, ValidationError, validators
+from exotelpy.validators import (
+    ValidatedNumbers,
+    normalize_phone_number,
+    validate_phone_numbers,
+)
+
+
+def test_reports_positions_of_invalid_numbers():
+    with pytest.raises(ValidationError) as exc_info:
+        validate_phone_numbers(["+919876543210", "98765", None, "+919876543211"])
+    assert isinstance(exc_info.value, InvalidPhoneNumbers)
+    assert exc_info.value.positions == [1, 2]
+    assert exc_info.value.numbers == ["98765", None]
+
+
+@pytest.mark.parametrize("value", [
+    "+91 98765-43210", "098765 43210", "9876543210", "0091 9876543210", "919876543210"])
+def test_normalizes_national_formats(value):
+    assert normalize_phone_number(value) == "+919876543210"
+
+
+def test_normalized_result_is_validated():
+    numbers = validate_phone_numbers(["(987) 654 3210"], normalize=True)
+    assert numbers == ["+919876543210"]
+    assert isinstance(numbers, ValidatedNumbers)
+    assert isinstance(numbers[:1], ValidatedNumbers)
+    for mutate in (lambda: numbers.append("bogus"), lambda: numbers.extend(["bogus"]),
+                   lambda: numbers.insert(0, "bogus"), lambda: numbers.__setitem__(0, "bogus"),
+                   lambda: numbers.__iadd__(["bogus"])):
+        with pytest.raises(TypeError):
+            mutate()
+    assert numbers == ["+919876543210"]
+
+
+def test_numbers_are_validated_once_per_campaign(client):
+    numbers = ["+91987{n:07d}".format(n=n) for n in range(10)]
+    with mock.patch.object(validators, "find_invalid_numbers",
+                           wraps=validators.find_invalid_numbers) as find:
+        client.create_campaign_with_list(numbers, "audience", "+918000000001", "app")
+    assert find.call_count == 1